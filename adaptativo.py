@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Adaptativo - Código de corrección elegido según la tasa de error observada
+Universidad del Valle de Guatemala - CC3067 Redes
+
+Con metodo_correccion='adaptativo' la capa de enlace no fija el código de
+corrección: trama a trama usa uno de los PERFILES y lo anuncia en una
+cabecera al inicio de la trama:
+
+    [índice del perfil x3 (24 bits)] [trama protegida con ese perfil]
+
+El byte del índice va repetido 3 veces y el receptor lo recupera por
+mayoría bit a bit. Como cada trama dice con qué código se protegió, el
+receptor no necesita estado ni acuerdo previo.
+
+El receptor devuelve un Reporte por trama (perfil, bits, aceptada,
+errores corregidos, bloques no corregibles) y el emisor los guarda en una
+ventana deslizante (SelectorPerfil), de la que estima la tasa de error de
+bit p como la mayor de dos estimaciones:
+    - errores corregidos entre bits recibidos (se queda corta cuando se
+      pierden muchas tramas, que son justo las de más errores)
+    - la p con la que el modelo de cada perfil predice la fracción de
+      tramas descartadas que se observó (solo con detección, f = 1 - (1 -
+      p)^L), por bisección; es la única información sin corrección
+
+Con p estimada, el goodput esperado de cada perfil es
+    bits de la trama / bits transmitidos x P(todas las palabras se corrigen)
+y el emisor cambia al mejor perfil si supera al actual por un margen,
+después de recibir suficientes reportes desde el último cambio
+(histéresis: el perfil nuevo tiene que reunir evidencia antes de volver a
+cambiar).
+"""
+
+from collections import deque, namedtuple
+import math
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import entrelazado
+import reedsolomon
+from bitbuffer import BitBuffer
+from hammingEmisor import calculate_parity_bits, hamming_sender
+from hammingReceptor import hamming_decode
+from metricas import METRICAS
+from registro import obtener_logger
+
+log = obtener_logger('adaptativo')
+
+COPIAS_CABECERA = 3
+BITS_CABECERA = 8 * COPIAS_CABECERA
+
+# Reportes en la ventana, reportes necesarios desde el último cambio y
+# mejora relativa mínima del goodput para cambiar de perfil
+VENTANA = 64
+MINIMO_REPORTES = 16
+MARGEN = 0.05
+
+class HammingTrama:
+    """Un solo código Hamming sobre toda la trama (hammingEmisor): corrige 1 bit"""
+    nombre = 'hamming'
+
+    def codificar(self, trama):
+        return hamming_sender(BitBuffer.convertir(trama))
+
+    def decodificar(self, trama):
+        """(íntegra, datos, errores corregidos), como los demás códigos"""
+        try:
+            resultado = hamming_decode(BitBuffer.convertir(trama))
+        except Exception:
+            return False, None, 0
+        if resultado["status"] == "error":
+            return False, None, 1
+        return True, resultado["message"], int(resultado["corrected"])
+
+HAMMING_TRAMA = HammingTrama()
+
+class Perfil(namedtuple('Perfil', 'nombre correccion simbolos_paridad')):
+    """Código de corrección que se aplica sobre la trama ya protegida"""
+    __slots__ = ()
+
+    @property
+    def codigo(self):
+        """CodigoEntrelazado, ReedSolomon o None (solo detección)"""
+        if self.correccion == 'none':
+            return None
+        if self.correccion == 'hamming':
+            return HAMMING_TRAMA
+        if self.correccion == 'reed-solomon':
+            return reedsolomon.obtener(self.simbolos_paridad)
+        return entrelazado.obtener(self.correccion)
+
+    @property
+    def capacidad(self):
+        """Símbolos erróneos que se corrigen por palabra o bloque"""
+        if self.correccion == 'none':
+            return 0
+        if self.correccion == 'reed-solomon':
+            return self.simbolos_paridad // 2
+        return 1
+
+    def longitud(self, bits):
+        """Bits transmitidos (con cabecera) para una trama protegida de 'bits' bits"""
+        codigo = self.codigo
+        if codigo is None:
+            return BITS_CABECERA + bits
+        if codigo is HAMMING_TRAMA:
+            return BITS_CABECERA + bits + calculate_parity_bits(bits)
+        if self.correccion == 'reed-solomon':
+            # Más el byte de la marca de fin; el último bloque es acortado
+            datos = bits // 8 + 1
+            return BITS_CABECERA + 8 * (datos + -(-datos // codigo.k) * self.simbolos_paridad)
+        return BITS_CABECERA + (bits // codigo.k + 1) * codigo.n
+
+    def probabilidad_exito(self, longitud, tasa_error):
+        """
+        Probabilidad de recuperar una trama de 'longitud' bits transmitidos
+        con errores de bit independientes
+        """
+        codificados = longitud - BITS_CABECERA
+        codigo = self.codigo
+        if codigo is None or codigo is HAMMING_TRAMA:
+            palabras, simbolos, bits_simbolo = 1, codificados, 1
+        elif self.correccion == 'reed-solomon':
+            palabras = -(-codificados // (8 * codigo.n))
+            simbolos, bits_simbolo = -(-codificados // (8 * palabras)), 8
+        else:
+            palabras, simbolos, bits_simbolo = codificados // codigo.n, codigo.n, 1
+        tasa_error = min(tasa_error, 0.5)
+        # Probabilidad de que un símbolo tenga al menos un bit erróneo
+        q = -math.expm1(bits_simbolo * math.log1p(-tasa_error))
+        exito_palabra = sum(math.comb(simbolos, i) * q ** i * (1 - q) ** (simbolos - i)
+                            for i in range(self.capacidad + 1))
+        return exito_palabra ** palabras
+
+# De menor a mayor protección frente a errores dispersos; el índice es lo
+# que viaja en la cabecera
+PERFILES = (
+    Perfil('none', 'none', None),
+    Perfil('hamming', 'hamming', None),
+    Perfil('secded72', 'secded72', None),
+    Perfil('reed-solomon-16', 'reed-solomon', 16),
+    Perfil('reed-solomon-32', 'reed-solomon', 32),
+    Perfil('hamming74', 'hamming74', None),
+)
+
+Reporte = namedtuple('Reporte', 'perfil bits aceptada corregidos no_corregibles')
+
+def con_cabecera(indice, trama):
+    """Antepone la cabecera con el índice del perfil"""
+    return BitBuffer(bytes((indice,)) * COPIAS_CABECERA) + BitBuffer.convertir(trama)
+
+def leer_cabecera(trama):
+    """
+    Returns:
+        tuple: (índice del perfil, trama sin cabecera); (None, None) si la
+        cabecera no nombra un perfil
+    """
+    if len(trama) < BITS_CABECERA:
+        return None, None
+    a, b, c = trama[:BITS_CABECERA].tobytes()
+    indice = (a & b) | (a & c) | (b & c)
+    if indice >= len(PERFILES):
+        return None, None
+    return indice, trama[BITS_CABECERA:]
+
+def codificar(indice, trama):
+    """Aplica a la trama ya protegida el código del perfil y antepone la cabecera"""
+    codigo = PERFILES[indice].codigo
+    if codigo is not None:
+        trama = codigo.codificar(trama)
+    return con_cabecera(indice, trama)
+
+def decodificar(trama, verificar):
+    """
+    Corrige una trama adaptativa con el perfil de su cabecera y la verifica
+
+    Args:
+        trama: BitBuffer o cadena '0'/'1'
+        verificar: Función trama -> (íntegra, datos) del código de detección
+
+    Returns:
+        tuple: (íntegra, datos, Reporte); el Reporte es None si la
+        cabecera es ilegible
+    """
+    trama = BitBuffer.convertir(trama)
+    indice, resto = leer_cabecera(trama)
+    if indice is None:
+        return False, None, None
+    codigo = PERFILES[indice].codigo
+    corregidos = 0
+    if codigo is not None:
+        corregible, resto, corregidos = codigo.decodificar(resto)
+        if not corregible:
+            return False, None, Reporte(indice, len(trama), False, 0, corregidos)
+    integridad_ok, datos = verificar(resto)
+    return integridad_ok, datos, Reporte(indice, len(trama), integridad_ok, corregidos, 0)
+
+def goodput_esperado(perfil, bits, tasa_error):
+    """
+    Bits útiles por bit transmitido si la trama protegida tiene 'bits' bits
+    y los errores de bit son independientes con probabilidad tasa_error
+    """
+    longitud = perfil.longitud(bits)
+    return bits / longitud * perfil.probabilidad_exito(longitud, tasa_error)
+
+def _tasa_por_fallas(perfil, longitud, fallas):
+    """Tasa de error con la que el perfil pierde la fracción 'fallas' de tramas"""
+    # Bisección en escala logarítmica: la probabilidad de éxito decrece con p
+    minima, maxima = -12.0, math.log(0.5)
+    for _ in range(40):
+        media = (minima + maxima) / 2
+        if 1 - perfil.probabilidad_exito(longitud, math.exp(media)) < fallas:
+            minima = media
+        else:
+            maxima = media
+    return math.exp((minima + maxima) / 2)
+
+class SelectorPerfil:
+    """Elige el perfil del emisor a partir de los reportes recientes del receptor"""
+
+    def __init__(self, ventana=VENTANA, minimo=MINIMO_REPORTES, margen=MARGEN, perfil_inicial=0):
+        """
+        Args:
+            ventana: Reportes que se conservan para estimar la tasa de error
+            minimo: Reportes necesarios desde el último cambio de perfil
+            margen: Mejora relativa del goodput esperado para cambiar
+            perfil_inicial: Índice en PERFILES antes de recibir reportes
+        """
+        self.reportes = deque(maxlen=ventana)
+        self.minimo = minimo
+        self.margen = margen
+        self.actual = perfil_inicial
+        self._desde_cambio = 0
+        self._pendiente = False
+
+    def registrar(self, reporte):
+        """Agrega el Reporte de una trama (los None se ignoran)"""
+        if reporte is None:
+            return
+        self.reportes.append(reporte)
+        self._desde_cambio += 1
+        self._pendiente = True
+
+    def tasa_error(self):
+        """Tasa de error de bit estimada con la ventana"""
+        if not self.reportes:
+            return 0.0
+        corregidos = bits = 0
+        # Por perfil: [tramas, fallas, bits]
+        por_perfil = {}
+        for reporte in self.reportes:
+            corregidos += reporte.corregidos
+            bits += reporte.bits
+            conteo = por_perfil.setdefault(reporte.perfil, [0, 0, 0])
+            conteo[0] += 1
+            conteo[1] += not reporte.aceptada
+            conteo[2] += reporte.bits
+        por_fallas = 0.0
+        for indice, (tramas, fallas, bits_perfil) in por_perfil.items():
+            if fallas:
+                # Si fallaron todas, se supone que media trama más habría pasado
+                fraccion = min(fallas / tramas, 1 - 0.5 / tramas)
+                tasa = _tasa_por_fallas(PERFILES[indice], bits_perfil // tramas, fraccion)
+                por_fallas += tasa * tramas
+        return max(corregidos / bits, por_fallas / len(self.reportes))
+
+    def elegir(self, bits):
+        """Índice del perfil para una trama protegida de 'bits' bits"""
+        if self._pendiente and len(self.reportes) >= self.minimo and self._desde_cambio >= self.minimo:
+            self._pendiente = False
+            tasa_error = self.tasa_error()
+            goodputs = [goodput_esperado(perfil, bits, tasa_error) for perfil in PERFILES]
+            mejor = max(range(len(PERFILES)), key=goodputs.__getitem__)
+            if goodputs[mejor] > goodputs[self.actual] * (1 + self.margen):
+                log.info("[ENLACE] Perfil %s -> %s (tasa de error estimada %.2e)",
+                         PERFILES[self.actual].nombre, PERFILES[mejor].nombre, tasa_error)
+                METRICAS.contar('adaptativo_cambios')
+                self.actual = mejor
+                self._desde_cambio = 0
+        return self.actual
+
+    def codificar(self, trama):
+        """Aplica el código del perfil elegido y antepone la cabecera"""
+        trama = BitBuffer.convertir(trama)
+        return codificar(self.elegir(len(trama)), trama)
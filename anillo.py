@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Anillo - Transporte local por memoria compartida
+Universidad del Valle de Guatemala - CC3067 Redes
+
+Cuando emisor y receptor corren en la misma máquina, las tramas pueden
+pasar por un buffer circular en multiprocessing.shared_memory en lugar
+de un socket: un solo productor y un solo consumidor, sin locks.
+
+Distribución del segmento:
+    [cabeza (8)] [capacidad (8)] [cerrado (8)] ... relleno hasta 64 bytes
+    [cola (8)] ... relleno hasta 128 bytes
+    [datos (capacidad bytes, potencia de 2)]
+
+cabeza y cola son contadores de bytes que solo crecen; solo el productor
+escribe cabeza y solo el consumidor escribe cola (cada uno en su propia
+línea de caché). Cada registro es
+    [longitud en bytes (4)] [longitud en bits (4)] [datos] [relleno hasta múltiplo de 8]
+y nunca se parte en el borde del anillo: si no cabe al final, el productor
+escribe un registro de salto (longitud 0xFFFFFFFF) y continúa desde el
+inicio. Así el consumidor siempre obtiene los datos como una sola
+memoryview contigua sobre la memoria compartida.
+
+Los contadores alineados a 8 bytes se escriben con un solo acceso de
+memoria, y el productor publica cabeza después de copiar los datos (en x86
+el orden de las escrituras se conserva; CPython no expone barreras de
+memoria para otras arquitecturas).
+"""
+
+import struct
+import time
+from multiprocessing import parent_process, resource_tracker, shared_memory
+
+CAPACIDAD_ANILLO = 1 << 22
+
+CABECERA_ANILLO = 128
+REGISTRO = struct.Struct('<II')
+SALTO = 0xFFFFFFFF
+
+# Índices de los contadores (enteros de 8 bytes) en la cabecera
+_CABEZA, _CAPACIDAD, _CERRADO, _COLA = 0, 1, 2, 8
+
+# Segmentos creados por este proceso (ya registrados en su resource_tracker)
+_CREADOS = set()
+
+# Consultas activas antes de ceder el procesador, y espera máxima entre consultas
+GIROS = 200
+ESPERA_MAXIMA = 0.0001
+
+def _esperar(condicion, tiempo_espera):
+    """Espera activa breve y luego con pausas crecientes hasta que condicion() sea verdadera"""
+    for _ in range(GIROS):
+        if condicion():
+            return
+    limite = None if tiempo_espera is None else time.monotonic() + tiempo_espera
+    pausa = 0.0
+    while not condicion():
+        if limite is not None and time.monotonic() >= limite:
+            raise TimeoutError("Tiempo de espera agotado en el anillo")
+        time.sleep(pausa)
+        pausa = min(ESPERA_MAXIMA, pausa * 2 or 1e-6)
+
+class _Anillo:
+    """Vistas sobre el segmento compartido comunes a productor y consumidor"""
+
+    def __init__(self, nombre=None, capacidad=CAPACIDAD_ANILLO):
+        if nombre is None:
+            if capacidad < 64 or capacidad & (capacidad - 1):
+                raise ValueError("La capacidad del anillo debe ser una potencia de 2 (mínimo 64)")
+            self._memoria = shared_memory.SharedMemory(create=True, size=CABECERA_ANILLO + capacidad)
+            self._propietario = True
+            _CREADOS.add(self._memoria.name)
+        else:
+            self._memoria = shared_memory.SharedMemory(nombre)
+            self._propietario = False
+            # Solo quien crea el segmento lo elimina: un programa independiente
+            # tiene su propio resource_tracker, que lo eliminaría al salir (los
+            # procesos de multiprocessing comparten el del proceso principal)
+            if parent_process() is None and self._memoria.name not in _CREADOS:
+                resource_tracker.unregister(self._memoria._name, 'shared_memory')
+        self._contadores = self._memoria.buf[:CABECERA_ANILLO].cast('Q')
+        if self._propietario:
+            self._contadores[_CAPACIDAD] = capacidad
+        self.capacidad = self._contadores[_CAPACIDAD]
+        self._mascara = self.capacidad - 1
+        self._datos = self._memoria.buf[CABECERA_ANILLO:CABECERA_ANILLO + self.capacidad]
+
+    @property
+    def nombre(self):
+        """Nombre del segmento, para conectarse desde otro proceso"""
+        return self._memoria.name
+
+    def _liberar_vistas(self):
+        self._contadores.release()
+        self._datos.release()
+
+    def cerrar(self):
+        """Desconecta este extremo; el creador además elimina el segmento"""
+        self._liberar_vistas()
+        self._memoria.close()
+        if self._propietario:
+            self._memoria.unlink()
+            _CREADOS.discard(self._memoria.name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+class ProductorAnillo(_Anillo):
+    """
+    Extremo que escribe tramas; sin nombre crea el segmento
+
+        with ProductorAnillo() as anillo:
+            lanzar_consumidor(anillo.nombre)
+            anillo.escribir(trama.vista(), len(trama))
+            anillo.terminar()
+    """
+
+    def __init__(self, nombre=None, capacidad=CAPACIDAD_ANILLO):
+        super().__init__(nombre, capacidad)
+        self._cabeza = self._contadores[_CABEZA]
+        # Copia local de cola: solo se relee cuando el anillo parece lleno
+        self._cola = self._contadores[_COLA]
+
+    def _espacio(self, necesario):
+        if self._cabeza + necesario - self._cola <= self.capacidad:
+            return True
+        self._cola = self._contadores[_COLA]
+        return self._cabeza + necesario - self._cola <= self.capacidad
+
+    def escribir(self, datos, longitud_bits=None, tiempo_espera=None):
+        """
+        Copia una trama al anillo y la publica; espera si está lleno
+        Args:
+            datos: Objeto bytes-like con la trama empaquetada
+            longitud_bits: Bits válidos (por defecto, todos los de datos)
+            tiempo_espera: Segundos máximos de espera (None = sin límite)
+        """
+        n = len(datos)
+        if longitud_bits is None:
+            longitud_bits = n * 8
+        tamano = REGISTRO.size + (-(-n // 8) * 8)
+        if tamano > self.capacidad:
+            raise ValueError(f"La trama ({n} bytes) no cabe en el anillo ({self.capacidad} bytes)")
+        inicio = self._cabeza & self._mascara
+        hasta_el_final = self.capacidad - inicio
+        necesario = tamano if tamano <= hasta_el_final else hasta_el_final + tamano
+        if not self._espacio(necesario):
+            _esperar(lambda: self._espacio(necesario), tiempo_espera)
+        if tamano > hasta_el_final:
+            REGISTRO.pack_into(self._datos, inicio, SALTO, 0)
+            self._cabeza += hasta_el_final
+            inicio = 0
+        REGISTRO.pack_into(self._datos, inicio, n, longitud_bits)
+        self._datos[inicio + REGISTRO.size:inicio + REGISTRO.size + n] = datos
+        self._cabeza += tamano
+        # Publicar: a partir de aquí el consumidor puede leer el registro
+        self._contadores[_CABEZA] = self._cabeza
+
+    def terminar(self):
+        """Indica al consumidor que no habrá más tramas"""
+        self._contadores[_CERRADO] = 1
+
+class ConsumidorAnillo(_Anillo):
+    """
+    Extremo que lee tramas en el lugar (sin copiarlas)
+
+        with ConsumidorAnillo(nombre) as anillo:
+            for vista, longitud_bits in anillo:
+                procesar(vista)
+    """
+
+    def __init__(self, nombre):
+        super().__init__(nombre)
+        self._cola = self._contadores[_COLA]
+        self._cabeza = self._contadores[_CABEZA]
+        self._pendiente = 0
+        self._vista = None
+
+    def _disponible(self):
+        if self._cabeza != self._cola:
+            return True
+        self._cabeza = self._contadores[_CABEZA]
+        return self._cabeza != self._cola or bool(self._contadores[_CERRADO])
+
+    def _confirmar(self):
+        """Libera la trama anterior: el productor puede reutilizar su espacio"""
+        if self._vista is not None:
+            self._vista.release()
+            self._vista = None
+        if self._pendiente:
+            self._cola += self._pendiente
+            self._pendiente = 0
+            self._contadores[_COLA] = self._cola
+
+    def leer(self, tiempo_espera=None):
+        """
+        Siguiente trama del anillo
+        Returns:
+            tuple: (memoryview de solo lectura con los bytes, longitud en
+            bits), o None si el productor terminó y no quedan tramas. La
+            vista apunta a la memoria compartida y deja de ser válida en la
+            siguiente lectura: copiarla (bytes(vista)) si se necesita conservarla.
+        """
+        self._confirmar()
+        while True:
+            if not self._disponible():
+                _esperar(self._disponible, tiempo_espera)
+            if self._cabeza == self._cola:
+                # Cerrado: releer cabeza por si publicó justo antes de cerrar
+                self._cabeza = self._contadores[_CABEZA]
+                if self._cabeza == self._cola:
+                    return None
+            inicio = self._cola & self._mascara
+            n, longitud_bits = REGISTRO.unpack_from(self._datos, inicio)
+            if n == SALTO:
+                self._cola += self.capacidad - inicio
+                self._contadores[_COLA] = self._cola
+                continue
+            self._pendiente = REGISTRO.size + (-(-n // 8) * 8)
+            self._vista = self._datos[inicio + REGISTRO.size:inicio + REGISTRO.size + n].toreadonly()
+            return self._vista, longitud_bits
+
+    def __iter__(self):
+        while True:
+            trama = self.leer()
+            if trama is None:
+                return
+            yield trama
+
+    def cerrar(self):
+        self._confirmar()
+        super().cerrar()
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Archivos - Transmisión de archivos grandes con mmap
+Universidad del Valle de Guatemala - CC3067 Redes
+
+El emisor mapea el archivo en memoria y recorre segmentos como memoryview
+sobre el mapa (sin leerlo a bytes de Python); cada trama se arma con una
+sola copia de su segmento. El receptor preasigna el archivo de salida,
+lo mapea y escribe cada segmento verificado directamente en su posición,
+por lo que las tramas pueden llegar en cualquier orden sin reensamblarlas
+en memoria.
+
+Las páginas ya enviadas o escritas se devuelven al sistema operativo cada
+VENTANA_LIBERAR bytes (madvise MADV_DONTNEED), así la memoria residente
+se mantiene constante sin importar el tamaño del archivo.
+
+Antes de los datos se envía una trama descriptora:
+    [0xFFFFFFFF (32 bits)] [BANDERA_DESCRIPTOR (8 bits)] [tamaño total (64 bits)] [tamaño de segmento (32 bits)]
+Los datos usan las tramas de segmentacion.py: [secuencia] [banderas] [datos]
+
+El emisor reenvía los segmentos que el receptor descarta (hasta
+REINTENTOS_ARCHIVO veces) y el receptor se rinde si pasan
+TIEMPO_ESPERA_ARCHIVO segundos sin tramas, indicando los segmentos que faltan.
+"""
+
+import mmap
+import os
+import resource
+import struct
+import sys
+import weakref
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from bitbuffer import BitBuffer
+from segmentacion import CABECERA_SEGMENTO, Segmento, enmarcar, segmentar
+
+BANDERA_DESCRIPTOR = 0x02
+SECUENCIA_DESCRIPTOR = 0xFFFFFFFF
+DESCRIPTOR = struct.Struct('!QI')
+
+# Segmentos más grandes que en los mensajes de texto: menos tramas por MB
+TAMANO_SEGMENTO_ARCHIVO = 64 * 1024
+
+VENTANA_LIBERAR = 8 << 20
+
+# Reenvíos de un segmento descartado antes de abandonar la transferencia
+REINTENTOS_ARCHIVO = 3
+# Segundos sin recibir tramas tras los que el receptor abandona
+TIEMPO_ESPERA_ARCHIVO = 30.0
+
+def memoria_maxima_mb():
+    """Pico de memoria residente del proceso en MB"""
+    maximo = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reporta KB; macOS, bytes
+    return maximo / (1 << 20 if sys.platform == 'darwin' else 1 << 10)
+
+def _liberar(mapa, inicio, fin):
+    """Devuelve al sistema las páginas completas de [inicio, fin) del mapa"""
+    if not hasattr(mmap, 'MADV_DONTNEED'):
+        return
+    inicio = -(-inicio // mmap.PAGESIZE) * mmap.PAGESIZE
+    fin = min(fin, len(mapa)) // mmap.PAGESIZE * mmap.PAGESIZE
+    if fin > inicio:
+        mapa.madvise(mmap.MADV_DONTNEED, inicio, fin - inicio)
+
+def rangos(secuencias):
+    """Describe secuencias ordenadas como rangos: [0, 1, 2, 7] -> '0-2, 7'"""
+    tramos = []
+    for secuencia in secuencias:
+        if tramos and secuencia == tramos[-1][1] + 1:
+            tramos[-1][1] = secuencia
+        else:
+            tramos.append([secuencia, secuencia])
+    return ", ".join(f"{a}-{b}" if a != b else f"{a}" for a, b in tramos)
+
+def trama_descriptora(tamano_total, tamano_segmento):
+    """Trama (sin protección) que anuncia el tamaño del archivo"""
+    return BitBuffer(CABECERA_SEGMENTO.pack(SECUENCIA_DESCRIPTOR, BANDERA_DESCRIPTOR) +
+                     DESCRIPTOR.pack(tamano_total, tamano_segmento))
+
+class LectorArchivo:
+    """
+    Archivo de entrada mapeado en memoria
+
+        with LectorArchivo(ruta) as lector:
+            enviar(lector.descriptor())
+            for trama in lector.tramas():
+                enviar(enlace.calcular_integridad(trama))
+    """
+
+    def __init__(self, ruta, tamano_segmento=TAMANO_SEGMENTO_ARCHIVO):
+        self.ruta = ruta
+        self.tamano_segmento = tamano_segmento
+        self._archivo = open(ruta, 'rb')
+        self.tamano = os.fstat(self._archivo.fileno()).st_size
+        # mmap no admite archivos vacíos
+        self._mapa = mmap.mmap(self._archivo.fileno(), 0, access=mmap.ACCESS_READ) if self.tamano else None
+        if self._mapa is not None and hasattr(mmap, 'MADV_SEQUENTIAL'):
+            self._mapa.madvise(mmap.MADV_SEQUENTIAL)
+        # Recorridos de segmentos() sin terminar, que cerrar() corta
+        self._recorridos = weakref.WeakSet()
+
+    def descriptor(self):
+        return trama_descriptora(self.tamano, self.tamano_segmento)
+
+    def segmentos(self):
+        """
+        Segmentos del archivo; sus datos son memoryview sobre el mapa,
+        válidas hasta pedir el siguiente segmento o cerrar el lector
+        """
+        recorrido = self._recorrer()
+        self._recorridos.add(recorrido)
+        return recorrido
+
+    def _recorrer(self):
+        if self._mapa is None:
+            return
+        vista = memoryview(self._mapa)
+        try:
+            liberado = 0
+            for segmento in segmentar(vista, self.tamano_segmento):
+                try:
+                    yield segmento
+                finally:
+                    # Aunque el consumidor conserve el segmento, su vista ya
+                    # no impide cerrar el mapa
+                    segmento.datos.release()
+                fin = (segmento.secuencia + 1) * self.tamano_segmento
+                if fin - liberado >= VENTANA_LIBERAR:
+                    _liberar(self._mapa, liberado, fin)
+                    liberado = fin
+        finally:
+            vista.release()
+
+    def tramas(self):
+        """Tramas sin proteger (cabecera + datos) listas para la capa de enlace"""
+        for segmento in self.segmentos():
+            yield enmarcar(segmento)
+
+    def trama(self, secuencia):
+        """Trama sin proteger de un solo segmento, para reenviarlo"""
+        inicio = secuencia * self.tamano_segmento
+        if self._mapa is None or not 0 <= inicio < self.tamano:
+            raise IndexError(f"El archivo no tiene el segmento {secuencia}")
+        fin = min(inicio + self.tamano_segmento, self.tamano)
+        return enmarcar(Segmento(secuencia, fin == self.tamano, self._mapa[inicio:fin]))
+
+    def cerrar(self):
+        # Un recorrido a medias (el consumidor falló o lo abandonó) conserva
+        # vistas del mapa: mmap.close() lanzaría BufferError
+        for recorrido in list(self._recorridos):
+            recorrido.close()
+        if self._mapa is not None:
+            self._mapa.close()
+        self._archivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+class EscritorArchivo:
+    """
+    Archivo de salida preasignado y mapeado; recibe las tramas ya verificadas
+    por la capa de enlace (en cualquier orden, con duplicados)
+    """
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+        self.tamano = None
+        self.tamano_segmento = None
+        self.total_segmentos = None
+        self.recibidos = 0
+        self.duplicados = 0
+        self._archivo = None
+        self._mapa = None
+        self._vista = None
+        self._presentes = None
+        self._sin_liberar = 0
+
+    @property
+    def completo(self):
+        return self.total_segmentos is not None and self.recibidos == self.total_segmentos
+
+    def _preparar(self, tamano, tamano_segmento):
+        self.tamano = tamano
+        self.tamano_segmento = tamano_segmento
+        self.total_segmentos = -(-tamano // tamano_segmento)
+        self._presentes = bytearray(self.total_segmentos)
+        self._archivo = open(self.ruta, 'w+b')
+        self._archivo.truncate(tamano)
+        if tamano:
+            self._mapa = mmap.mmap(self._archivo.fileno(), tamano)
+            self._vista = memoryview(self._mapa)
+
+    def agregar(self, trama):
+        """
+        Escribe una trama verificada (BitBuffer con cabecera + datos)
+        Returns:
+            bool: True si la trama era válida para este archivo
+        """
+        datos = BitBuffer.convertir(trama).vista()
+        if len(datos) < CABECERA_SEGMENTO.size:
+            return False
+        secuencia, banderas = CABECERA_SEGMENTO.unpack_from(datos)
+        carga = datos[CABECERA_SEGMENTO.size:]
+
+        if banderas & BANDERA_DESCRIPTOR:
+            if self.total_segmentos is not None or len(carga) != DESCRIPTOR.size:
+                return False
+            self._preparar(*DESCRIPTOR.unpack(carga))
+            return True
+
+        if self.total_segmentos is None or secuencia >= self.total_segmentos:
+            return False
+        inicio = secuencia * self.tamano_segmento
+        if inicio + len(carga) > self.tamano:
+            return False
+        if self._presentes[secuencia]:
+            self.duplicados += 1
+            return True
+        self._vista[inicio:inicio + len(carga)] = carga
+        self._presentes[secuencia] = 1
+        self.recibidos += 1
+
+        self._sin_liberar += len(carga)
+        if self._sin_liberar >= VENTANA_LIBERAR:
+            # Las páginas sucias van al archivo antes de soltarlas
+            self._mapa.flush()
+            _liberar(self._mapa, 0, self.tamano)
+            self._sin_liberar = 0
+        return True
+
+    def faltantes(self):
+        """Secuencias todavía no recibidas"""
+        if self._presentes is None:
+            return []
+        return [s for s, presente in enumerate(self._presentes) if not presente]
+
+    def cerrar(self):
+        if self._vista is not None:
+            self._vista.release()
+        if self._mapa is not None:
+            self._mapa.flush()
+            self._mapa.close()
+        if self._archivo is not None:
+            self._archivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
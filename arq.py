@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+ARQ de Ventana Deslizante - Go-Back-N y Selective Repeat
+Universidad del Valle de Guatemala - CC3067 Redes
+
+Simulación por eventos discretos (tiempo simulado, no real) de un enlace
+con ruido en ambos sentidos. Las tramas de datos se arman con segmentacion.py
+y se protegen con emisor.CapaEnlace; el receptor las verifica con
+receptor.procesar_trama y responde con tramas de control ACK/NAK protegidas
+con CRC-32. Las tramas dañadas se retransmiten al recibir un NAK o al
+vencer el temporizador.
+"""
+
+import heapq
+import struct
+import sys
+import os
+from functools import partial
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from bitbuffer import BitBuffer
+from canal import CanalIID, transmitir
+from crc32Emisor import calculate_crc32
+from crc32Receptor import crc32_verificar
+from receptor import procesar_trama
+from segmentacion import TAMANO_SEGMENTO, desenmarcar, enmarcar, segmentar
+from transporte import percentiles
+
+MODO_GO_BACK_N = 'gbn'
+MODO_SELECTIVE_REPEAT = 'sr'
+
+TIPO_ACK = 1
+TIPO_NAK = 2
+
+CABECERA_CONTROL = struct.Struct('!BI')
+
+def trama_control(tipo, secuencia):
+    """Construye una trama ACK/NAK protegida con CRC-32"""
+    datos = CABECERA_CONTROL.pack(tipo, secuencia)
+    return BitBuffer(datos + calculate_crc32(datos).to_bytes(4, 'big'))
+
+def leer_control(trama):
+    """Retorna (tipo, secuencia) o None si la trama de control llegó dañada"""
+    if len(trama) != (CABECERA_CONTROL.size + 4) * 8 or not crc32_verificar(trama):
+        return None
+    return CABECERA_CONTROL.unpack_from(trama.tobytes())
+
+class SimuladorARQ:
+    """
+    Enlace emisor-receptor con ARQ de ventana deslizante
+
+    El enlace es full-duplex: cada sentido transmite una trama a la vez a
+    velocidad_bps y agrega retardo segundos de propagación.
+    """
+
+    def __init__(self, enlace_emisor, enlace_receptor, modo=MODO_GO_BACK_N, ventana=8,
+                 tamano_segmento=TAMANO_SEGMENTO, velocidad_bps=1e6, retardo=0.005,
+                 timeout=None, canal=None, canal_retorno=None, tiempo_maximo=3600.0):
+        """
+        Args:
+            enlace_emisor: emisor.CapaEnlace que protege las tramas de datos
+            enlace_receptor: receptor.CapaEnlace con el mismo método
+            modo: MODO_GO_BACK_N o MODO_SELECTIVE_REPEAT
+            ventana: Tramas sin confirmar que puede tener el emisor
+            tamano_segmento: Bytes de datos por trama
+            velocidad_bps: Velocidad de transmisión de cada sentido
+            retardo: Retardo de propagación en segundos
+            timeout: Temporizador de retransmisión (por defecto 2 RTT)
+            canal, canal_retorno: Modelos de canal.py para cada sentido
+            tiempo_maximo: Límite de tiempo simulado (protege contra canales
+                que no dejan pasar ninguna trama)
+        """
+        if modo not in (MODO_GO_BACK_N, MODO_SELECTIVE_REPEAT):
+            raise ValueError(f"Modo ARQ no soportado: {modo}")
+        if ventana < 1:
+            raise ValueError("La ventana debe ser de al menos 1 trama")
+        self.enlace_emisor = enlace_emisor
+        self.procesar = partial(procesar_trama, enlace_receptor)
+        self.modo = modo
+        self.ventana = ventana
+        self.tamano_segmento = tamano_segmento
+        self.velocidad_bps = velocidad_bps
+        self.retardo = retardo
+        self.canal = canal if canal is not None else CanalIID(0.0)
+        self.canal_retorno = canal_retorno if canal_retorno is not None else CanalIID(0.0)
+        self.tiempo_maximo = tiempo_maximo
+        if timeout is None:
+            # Ida y vuelta de una trama completa más la de control, con margen
+            bits_trama = (tamano_segmento + 64) * 8
+            timeout = 2 * (2 * retardo + bits_trama / velocidad_bps)
+        self.timeout = timeout
+
+    def transmitir(self, datos):
+        """
+        Transmite los datos completos y retorna (datos entregados, estadísticas)
+        """
+        return _Sesion(self, datos).correr()
+
+class _Sesion:
+    """Estado de una transmisión simulada"""
+
+    def __init__(self, simulador, datos):
+        self.sim = simulador
+        self.ahora = 0.0
+        self._eventos = []
+        self._contador = 0
+
+        # Emisor
+        self._segmentos = segmentar(datos, simulador.tamano_segmento)
+        self.tramas = {}
+        self.primer_envio = {}
+        self.ultima_secuencia = None
+        self.base = 0
+        self.siguiente = 0
+        self.confirmadas = set()
+        self.generacion_timer = {}
+        self.libre_ida = 0.0
+
+        # Receptor
+        self.esperada = 0
+        self.buffer_receptor = {}
+        self.nak_enviado = None
+        self.libre_vuelta = 0.0
+        self.entregado = []
+
+        self.stats = {
+            "tramas_enviadas": 0,
+            "retransmisiones": 0,
+            "bits_transmitidos": 0,
+            "bits_control": 0,
+            "acks": 0,
+            "naks": 0,
+            "descartadas_receptor": 0,
+            "control_perdidas": 0,
+            "timeouts": 0,
+        }
+        self.latencias = []
+
+    # --- Eventos ---
+
+    def _programar(self, tiempo, accion, *args):
+        self._contador += 1
+        heapq.heappush(self._eventos, (tiempo, self._contador, accion, args))
+
+    def correr(self):
+        self._llenar_ventana()
+        while self._eventos and not self._terminado():
+            self.ahora, _, accion, args = heapq.heappop(self._eventos)
+            if self.ahora > self.sim.tiempo_maximo:
+                raise RuntimeError("Se alcanzó el tiempo máximo de simulación sin completar la transmisión")
+            accion(*args)
+        return b''.join(self.entregado), self._resumen()
+
+    def _terminado(self):
+        return self.ultima_secuencia is not None and self.base > self.ultima_secuencia
+
+    # --- Emisor ---
+
+    def _obtener_trama(self, secuencia):
+        """Protege los segmentos a medida que entran en la ventana"""
+        while secuencia not in self.tramas:
+            segmento = next(self._segmentos)
+            self.tramas[segmento.secuencia] = (
+                self.sim.enlace_emisor.calcular_integridad(enmarcar(segmento)), len(segmento.datos))
+            if segmento.ultimo:
+                self.ultima_secuencia = segmento.secuencia
+        return self.tramas[secuencia][0]
+
+    def _llenar_ventana(self):
+        while self.siguiente < self.base + self.sim.ventana and \
+                (self.ultima_secuencia is None or self.siguiente <= self.ultima_secuencia):
+            self._enviar_datos(self.siguiente)
+            self.siguiente += 1
+
+    def _enviar_datos(self, secuencia):
+        trama = self._obtener_trama(secuencia)
+        inicio = max(self.ahora, self.libre_ida)
+        fin = inicio + len(trama) / self.sim.velocidad_bps
+        self.libre_ida = fin
+
+        self.stats["tramas_enviadas"] += 1
+        self.stats["bits_transmitidos"] += len(trama)
+        if secuencia in self.primer_envio:
+            self.stats["retransmisiones"] += 1
+        else:
+            self.primer_envio[secuencia] = inicio
+
+        recibida, _ = transmitir(trama, self.sim.canal)
+        self._programar(fin + self.sim.retardo, self._llega_datos, recibida)
+
+        # Go-Back-N usa un solo temporizador para la base; Selective Repeat uno por trama
+        clave = 0 if self.sim.modo == MODO_GO_BACK_N else secuencia
+        if self.sim.modo == MODO_SELECTIVE_REPEAT or secuencia == self.base:
+            self._iniciar_timer(clave, fin)
+
+    def _iniciar_timer(self, clave, desde):
+        generacion = self.generacion_timer.get(clave, 0) + 1
+        self.generacion_timer[clave] = generacion
+        self._programar(desde + self.sim.timeout, self._vence_timer, clave, generacion)
+
+    def _detener_timer(self, clave):
+        self.generacion_timer[clave] = self.generacion_timer.get(clave, 0) + 1
+
+    def _vence_timer(self, clave, generacion):
+        if self.generacion_timer.get(clave) != generacion or self._terminado():
+            return
+        self.stats["timeouts"] += 1
+        if self.sim.modo == MODO_GO_BACK_N:
+            self._retroceder(self.base)
+        elif clave not in self.confirmadas:
+            self._enviar_datos(clave)
+
+    def _retroceder(self, desde):
+        """Go-Back-N: retransmite toda la ventana a partir de desde"""
+        self._detener_timer(0)
+        self.siguiente = desde
+        self._llenar_ventana()
+
+    def _llega_control(self, trama):
+        control = leer_control(trama)
+        if control is None:
+            self.stats["control_perdidas"] += 1
+            return
+        tipo, secuencia = control
+
+        if self.sim.modo == MODO_GO_BACK_N:
+            # ACK/NAK acumulativos: secuencia es la siguiente trama esperada
+            if secuencia > self.base:
+                self._avanzar_base(secuencia)
+            if tipo == TIPO_NAK and secuencia == self.base and self.base < self.siguiente:
+                self._retroceder(self.base)
+            else:
+                self._llenar_ventana()
+            return
+
+        if tipo == TIPO_ACK:
+            if secuencia >= self.base and secuencia not in self.confirmadas:
+                self.confirmadas.add(secuencia)
+                self._detener_timer(secuencia)
+                while self.base in self.confirmadas:
+                    self.confirmadas.discard(self.base)
+                    self.tramas.pop(self.base, None)
+                    self.base += 1
+                self._llenar_ventana()
+        elif self.base <= secuencia < self.siguiente and secuencia not in self.confirmadas:
+            self._enviar_datos(secuencia)
+
+    def _avanzar_base(self, nueva_base):
+        for secuencia in range(self.base, nueva_base):
+            self.tramas.pop(secuencia, None)
+        self.base = nueva_base
+        if self.base < self.siguiente:
+            self._iniciar_timer(0, self.ahora)
+        else:
+            self._detener_timer(0)
+
+    # --- Receptor ---
+
+    def _enviar_control(self, tipo, secuencia):
+        trama = trama_control(tipo, secuencia)
+        inicio = max(self.ahora, self.libre_vuelta)
+        fin = inicio + len(trama) / self.sim.velocidad_bps
+        self.libre_vuelta = fin
+        self.stats["bits_control"] += len(trama)
+        self.stats["acks" if tipo == TIPO_ACK else "naks"] += 1
+        recibida, _ = transmitir(trama, self.sim.canal_retorno)
+        self._programar(fin + self.sim.retardo, self._llega_control, recibida)
+
+    def _entregar(self, secuencia, datos):
+        self.entregado.append(datos)
+        self.latencias.append(self.ahora - self.primer_envio[secuencia])
+
+    def _llega_datos(self, trama):
+        ok, datos = self.sim.procesar(trama)
+        segmento = None
+        if ok:
+            try:
+                segmento = desenmarcar(datos)
+            except ValueError:
+                segmento = None
+
+        if segmento is None:
+            self.stats["descartadas_receptor"] += 1
+            # Un solo NAK por trama esperada para no saturar el canal de retorno
+            if self.nak_enviado != self.esperada:
+                self.nak_enviado = self.esperada
+                self._enviar_control(TIPO_NAK, self.esperada)
+            return
+
+        if self.sim.modo == MODO_GO_BACK_N:
+            if segmento.secuencia == self.esperada:
+                self._entregar(segmento.secuencia, segmento.datos)
+                self.esperada += 1
+            self._enviar_control(TIPO_ACK, self.esperada)
+            return
+
+        if self.esperada <= segmento.secuencia < self.esperada + self.sim.ventana:
+            self.buffer_receptor.setdefault(segmento.secuencia, segmento.datos)
+            while self.esperada in self.buffer_receptor:
+                self._entregar(self.esperada, self.buffer_receptor.pop(self.esperada))
+                self.esperada += 1
+        self._enviar_control(TIPO_ACK, segmento.secuencia)
+
+    def _resumen(self):
+        bytes_entregados = sum(len(d) for d in self.entregado)
+        tiempo = self.ahora if self.ahora > 0 else float('nan')
+        bits_totales = self.stats["bits_transmitidos"]
+        p = percentiles(self.latencias)
+        return {
+            "modo": self.sim.modo,
+            "ventana": self.sim.ventana,
+            "tiempo_s": self.ahora,
+            "bytes_entregados": bytes_entregados,
+            "goodput_bps": bytes_entregados * 8 / tiempo,
+            "eficiencia": bytes_entregados * 8 / bits_totales if bits_totales else 0.0,
+            **self.stats,
+            "latencia_ms": {f"p{k}": (v * 1000 if v is not None else None) for k, v in p.items()},
+        }
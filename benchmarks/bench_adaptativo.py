@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark Adaptativo - Goodput del modo adaptativo frente a códigos fijos
+Universidad del Valle de Guatemala - CC3067 Redes
+
+Cada trama pasa por un canal IID y el receptor devuelve su Reporte al
+emisor antes de la siguiente (canal de retorno ideal). Goodput = bits de
+datos entregados correctamente / bits enviados por el canal, como en
+bench_entrelazado.py.
+
+1. Tasa de error fija: goodput de cada configuración por tasa.
+2. Canal que cambia de tasa cada cierto número de tramas: goodput por
+   etapa y total, y perfil que usó el modo adaptativo al final de cada
+   etapa.
+
+Uso: python benchmarks/bench_adaptativo.py [tramas_por_tasa] [bytes_por_trama]
+"""
+
+import os
+import random
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import emisor
+import receptor
+from adaptativo import PERFILES
+from bitbuffer import BitBuffer
+from canal import CanalIID, transmitir
+from registro import configurar
+
+CONFIGURACIONES = (
+    ("hamming (1 código)", 'hamming', 'hamming', None),
+    ("crc32", 'crc32', 'none', None),
+    ("crc32 + secded72", 'crc32', 'secded72', None),
+    ("crc32 + RS(16)", 'crc32', 'reed-solomon', 16),
+    ("crc32 + RS(32)", 'crc32', 'reed-solomon', 32),
+    ("crc32 + hamming74", 'crc32', 'hamming74', None),
+    ("crc32 adaptativo", 'crc32', 'adaptativo', None),
+)
+TASAS_ERROR = (0.0, 1e-5, 1e-4, 1e-3, 3e-3, 1e-2)
+# (tasa de error, fracción de las tramas) de cada etapa del canal variable
+ETAPAS = ((0.0, 1), (1e-4, 1), (3e-3, 1), (1e-5, 1), (1e-2, 1), (1e-3, 1))
+
+class Enlace:
+    """Emisor y receptor de una configuración, con el goodput acumulado"""
+
+    def __init__(self, deteccion, correccion, simbolos_paridad):
+        self.tx = emisor.CapaEnlace(deteccion, correccion, simbolos_paridad)
+        self.rx = receptor.CapaEnlace(deteccion, correccion, simbolos_paridad=simbolos_paridad)
+        self.reiniciar()
+
+    def reiniciar(self):
+        self.enviados = self.utiles = 0
+
+    def enviar(self, mensaje, canal):
+        trama = self.tx.calcular_integridad(mensaje)
+        recibida, _ = transmitir(trama, canal)
+        aceptada, datos, reporte = receptor.procesar_trama_con_reporte(self.rx, recibida)
+        self.tx.registrar_reporte(reporte)
+        self.enviados += len(trama)
+        if aceptada and BitBuffer.convertir(datos) == mensaje:
+            self.utiles += len(mensaje)
+
+    @property
+    def goodput(self):
+        return self.utiles / self.enviados
+
+def tabla(titulo, columnas):
+    print(f"\n{titulo}")
+    print(f"{'Configuración':>20} | " + " | ".join(f"{c:>8}" for c in columnas))
+
+def main():
+    tramas = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    tamano = int(sys.argv[2]) if len(sys.argv) > 2 else 256
+    configurar(silencioso=True)
+    rng = random.Random(7)
+    mensajes = [BitBuffer(rng.randbytes(tamano)) for _ in range(tramas)]
+    print(f"=== BENCHMARK ADAPTATIVO ({tramas} tramas de {tamano} bytes por tasa/etapa) ===")
+
+    tabla("Goodput con tasa de error fija", [f"{t:g}" for t in TASAS_ERROR])
+    for nombre, deteccion, correccion, simbolos in CONFIGURACIONES:
+        fila = []
+        for i, tasa in enumerate(TASAS_ERROR):
+            enlace = Enlace(deteccion, correccion, simbolos)
+            canal = CanalIID(tasa, semilla=i)
+            for mensaje in mensajes:
+                enlace.enviar(mensaje, canal)
+            fila.append(enlace.goodput)
+        print(f"{nombre:>20} | " + " | ".join(f"{g:>8.3f}" for g in fila))
+
+    tabla("Goodput con canal variable (tasa por etapa)", [f"{t:g}" for t, _ in ETAPAS] + ["total"])
+    perfiles = []
+    for nombre, deteccion, correccion, simbolos in CONFIGURACIONES:
+        enlace = Enlace(deteccion, correccion, simbolos)
+        fila = []
+        utiles = enviados = 0
+        for i, (tasa, fraccion) in enumerate(ETAPAS):
+            canal = CanalIID(tasa, semilla=100 + i)
+            for mensaje in mensajes[:int(tramas * fraccion)]:
+                enlace.enviar(mensaje, canal)
+            fila.append(enlace.goodput)
+            utiles += enlace.utiles
+            enviados += enlace.enviados
+            enlace.reiniciar()
+            if enlace.tx.selector is not None:
+                perfiles.append(PERFILES[enlace.tx.selector.actual].nombre)
+        print(f"{nombre:>20} | " + " | ".join(f"{g:>8.3f}" for g in fila) + f" | {utiles / enviados:>8.3f}")
+    print(f"\nPerfil adaptativo al final de cada etapa: {', '.join(perfiles)}")
+
+if __name__ == "__main__":
+    main()
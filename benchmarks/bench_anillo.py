@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Benchmark Anillo - Memoria compartida vs pipe vs socket entre dos procesos locales
+Universidad del Valle de Guatemala - CC3067 Redes
+
+El proceso principal protege las tramas con emisor.CapaEnlace y un proceso
+hijo las verifica con receptor.CapaEnlace:
+    anillo: ProductorAnillo -> leer_de_anillo (verificación en el lugar)
+    pipe:   multiprocessing.Pipe (send_bytes / recv_bytes_into)
+    socket: socket.socketpair con [longitud en bytes (4)] [longitud en bits (4)] [datos]
+En pipe y socket el receptor copia cada trama a un buffer y la verifica
+con verificar_vista, igual que el anillo.
+
+Tramas/s: envío continuo de tramas ya protegidas (mide el transporte y
+la verificación). Latencia: tramas espaciadas que llevan el instante de
+envío (time.perf_counter, reloj monotónico del sistema en Linux) en sus
+primeros 8 bytes; el receptor mide al terminar de verificarlas.
+
+Uso: python benchmarks/bench_anillo.py [tramas] [bytes,bytes,...] [metodo]
+"""
+
+import multiprocessing
+import os
+import socket
+import struct
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import emisor
+import receptor
+from anillo import ConsumidorAnillo, ProductorAnillo
+from bitbuffer import BitBuffer
+from registro import configurar
+from transporte import percentiles
+
+REGISTRO = struct.Struct('<II')
+INSTANTE = struct.Struct('<d')
+TRAMAS_LATENCIA = 2000
+PAUSA_LATENCIA = 0.0002
+TRANSPORTES = ('anillo', 'pipe', 'socket')
+
+class _Lector:
+    """Recibe tramas de un pipe o socket en un buffer reutilizable"""
+
+    def __init__(self, transporte, extremo, tamano_maximo):
+        self.buffer = bytearray(tamano_maximo)
+        self.vista = memoryview(self.buffer)
+        if transporte == 'pipe':
+            self._conexion = extremo
+        else:
+            self._archivo = extremo.makefile('rb')
+        self.transporte = transporte
+
+    def __iter__(self):
+        if self.transporte == 'pipe':
+            while True:
+                n = self._conexion.recv_bytes_into(self.buffer)
+                if n == 0:
+                    return
+                yield self.vista[:n], n * 8
+        cabecera = bytearray(REGISTRO.size)
+        while self._archivo.readinto(cabecera) == REGISTRO.size:
+            n, longitud_bits = REGISTRO.unpack(cabecera)
+            if n == 0:
+                return
+            self._archivo.readinto(self.vista[:n])
+            yield self.vista[:n], longitud_bits
+
+def consumidor(transporte, extremo, metodo, tamano_maximo, latencia, resultados):
+    """Se ejecuta en el proceso hijo"""
+    configurar(silencioso=True)
+    enlace = receptor.CapaEnlace(metodo, 'none')
+    tramas = fallas = 0
+    latencias = []
+    if transporte == 'anillo':
+        anillo = ConsumidorAnillo(extremo)
+        verificadas = enlace.leer_de_anillo(anillo)
+    else:
+        verificadas = (enlace.verificar_vista(*t) for t in _Lector(transporte, extremo, tamano_maximo))
+    for integridad_ok, datos, _ in verificadas:
+        tramas += 1
+        if not integridad_ok:
+            fallas += 1
+        elif latencia:
+            latencias.append(time.perf_counter() - INSTANTE.unpack_from(datos)[0])
+    fin = time.perf_counter()
+    if transporte == 'anillo':
+        verificadas.close()
+        anillo.cerrar()
+    resultados.put({"tramas": tramas, "fallas": fallas, "fin": fin, "latencias": latencias})
+
+def medir(transporte, mensajes, metodo, latencia=False):
+    """Envía las tramas por el transporte; retorna (tramas/s, percentiles de latencia en µs)"""
+    tx = emisor.CapaEnlace(metodo, 'none')
+    tamano_maximo = max(len(m.vista()) for m in mensajes) + 64
+    resultados = multiprocessing.Queue()
+    anillo = conexion = None
+    if transporte == 'anillo':
+        anillo = ProductorAnillo()
+        extremo_hijo = anillo.nombre
+    elif transporte == 'pipe':
+        extremo_hijo, conexion = multiprocessing.Pipe(duplex=False)
+    else:
+        conexion, extremo_hijo = socket.socketpair()
+    hijo = multiprocessing.Process(target=consumidor,
+                                   args=(transporte, extremo_hijo, metodo, tamano_maximo, latencia, resultados))
+    hijo.start()
+
+    def enviar(trama):
+        if anillo is not None:
+            anillo.escribir(trama.vista(), len(trama))
+        elif transporte == 'pipe':
+            conexion.send_bytes(trama.vista())
+        else:
+            conexion.sendall(REGISTRO.pack(len(trama.vista()), len(trama)) + trama.vista())
+
+    if latencia:
+        inicio = time.perf_counter()
+        for mensaje in mensajes:
+            mensaje = BitBuffer(INSTANTE.pack(time.perf_counter()) + mensaje.vista()[INSTANTE.size:])
+            enviar(tx.calcular_integridad(mensaje))
+            time.sleep(PAUSA_LATENCIA)
+    else:
+        protegidas = list(tx.calcular_integridad_batch(mensajes))
+        inicio = time.perf_counter()
+        for trama in protegidas:
+            enviar(trama)
+    if anillo is not None:
+        anillo.terminar()
+    elif transporte == 'pipe':
+        conexion.send_bytes(b'')
+    else:
+        conexion.sendall(REGISTRO.pack(0, 0))
+    r = resultados.get()
+    hijo.join()
+    if anillo is not None:
+        anillo.cerrar()
+    else:
+        conexion.close()
+    assert r["tramas"] == len(mensajes) and r["fallas"] == 0
+    p = percentiles(r["latencias"])
+    return len(mensajes) / (r["fin"] - inicio), {k: v * 1e6 if v is not None else None for k, v in p.items()}
+
+def main():
+    tramas = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    tamanos = [int(x) for x in sys.argv[2].split(',')] if len(sys.argv) > 2 else [64, 1024, 16384]
+    metodo = sys.argv[3] if len(sys.argv) > 3 else 'crc32'
+    configurar(silencioso=True)
+    print(f"=== BENCHMARK ANILLO ({tramas} tramas, {metodo}, {os.cpu_count()} núcleos) ===")
+    print(f"{'Bytes':>6} | {'Transporte':>10} | {'tramas/s':>10} | {'MB/s':>7} | "
+          f"{'lat. p50 (µs)':>13} | {'p90':>7} | {'p99':>7}")
+    for tamano in tamanos:
+        mensajes = [BitBuffer(os.urandom(tamano)) for _ in range(tramas)]
+        for transporte in TRANSPORTES:
+            por_segundo, _ = medir(transporte, mensajes, metodo)
+            _, p = medir(transporte, mensajes[:TRAMAS_LATENCIA], metodo, latencia=True)
+            print(f"{tamano:>6} | {transporte:>10} | {por_segundo:>10,.0f} | {por_segundo * tamano / 1e6:>7.1f} | "
+                  f"{p[50]:>13.1f} | {p[90]:>7.1f} | {p[99]:>7.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark Archivos - MB/s y memoria máxima del modo archivo (mmap) según el tamaño
+Universidad del Valle de Guatemala - CC3067 Redes
+
+Cada tamaño se mide en un proceso nuevo (el pico de memoria residente es
+por proceso) recorriendo el flujo completo sin red:
+    LectorArchivo -> enlace del emisor -> enlace del receptor -> EscritorArchivo
+
+Uso: python benchmarks/bench_archivos.py [MB,MB,...] [metodo]
+"""
+
+import filecmp
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import emisor
+import receptor
+from archivos import EscritorArchivo, LectorArchivo, memoria_maxima_mb
+from registro import configurar
+
+def crear_archivo(ruta, mb):
+    with open(ruta, 'wb') as archivo:
+        for _ in range(mb):
+            archivo.write(os.urandom(1 << 20))
+
+def medir(entrada, salida, metodo):
+    """Se ejecuta en el proceso hijo"""
+    configurar(silencioso=True)
+    tx = emisor.CapaEnlace(metodo, 'none')
+    rx = receptor.CapaEnlace(metodo, 'none')
+    inicio = time.perf_counter()
+    with LectorArchivo(entrada) as lector, EscritorArchivo(salida) as escritor:
+        ok, datos = rx.verificar_integridad(tx.calcular_integridad(lector.descriptor()))
+        escritor.agregar(datos)
+        tramas = tx.calcular_integridad_batch(lector.tramas())
+        for ok, datos in rx.verificar_integridad_batch(tramas):
+            if ok:
+                escritor.agregar(datos)
+        completo = escritor.completo
+        tamano = lector.tamano
+    duracion = time.perf_counter() - inicio
+    return {"mb_por_segundo": tamano / 1e6 / duracion, "memoria_maxima_mb": memoria_maxima_mb(),
+            "completo": completo}
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == '--hijo':
+        print(json.dumps(medir(*sys.argv[2:5])))
+        return
+
+    tamanos = [int(x) for x in sys.argv[1].split(',')] if len(sys.argv) > 1 else [16, 64, 256]
+    metodo = sys.argv[2] if len(sys.argv) > 2 else 'crc32'
+    print(f"=== BENCHMARK ARCHIVOS (mmap, {metodo}) ===")
+    print(f"{'Tamaño (MB)':>11} | {'MB/s':>8} | {'Memoria máx. (MB)':>17} | {'Idéntico':>8}")
+    with tempfile.TemporaryDirectory() as directorio:
+        for mb in tamanos:
+            entrada = os.path.join(directorio, 'entrada.bin')
+            salida = os.path.join(directorio, 'salida.bin')
+            crear_archivo(entrada, mb)
+            proceso = subprocess.run([sys.executable, os.path.abspath(__file__), '--hijo', entrada, salida, metodo],
+                                     capture_output=True, text=True, check=True)
+            r = json.loads(proceso.stdout)
+            identico = r["completo"] and filecmp.cmp(entrada, salida, shallow=False)
+            print(f"{mb:>11} | {r['mb_por_segundo']:>8.1f} | {r['memoria_maxima_mb']:>17.1f} | {str(identico):>8}")
+            os.remove(entrada)
+            os.remove(salida)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark Checksums - Velocidad y capacidad de detección de cada código
+Universidad del Valle de Guatemala - CC3067 Redes
+
+Velocidad: MB/s de calcular() sobre bloques de distintos tamaños.
+Detección: fracción de tramas dañadas que el código no detecta en un
+canal muy ruidoso (la cota teórica para un código de k bits es ~2^-k).
+
+Uso: python benchmarks/bench_checksums.py [tramas_deteccion]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import checksums
+from canal import CanalGilbertElliott, CanalIID, aplicar_errores
+
+TAMANOS = (64, 1500, 1 << 20)
+
+def velocidad(codec, datos, minimo=0.2):
+    """MB/s de codec.calcular repitiendo hasta acumular al menos minimo segundos"""
+    repeticiones = 0
+    inicio = time.perf_counter()
+    while True:
+        codec.calcular(datos)
+        repeticiones += 1
+        duracion = time.perf_counter() - inicio
+        if duracion >= minimo:
+            return repeticiones * len(datos) / duracion / 1e6
+
+def no_detectadas(codec, canal, tramas, tamano, rng):
+    """Tramas alteradas cuyo código coincide (errores no detectados)"""
+    byte_codigo = codec.bits // 8
+    alteradas = fallas = 0
+    for _ in range(tramas):
+        datos = rng.randbytes(tamano)
+        trama = datos + codec.calcular(datos).to_bytes(byte_codigo, 'big')
+        posiciones = canal.posiciones_error(len(trama) * 8)
+        if not posiciones:
+            continue
+        alteradas += 1
+        recibida = aplicar_errores(trama, posiciones)
+        valor = int.from_bytes(recibida[-byte_codigo:], 'big')
+        if codec.verificar_bytes(recibida[:-byte_codigo], valor):
+            fallas += 1
+    return fallas, alteradas
+
+def main():
+    tramas = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rng = random.Random(2024)
+    bloques = {t: rng.randbytes(t) for t in TAMANOS}
+    nombres = checksums.disponibles()
+
+    print("=== BENCHMARK CHECKSUMS: velocidad (MB/s) ===")
+    print(f"{'Código':>12} | {'Bits':>4} | " + " | ".join(f"{t:>9} B" for t in TAMANOS))
+    for nombre in nombres:
+        codec = checksums.obtener(nombre)
+        fila = [velocidad(codec, bloques[t]) for t in TAMANOS]
+        print(f"{nombre:>12} | {codec.bits:>4} | " + " | ".join(f"{v:>11.1f}" for v in fila))
+
+    canales = (
+        ("IID BER=2%", lambda i: CanalIID(0.02, semilla=i)),
+        ("ráfagas GE", lambda i: CanalGilbertElliott(0.01, 0.2, 0.0, 0.5, semilla=i)),
+    )
+    print(f"\n=== Detección ({tramas} tramas de 8 bytes; no detectadas / alteradas) ===")
+    print(f"{'Código':>12} | " + " | ".join(f"{n:>22}" for n, _ in canales) + f" | {'cota 2^-k':>9}")
+    for nombre in nombres:
+        codec = checksums.obtener(nombre)
+        celdas = []
+        for i, (_, crear_canal) in enumerate(canales):
+            fallas, alteradas = no_detectadas(codec, crear_canal(i), tramas, 8, random.Random(i))
+            celdas.append(f"{fallas:>6}/{alteradas:<7} ({fallas / max(alteradas, 1):.0e})")
+        print(f"{nombre:>12} | " + " | ".join(f"{c:>22}" for c in celdas) + f" | {2.0 ** -codec.bits:>9.1e}")
+
+if __name__ == "__main__":
+    main()
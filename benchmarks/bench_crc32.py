@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark CRC-32 - Motor con tablas precalculadas vs implementación original
+Universidad del Valle de Guatemala - CC3067 Redes
+
+Uso: python benchmarks/bench_crc32.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crc32Emisor import CRC32, calculate_crc32, crc32_bytes
+
+def _crc32_table_original():
+    """Tabla CRC-32 tal como la construía la versión original (en cada llamada)"""
+    polynomial = 0x04C11DB7
+    table = []
+    for i in range(256):
+        crc = i << 24
+        for j in range(8):
+            if crc & 0x80000000:
+                crc = (crc << 1) ^ polynomial
+            else:
+                crc = crc << 1
+            crc &= 0xFFFFFFFF
+        table.append(crc)
+    return table
+
+def calculate_crc32_original(data_bits):
+    """Implementación original de calculate_crc32 (referencia)"""
+    while len(data_bits) % 8 != 0:
+        data_bits = '0' + data_bits
+    data_bytes = []
+    for i in range(0, len(data_bits), 8):
+        data_bytes.append(int(data_bits[i:i+8], 2))
+    table = _crc32_table_original()
+    crc = 0xFFFFFFFF
+    for byte in data_bytes:
+        tbl_idx = ((crc >> 24) ^ byte) & 0xFF
+        crc = ((crc << 8) ^ table[tbl_idx]) & 0xFFFFFFFF
+    return crc ^ 0xFFFFFFFF
+
+def medir(funcion, *args, repeticiones=5):
+    """Retorna el mejor tiempo (segundos) de varias ejecuciones"""
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion(*args)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+def por_partes(datos, tamano_parte=4096):
+    """Calcula el CRC-32 alimentando el motor incremental por partes"""
+    crc = CRC32()
+    vista = memoryview(datos)
+    for i in range(0, len(vista), tamano_parte):
+        crc.update(vista[i:i + tamano_parte])
+    return crc.intdigest()
+
+def main():
+    rng = random.Random(2024)
+    print("=== BENCHMARK CRC-32 ===")
+    print(f"{'Tamaño':>10} | {'Original':>14} | {'Bits (nuevo)':>14} | {'Bytes':>14} | {'Por partes':>14} | {'Aceleración':>11}")
+
+    for tamano in (64, 1024, 16 * 1024, 256 * 1024, 1024 * 1024):
+        datos = rng.randbytes(tamano)
+        bits = ''.join(format(b, '08b') for b in datos)
+        # Bits sin alinear a byte para ejercitar el padding
+        bits_impar = bits[3:]
+
+        assert calculate_crc32_original(bits) == calculate_crc32(bits) == crc32_bytes(datos) == por_partes(datos)
+        assert calculate_crc32_original(bits_impar) == calculate_crc32(bits_impar)
+
+        t_original = medir(calculate_crc32_original, bits, repeticiones=1 if tamano > 64 * 1024 else 3)
+        t_bits = medir(calculate_crc32, bits)
+        t_bytes = medir(crc32_bytes, datos)
+        t_partes = medir(por_partes, datos)
+
+        mb = tamano / 1e6
+        print(f"{tamano:>10} | {mb / t_original:>9.2f} MB/s | {mb / t_bits:>9.2f} MB/s | "
+              f"{mb / t_bytes:>9.2f} MB/s | {mb / t_partes:>9.2f} MB/s | {t_original / t_bits:>10.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark CRC-32 paralelo - Aceleración según el número de núcleos
+Universidad del Valle de Guatemala - CC3067 Redes
+
+Al final comprueba que el ejecutor por defecto (procesos) escale: con
+varios núcleos la aceleración con más trabajadores debe alcanzar
+EFICIENCIA_MINIMA por núcleo usado; si no, termina con código 1.
+
+Uso: python benchmarks/bench_crc32_paralelo.py [MB] [max_trabajadores]
+"""
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crc32Emisor import crc32_bytes, crc32_paralelo
+
+# Aceleración mínima por núcleo usado (0.5 = la mitad del ideal)
+EFICIENCIA_MINIMA = 0.5
+
+def medir(funcion, repeticiones=3):
+    """Mejor tiempo de varias ejecuciones y el valor retornado"""
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        valor = funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, valor
+
+def main():
+    mb = int(sys.argv[1]) if len(sys.argv) > 1 else 128
+    nucleos = os.cpu_count() or 1
+    maximo = int(sys.argv[2]) if len(sys.argv) > 2 else nucleos
+    datos = os.urandom(mb << 20)
+
+    base, esperado = medir(lambda: crc32_bytes(datos))
+    print(f"=== BENCHMARK CRC-32 PARALELO ({mb} MB, {nucleos} núcleos) ===")
+    print(f"secuencial: {mb / base:8.1f} MB/s")
+    print(f"{'Trabajadores':>12} | {'hilos (MB/s)':>12} | {'acel.':>6} | {'procesos (MB/s)':>15} | {'acel.':>6}")
+    trabajadores = 1
+    aceleraciones = {}
+    while trabajadores <= maximo:
+        t_hilos, v_hilos = medir(lambda: crc32_paralelo(datos, trabajadores, ejecutor='hilos'))
+        t_procesos, v_procesos = medir(lambda: crc32_paralelo(datos, trabajadores, ejecutor='procesos'))
+        assert v_hilos == v_procesos == esperado
+        print(f"{trabajadores:>12} | {mb / t_hilos:>12.1f} | {base / t_hilos:>5.2f}x | "
+              f"{mb / t_procesos:>15.1f} | {base / t_procesos:>5.2f}x")
+        aceleraciones[trabajadores] = base / t_procesos
+        trabajadores *= 2
+
+    # Escalabilidad del ejecutor por defecto con el mayor número de trabajadores
+    trabajadores = max(aceleraciones)
+    usados = min(trabajadores, nucleos)
+    if usados < 2:
+        print("\nEscalabilidad: no se comprueba con un solo núcleo")
+        return
+    minimo = EFICIENCIA_MINIMA * usados
+    aceleracion = aceleraciones[trabajadores]
+    print(f"\nEscalabilidad (procesos, {trabajadores} trabajadores): {aceleracion:.2f}x "
+          f"(mínimo {minimo:.2f}x con {usados} núcleos)")
+    if aceleracion < minimo:
+        print("❌ crc32_paralelo no escala con los núcleos")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark Entrelazado - Goodput con ráfagas de errores (canal de Gilbert-Elliott)
+Universidad del Valle de Guatemala - CC3067 Redes
+
+Compara el Hamming de un solo código por trama con CRC-32 solo y con
+CRC-32 + Hamming corto entrelazado, para varias longitudes medias de
+ráfaga con la misma tasa de error de bit promedio.
+
+Goodput = bits de datos entregados correctamente / bits enviados por el
+canal: es la eficiencia con retransmisión de las tramas descartadas. Las
+tramas entregadas con datos distintos a los enviados (errores no
+detectados o correcciones equivocadas) no cuentan.
+
+Uso: python benchmarks/bench_entrelazado.py [tramas] [bytes_por_trama] [tasa_error]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import emisor
+import receptor
+from bitbuffer import BitBuffer
+from canal import CanalGilbertElliott, transmitir
+from registro import configurar
+
+CONFIGURACIONES = (
+    ("hamming (1 código)", 'hamming', 'hamming'),
+    ("crc32", 'crc32', 'none'),
+    ("crc32 + hamming74", 'crc32', 'hamming74'),
+    ("crc32 + secded84", 'crc32', 'secded84'),
+    ("crc32 + secded72", 'crc32', 'secded72'),
+)
+# Bits que dura en promedio el estado malo (tasa de error 0.5 en ese estado)
+RAFAGAS = (2, 8, 32)
+
+def medir(deteccion, correccion, mensajes, rafaga, tasa_error, semilla=2024):
+    tx = emisor.CapaEnlace(deteccion, correccion)
+    rx = receptor.CapaEnlace(deteccion, correccion)
+    p_malo_a_bueno = 1 / rafaga
+    # Fracción de bits en estado malo = tasa_error / 0.5
+    fraccion_malo = 2 * tasa_error
+    canal = CanalGilbertElliott(p_malo_a_bueno * fraccion_malo / (1 - fraccion_malo), p_malo_a_bueno,
+                                0.0, 0.5, semilla=semilla)
+    enviados = correctos = erroneos = 0
+    tiempo = 0.0
+    for mensaje in mensajes:
+        inicio = time.perf_counter()
+        trama = tx.calcular_integridad(mensaje)
+        tiempo += time.perf_counter() - inicio
+        recibida, _ = transmitir(trama, canal)
+        inicio = time.perf_counter()
+        aceptada, datos = receptor.procesar_trama(rx, recibida)
+        tiempo += time.perf_counter() - inicio
+        enviados += len(trama)
+        if aceptada:
+            if BitBuffer.convertir(datos) == mensaje:
+                correctos += 1
+            else:
+                erroneos += 1
+    bits_datos = len(mensajes[0])
+    return {
+        "entregadas": correctos / len(mensajes),
+        "erroneas": erroneos,
+        "goodput": correctos * bits_datos / enviados,
+        "mb_por_segundo": len(mensajes) * bits_datos / 8e6 / tiempo,
+    }
+
+def main():
+    tramas = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    tamano = int(sys.argv[2]) if len(sys.argv) > 2 else 256
+    tasa_error = float(sys.argv[3]) if len(sys.argv) > 3 else 1e-3
+    configurar(silencioso=True)
+    rng = random.Random(7)
+    mensajes = [BitBuffer(rng.randbytes(tamano)) for _ in range(tramas)]
+    print(f"=== BENCHMARK ENTRELAZADO ({tramas} tramas de {tamano} bytes, BER promedio {tasa_error:g}) ===")
+    for rafaga in RAFAGAS:
+        print(f"\nRáfagas de {rafaga} bits en promedio")
+        print(f"{'Configuración':>20} | {'entregadas':>10} | {'erróneas':>8} | {'goodput':>7} | {'MB/s':>6}")
+        for nombre, deteccion, correccion in CONFIGURACIONES:
+            r = medir(deteccion, correccion, mensajes, rafaga, tasa_error)
+            print(f"{nombre:>20} | {r['entregadas']:>9.1%} | {r['erroneas']:>8} | "
+                  f"{r['goodput']:>7.3f} | {r['mb_por_segundo']:>6.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Benchmark Hamming Emisor - Codificador en proceso vs subproceso de Node.js
+Universidad del Valle de Guatemala - CC3067 Redes
+
+Uso: python benchmarks/bench_hamming_emisor.py
+"""
+
+import os
+import random
+import shutil
+import subprocess
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(RAIZ)
+from hammingEmisor import hamming_sender
+
+def hamming_node(data_bits):
+    """Codifica como lo hacía emisor.CapaEnlace: un proceso de Node.js por trama"""
+    proceso = subprocess.run(['node', os.path.join(RAIZ, 'hammingEmisor.js')],
+                             input=f"{data_bits}\nquit\n", capture_output=True, text=True)
+    for linea in proceso.stdout.splitlines():
+        if '>>> RESULTADO FINAL:' in linea:
+            return linea.split(':', 1)[1].strip()
+    return None
+
+def tramas_por_segundo(funcion, tramas):
+    """Procesa todas las tramas y retorna (tramas/s, resultados)"""
+    inicio = time.perf_counter()
+    resultados = [funcion(t) for t in tramas]
+    return len(tramas) / (time.perf_counter() - inicio), resultados
+
+def main():
+    rng = random.Random(2024)
+    print("=== BENCHMARK HAMMING EMISOR ===")
+    hay_node = shutil.which('node') is not None
+    if not hay_node:
+        print("(Node.js no disponible: se omite la comparación con el subproceso)")
+
+    print(f"{'Bits':>8} | {'Python (tramas/s)':>18} | {'Node (tramas/s)':>16} | {'Aceleración':>11}")
+    for longitud in (8, 64, 512, 4096, 32768):
+        tramas = [''.join(rng.choice('01') for _ in range(longitud)) for _ in range(20)]
+
+        # Repetir las tramas para tener un tiempo medible en Python
+        velocidad_py, resultados_py = tramas_por_segundo(hamming_sender, tramas * 50)
+
+        if hay_node:
+            velocidad_node, resultados_node = tramas_por_segundo(hamming_node, tramas[:5])
+            assert resultados_node == resultados_py[:5], "Resultados distintos a hammingEmisor.js"
+            print(f"{longitud:>8} | {velocidad_py:>18.0f} | {velocidad_node:>16.1f} | {velocidad_py / velocidad_node:>10.0f}x")
+        else:
+            print(f"{longitud:>8} | {velocidad_py:>18.0f} | {'-':>16} | {'-':>11}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Benchmark Hamming por lotes - hamming_decode_batch vs ciclo por trama
+Universidad del Valle de Guatemala - CC3067 Redes
+
+Uso: python benchmarks/bench_hamming_lote.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from hammingEmisor import hamming_sender
+from hammingReceptor import hamming_decode
+from hammingLote import (NOMBRES_ESTADO, cadenas_a_filas, filas_a_cadenas,
+                         hamming_decode_batch)
+
+def generar_codigos(rng, cantidad, m):
+    """Genera códigos Hamming con 0, 1 o 2 errores"""
+    codigos = []
+    for _ in range(cantidad):
+        codigo = list(hamming_sender(''.join(rng.choice('01') for _ in range(m))))
+        for _ in range(rng.choice((0, 1, 1, 2))):
+            i = rng.randrange(len(codigo))
+            codigo[i] = '1' if codigo[i] == '0' else '0'
+        codigos.append(''.join(codigo))
+    return codigos
+
+def comparar(codigos, lote):
+    """Verifica que el lote coincida fila por fila con hamming_decode"""
+    mensajes = filas_a_cadenas(lote.datos)
+    for i, codigo in enumerate(codigos):
+        esperado = hamming_decode(codigo)
+        assert NOMBRES_ESTADO[lote.estado[i]] == esperado["status"]
+        if esperado["status"] != "error":
+            assert mensajes[i] == esperado["message"]
+            assert int(lote.posicion_error[i]) == esperado.get("error_position", 0)
+
+def main():
+    rng = random.Random(2024)
+    print("=== BENCHMARK HAMMING POR LOTES ===")
+    print(f"{'m':>6} | {'N':>6} | {'Ciclo (tramas/s)':>17} | {'Lote (tramas/s)':>16} | {'Aceleración':>11}")
+
+    for m, cantidad in ((4, 20000), (64, 10000), (512, 2000), (4096, 500)):
+        codigos = generar_codigos(rng, cantidad, m)
+        matriz = cadenas_a_filas(codigos)
+
+        inicio = time.perf_counter()
+        for codigo in codigos:
+            hamming_decode(codigo)
+        t_ciclo = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        lote = hamming_decode_batch(matriz)
+        t_lote = time.perf_counter() - inicio
+
+        comparar(codigos, lote)
+        print(f"{m:>6} | {cantidad:>6} | {cantidad / t_ciclo:>17.0f} | {cantidad / t_lote:>16.0f} | {t_ciclo / t_lote:>10.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark Lotes - calcular_integridad/verificar_integridad por trama y por lotes
+Universidad del Valle de Guatemala - CC3067 Redes
+
+Compara la llamada por trama con las versiones _batch en serie, con hilos
+y con procesos para 1..N trabajadores (N = núcleos disponibles).
+
+Uso: python benchmarks/bench_lotes.py [tramas] [bytes_por_trama] [metodo]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import emisor
+import receptor
+from bitbuffer import BitBuffer
+from registro import configurar
+
+def medir(funcion):
+    inicio = time.perf_counter()
+    funcion()
+    return time.perf_counter() - inicio
+
+def main():
+    tramas = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    tamano = int(sys.argv[2]) if len(sys.argv) > 2 else 1024
+    metodo = sys.argv[3] if len(sys.argv) > 3 else 'crc32'
+    configurar(silencioso=True)
+    rng = random.Random(2024)
+    mensajes = [BitBuffer(rng.randbytes(tamano)) for _ in range(tramas)]
+    correccion = 'hamming' if metodo == 'hamming' else 'none'
+    tx = emisor.CapaEnlace(metodo, correccion)
+    rx = receptor.CapaEnlace(metodo, correccion)
+    protegidas = list(tx.calcular_integridad_batch(mensajes))
+
+    nucleos = os.cpu_count() or 1
+    configuraciones = [("por trama", None, 1), ("lote serie", 'serie', 1)]
+    for trabajadores in sorted({1, 2, 4, nucleos} - {n for n in (2, 4) if n > nucleos}):
+        configuraciones.append((f"hilos x{trabajadores}", 'hilos', trabajadores))
+    for trabajadores in sorted({1, 2, 4, nucleos} - {n for n in (2, 4) if n > nucleos}):
+        configuraciones.append((f"procesos x{trabajadores}", 'procesos', trabajadores))
+
+    print(f"=== BENCHMARK LOTES ({tramas} tramas de {tamano} bytes, {metodo}, {nucleos} núcleos) ===")
+    print(f"{'Configuración':>14} | {'protección (tramas/s)':>21} | {'verificación (tramas/s)':>23} | {'aceleración':>11}")
+    base = None
+    for nombre, ejecutor, trabajadores in configuraciones:
+        if ejecutor is None:
+            t_tx = medir(lambda: [tx.calcular_integridad(m) for m in mensajes])
+            t_rx = medir(lambda: [rx.verificar_integridad(t) for t in protegidas])
+        else:
+            t_tx = medir(lambda: list(tx.calcular_integridad_batch(mensajes, ejecutor, trabajadores)))
+            t_rx = medir(lambda: list(rx.verificar_integridad_batch(protegidas, ejecutor, trabajadores)))
+        base = base or t_tx + t_rx
+        print(f"{nombre:>14} | {tramas / t_tx:>21,.0f} | {tramas / t_rx:>23,.0f} | {base / (t_tx + t_rx):>10.2f}x")
+
+if __name__ == "__main__":
+    main()
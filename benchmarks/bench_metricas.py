@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark Métricas - Costo de la instrumentación y desglose por etapa
+Universidad del Valle de Guatemala - CC3067 Redes
+
+Recorre el flujo completo (presentación -> enlace -> canal -> enlace ->
+presentación) sin instrumentar, con las métricas desactivadas y activas,
+y muestra en qué etapa se va el tiempo.
+
+Uso: python benchmarks/bench_metricas.py [tramas] [caracteres_por_mensaje]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import emisor
+import receptor
+from canal import CanalIID
+from metricas import METRICAS
+from presentacion import CapaPresentacion
+from registro import configurar
+
+def flujo(mensajes, sin_instrumentar=False):
+    presentacion = CapaPresentacion()
+    enlace_tx = emisor.CapaEnlace('crc32')
+    enlace_rx = receptor.CapaEnlace('crc32', 'none')
+    canal = CanalIID(1e-3, semilla=1)
+
+    codificar = presentacion.codificar_mensaje
+    proteger = enlace_tx.calcular_integridad
+    ruido = emisor.simular_ruido
+    verificar = enlace_rx.verificar_integridad
+    decodificar = presentacion.decodificar_mensaje
+    if sin_instrumentar:
+        # Funciones originales, sin la envoltura de @instrumentar
+        codificar = codificar.__wrapped__.__get__(presentacion)
+        proteger = proteger.__wrapped__.__get__(enlace_tx)
+        ruido = ruido.__wrapped__
+        verificar = verificar.__wrapped__.__get__(enlace_rx)
+        decodificar = decodificar.__wrapped__.__get__(presentacion)
+
+    inicio = time.perf_counter()
+    for mensaje in mensajes:
+        trama = ruido(proteger(codificar(mensaje)), canal=canal)
+        ok, datos = verificar(trama)
+        if ok:
+            decodificar(datos)
+    return (time.perf_counter() - inicio) / len(mensajes)
+
+def main():
+    tramas = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    caracteres = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    configurar(silencioso=True)
+    rng = random.Random(2024)
+    alfabeto = "abcdefghijklmnopqrstuvwxyz ñáé"
+    mensajes = ["".join(rng.choices(alfabeto, k=caracteres)) for _ in range(tramas)]
+
+    print(f"=== BENCHMARK MÉTRICAS ({tramas} mensajes de {caracteres} caracteres, CRC-32) ===")
+    base = flujo(mensajes, sin_instrumentar=True)
+    desactivadas = flujo(mensajes)
+    METRICAS.activar()
+    activas = flujo(mensajes)
+    for nombre, t in (("sin instrumentar", base), ("desactivadas", desactivadas), ("activas", activas)):
+        print(f"{nombre:>16}: {t * 1e6:>8.2f} µs/mensaje  (+{(t / base - 1) * 100:5.1f}%)")
+
+    resumen = METRICAS.resumen()
+    total = sum(e["tiempo_total_ms"] for e in resumen["etapas"].values())
+    print("\nDesglose por etapa (métricas activas):")
+    for nombre, etapa in resumen["etapas"].items():
+        lat = etapa["latencia_ms"]
+        print(f"   {nombre:<28} {etapa['tiempo_total_ms'] / total * 100:5.1f}%  "
+              f"media={lat['media'] * 1000:7.2f} µs  p99<={lat['p99'] * 1000:7.1f} µs")
+    print(f"   eventos: {resumen['eventos']}")
+
+if __name__ == "__main__":
+    main()
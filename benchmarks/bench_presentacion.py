@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark Capa de Presentación - UTF-8 en bloque vs formato por carácter
+Universidad del Valle de Guatemala - CC3067 Redes
+
+Uso: python benchmarks/bench_presentacion.py [MB]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from presentacion import DecodificadorIncremental, codificar_utf8, decodificar_utf8
+
+def codificar_original(mensaje):
+    """Implementación original de codificar_mensaje (sin imprimir)"""
+    return ''.join(format(ord(c), '08b') for c in mensaje)
+
+def decodificar_original(mensaje_binario):
+    """Implementación original de decodificar_mensaje (sin imprimir)"""
+    mensaje = ""
+    for i in range(0, len(mensaje_binario), 8):
+        byte = mensaje_binario[i:i+8]
+        if len(byte) == 8:
+            mensaje += chr(int(byte, 2))
+    return mensaje
+
+def generar_texto(rng, tamano):
+    """Texto con mayoría ASCII y algunos caracteres multibyte"""
+    alfabeto = 'abcdefghijklmnopqrstuvwxyz ' * 8 + 'áéíóúñ¿¡' + '€✓' + '😀'
+    return ''.join(rng.choices(alfabeto, k=tamano))
+
+def medir(funcion, *args):
+    inicio = time.perf_counter()
+    resultado = funcion(*args)
+    return time.perf_counter() - inicio, resultado
+
+def main():
+    megas = float(sys.argv[1]) if len(sys.argv) > 1 else 10
+    rng = random.Random(2024)
+    texto = generar_texto(rng, int(megas * 1e6))
+    mb = len(texto.encode('utf-8')) / 1e6
+    print("=== BENCHMARK CAPA DE PRESENTACIÓN ===")
+    print(f"Texto: {len(texto)} caracteres, {mb:.1f} MB en UTF-8")
+
+    t_cod, bits = medir(codificar_utf8, texto)
+    t_dec, recuperado = medir(decodificar_utf8, bits)
+    assert recuperado == texto
+
+    # Decodificación incremental en tramas de 1500 bytes (cortan caracteres multibyte)
+    def incremental():
+        decodificador = DecodificadorIncremental()
+        vista = bits.vista()
+        partes = [decodificador.alimentar(vista[i:i + 1500]) for i in range(0, len(vista), 1500)]
+        partes.append(decodificador.alimentar(b'', final=True))
+        return ''.join(partes)
+    t_inc, recuperado = medir(incremental)
+    assert recuperado == texto
+
+    # Tramas de bits que no están alineadas a byte
+    def incremental_bits():
+        decodificador = DecodificadorIncremental()
+        partes = [decodificador.alimentar(bits[i:i + 1001]) for i in range(0, min(len(bits), 8_000_000), 1001)]
+        return ''.join(partes)
+    t_bits, parcial = medir(incremental_bits)
+    assert texto.startswith(parcial)
+
+    print(f"Codificar (UTF-8 en bloque):     {mb / t_cod:>10.1f} MB/s")
+    print(f"Decodificar (UTF-8 en bloque):   {mb / t_dec:>10.1f} MB/s")
+    print(f"Decodificar incremental (bytes): {mb / t_inc:>10.1f} MB/s")
+    print(f"Decodificar incremental (bits):  {min(mb, 1.0) / t_bits:>10.1f} MB/s")
+
+    # La versión original es cuadrática al decodificar: se mide sobre 1 MB de texto ASCII
+    muestra = ''.join(c for c in texto[:1_000_000] if ord(c) < 256)
+    t_cod_orig, bits_orig = medir(codificar_original, muestra)
+    t_dec_orig, _ = medir(decodificar_original, bits_orig)
+    mb_muestra = len(muestra) / 1e6
+    print(f"Codificar (original, 1 MB):      {mb_muestra / t_cod_orig:>10.1f} MB/s")
+    print(f"Decodificar (original, 1 MB):    {mb_muestra / t_dec_orig:>10.1f} MB/s")
+
+if __name__ == "__main__":
+    main()
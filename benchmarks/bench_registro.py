@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Benchmark Registro - Costo por trama de las trazas según el nivel de logging
+Universidad del Valle de Guatemala - CC3067 Redes
+
+Mide emisor.CapaEnlace.calcular_integridad + receptor.procesar_trama con
+Hamming (la traza más detallada) y las trazas enviadas a un flujo nulo.
+
+Uso: python benchmarks/bench_registro.py [tramas] [bytes_por_trama]
+"""
+
+import io
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import emisor
+import receptor
+from bitbuffer import BitBuffer
+from hammingReceptor import hamming_receiver
+from registro import configurar
+
+class _FlujoNulo(io.TextIOBase):
+    def write(self, texto):
+        return len(texto)
+
+NIVELES = (('debug', False), ('info', False), ('warning', False), ('silencioso', True))
+
+def medir(tramas, tamano_bytes, nivel, silencioso):
+    configurar(nivel if not silencioso else logging.WARNING, silencioso, flujo=_FlujoNulo())
+    rng = random.Random(2024)
+    datos = [BitBuffer(rng.randbytes(tamano_bytes)) for _ in range(tramas)]
+    enlace_tx = emisor.CapaEnlace('hamming', 'hamming')
+    enlace_rx = receptor.CapaEnlace('hamming', 'hamming')
+
+    inicio = time.perf_counter()
+    for d in datos:
+        trama = enlace_tx.calcular_integridad(d)
+        receptor.procesar_trama(enlace_rx, trama)
+        # Traza completa del receptor Hamming (la de los main interactivos)
+        hamming_receiver(trama)
+    return (time.perf_counter() - inicio) / tramas
+
+def main():
+    tramas = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    tamano = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    print(f"=== BENCHMARK REGISTRO ({tramas} tramas de {tamano} bytes, Hamming) ===")
+    base = None
+    for nivel, silencioso in reversed(NIVELES):
+        por_trama = medir(tramas, tamano, nivel, silencioso)
+        base = base or por_trama
+        print(f"{nivel:>10}: {por_trama * 1e6:>9.1f} µs/trama  ({por_trama / base:.2f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark Transporte - Emisores y receptor conectados por loopback
+Universidad del Valle de Guatemala - CC3067 Redes
+
+Uso: python benchmarks/bench_transporte.py [clientes] [tramas_por_cliente]
+"""
+
+import asyncio
+import os
+import random
+import sys
+import time
+from functools import partial
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import emisor
+import receptor
+from bitbuffer import BitBuffer
+from registro import configurar
+from transporte import ESTADO_ACEPTADA, EmisorTCP, EmisorUDP, ServidorReceptor, percentiles
+
+def preparar_tramas(rng, cantidad, tamano_bytes, tasa_error):
+    """Tramas con CRC-32, algunas alteradas por el canal"""
+    enlace = emisor.CapaEnlace('crc32')
+    tramas = []
+    for i in range(cantidad):
+        protegida = enlace.calcular_integridad(BitBuffer(rng.randbytes(tamano_bytes)))
+        tramas.append(emisor.simular_ruido(protegida, tasa_error, semilla=i))
+    return tramas
+
+async def correr(udp, clientes, tramas):
+    enlace = receptor.CapaEnlace('crc32', 'none')
+    servidor = await ServidorReceptor(partial(receptor.procesar_trama, enlace), puerto=0, udp=udp).iniciar()
+
+    async def cliente():
+        conexion = (EmisorUDP if udp else EmisorTCP)('127.0.0.1', servidor.puerto)
+        await conexion.conectar()
+        futuros = []
+        for trama in tramas:
+            futuros.append(await conexion.enviar(trama))
+            if udp and len(futuros) % 64 == 0:
+                # UDP no tiene control de flujo: se envía por ráfagas para no
+                # desbordar el buffer del socket del receptor
+                await conexion.esperar_pendientes()
+        await conexion.esperar_pendientes()
+        await conexion.cerrar()
+        return conexion.estadisticas, sum(1 for f in futuros if f.done() and not f.cancelled()
+                                          and f.exception() is None and f.result() == ESTADO_ACEPTADA)
+
+    inicio = time.perf_counter()
+    resultados = await asyncio.gather(*(cliente() for _ in range(clientes)))
+    duracion = time.perf_counter() - inicio
+    await servidor.cerrar()
+
+    latencias = [l for estadisticas, _ in resultados for l in estadisticas.latencias]
+    respondidas = sum(e.tramas for e, _ in resultados)
+    aceptadas = sum(a for _, a in resultados)
+    return respondidas, aceptadas, duracion, percentiles(latencias), servidor.estadisticas
+
+def main():
+    clientes = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    por_cliente = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    rng = random.Random(2024)
+
+    # Sin trazas de las capas durante la medición
+    configurar(silencioso=True)
+    tramas = preparar_tramas(rng, por_cliente, 64, 0.001)
+
+    print("=== BENCHMARK TRANSPORTE (loopback) ===")
+    print(f"{clientes} clientes x {por_cliente} tramas de 64 bytes + CRC-32")
+    for udp in (False, True):
+        respondidas, aceptadas, duracion, p, servidor = asyncio.run(correr(udp, clientes, tramas))
+        print(f"\n[{'UDP' if udp else 'TCP'}] respondidas: {respondidas}/{clientes * por_cliente}, aceptadas: {aceptadas}")
+        print(f"   tramas/s (extremo a extremo): {respondidas / duracion:,.0f}")
+        print(f"   tramas/s (receptor):          {servidor.tramas_por_segundo():,.0f}")
+        print("   latencia ida y vuelta:        " +
+              ", ".join(f"p{k}={v * 1000:.2f} ms" for k, v in p.items() if v is not None))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Suite de benchmarks - Todos los códigos y capas, con línea base en JSON
+Universidad del Valle de Guatemala - CC3067 Redes
+
+Corre cada caso (una función de un código o un método de una capa) con
+cargas de 1 byte a 100 MB en RONDAS rondas y registra por tamaño:
+    - MB/s con la mejor de las medianas de cada ronda
+    - Ruido: dispersión relativa de esas medianas entre rondas
+    - Latencia por llamada: percentiles 50, 90 y 99 de todas las llamadas
+    - Pico de memoria asignada durante una llamada (tracemalloc, en una
+      llamada aparte para no afectar los tiempos)
+Las cargas salen de una semilla fija y el número de repeticiones depende
+solo del tamaño, así dos corridas miden exactamente el mismo trabajo.
+
+El resultado se compara con la línea base y solo cuenta como regresión
+una caída de MB/s mayor que el umbral y que el ruido de ambas corridas.
+La latencia p99 y la memoria varían demasiado entre corridas para decidir
+con ellas: sus cambios se muestran como información.
+Los tiempos dependen de la máquina, así que la línea base no está en el
+repositorio: se crea en cada máquina con --actualizar, que también la
+reemplaza (combinada con la anterior si solo se corrieron algunos casos).
+Sin línea base la suite termina con error en lugar de dar la corrida por
+buena. La línea base guarda el entorno y se avisa si la corrida es de
+otro. El código de salida es 1 si hay regresiones.
+
+--casos elige por subcadena del nombre: 'crc32' corre crc32.calculate_crc32
+y también checksums.crc32c y los casos CapaEnlace[crc32+...]; --listar
+muestra qué casos quedan elegidos.
+
+Los casos que tratan la carga como una sola trama de un código pensado
+para tramas cortas (Hamming de toda la trama, capa de enlace) tienen un
+tamaño máximo; los tamaños mayores se omiten.
+
+Uso:
+    python benchmarks/suite.py --actualizar
+    python benchmarks/suite.py
+    python benchmarks/suite.py --casos crc32,CapaEnlace --tamanos 1,1K,1M
+    python benchmarks/suite.py --umbral 0.1 --actualizar
+"""
+
+import argparse
+from collections import namedtuple
+import gc
+from datetime import datetime, timezone
+from functools import partial
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import checksums
+import emisor
+import receptor
+from bitbuffer import BitBuffer
+from crc32Emisor import calculate_crc32, crc32_sender
+from crc32Receptor import crc32_receiver
+from hammingEmisor import hamming_sender
+from hammingReceptor import hamming_receiver
+from presentacion import CapaPresentacion, codificar_utf8
+from registro import configurar
+
+try:
+    import numpy
+    import reedsolomon
+except ImportError:
+    numpy = reedsolomon = None
+
+LINEA_BASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'linea_base.json')
+TAMANOS = (1, 1 << 10, 64 << 10, 1 << 20, 100 << 20)
+UMBRAL = 0.15
+SEMILLA = 2024
+
+# Rondas por caso y tamaño. Cada ronda recorre todos los casos, así las
+# rondas de un caso quedan repartidas en toda la corrida y la mejor mediana
+# descarta las que coincidieron con interferencias (otros procesos,
+# frecuencia de la CPU)
+RONDAS = 5
+# Repeticiones por ronda: las que quepan en PRESUPUESTO bytes, entre MINIMO y MAXIMO
+PRESUPUESTO = 4 << 20
+MINIMO_REPETICIONES = 1
+MAXIMO_REPETICIONES = 100
+
+# Tamaño máximo de una trama de la capa de enlace o de Hamming completo
+MAXIMO_TRAMA = 1 << 20
+
+ENLACES = (
+    ('crc32', 'none', None),
+    ('crc32c', 'none', None),
+    ('hamming', 'hamming', None),
+    ('crc32', 'secded72', None),
+    ('crc32', 'reed-solomon', 16),
+    ('crc32', 'adaptativo', None),
+)
+
+Caso = namedtuple('Caso', 'nombre preparar maximo')
+Caso.__doc__ = "preparar(carga) -> función sin argumentos que procesa la carga"
+
+def _texto(carga):
+    """Texto ASCII imprimible con el mismo número de bytes que la carga"""
+    return carga.translate(bytes(32 + b % 95 for b in range(256))).decode('ascii')
+
+def _enlace(deteccion, correccion, simbolos_paridad, carga, lado):
+    tx = emisor.CapaEnlace(deteccion, correccion, simbolos_paridad)
+    mensaje = BitBuffer(carga)
+    if lado == 'emisor':
+        return partial(tx.calcular_integridad, mensaje)
+    rx = receptor.CapaEnlace(deteccion, correccion, simbolos_paridad=simbolos_paridad)
+    return partial(receptor.procesar_trama, rx, tx.calcular_integridad(mensaje))
+
+def casos():
+    """Casos registrados, en el orden en que se corren"""
+    lista = [
+        Caso('crc32.calculate_crc32', lambda c: partial(calculate_crc32, BitBuffer(c)), None),
+        Caso('crc32.crc32_receiver', lambda c: partial(crc32_receiver, crc32_sender(BitBuffer(c))), None),
+    ]
+    for nombre in checksums.disponibles():
+        codec = checksums.obtener(nombre)
+        lista.append(Caso(f'checksums.{nombre}', lambda c, codec=codec: partial(codec.calcular, c), None))
+    lista += [
+        Caso('hamming.hamming_sender', lambda c: partial(hamming_sender, BitBuffer(c)), MAXIMO_TRAMA),
+        Caso('hamming.hamming_receiver', lambda c: partial(hamming_receiver, hamming_sender(BitBuffer(c))),
+             MAXIMO_TRAMA),
+        Caso('canal.simular_ruido', lambda c: partial(emisor.simular_ruido, BitBuffer(c), 1e-3, SEMILLA), None),
+        Caso('CapaPresentacion.codificar_mensaje',
+             lambda c: partial(CapaPresentacion().codificar_mensaje, _texto(c)), None),
+        Caso('CapaPresentacion.decodificar_mensaje',
+             lambda c: partial(CapaPresentacion().decodificar_mensaje, codificar_utf8(_texto(c))), None),
+    ]
+    if reedsolomon is not None:
+        rs = reedsolomon.obtener(reedsolomon.SIMBOLOS_PARIDAD)
+        lista += [
+            Caso('reedsolomon.codificar_bytes', lambda c: partial(rs.codificar_bytes, c), None),
+            Caso('reedsolomon.decodificar_bytes', lambda c: partial(rs.decodificar_bytes, rs.codificar_bytes(c)),
+                 None),
+        ]
+    for deteccion, correccion, simbolos in ENLACES:
+        if correccion not in emisor.metodos_correccion():
+            continue
+        nombre = f'CapaEnlace[{deteccion}+{correccion}]'
+        lista += [
+            Caso(f'{nombre}.calcular_integridad',
+                 partial(_enlace, deteccion, correccion, simbolos, lado='emisor'), MAXIMO_TRAMA),
+            Caso(f'{nombre}.procesar_trama',
+                 partial(_enlace, deteccion, correccion, simbolos, lado='receptor'), MAXIMO_TRAMA),
+        ]
+    return lista
+
+def repeticiones(tamano):
+    return max(MINIMO_REPETICIONES, min(MAXIMO_REPETICIONES, PRESUPUESTO // max(tamano, 1)))
+
+def percentil(ordenados, p):
+    """Percentil por rango más cercano (determinista para pocas muestras)"""
+    return ordenados[max(0, math.ceil(p / 100 * len(ordenados)) - 1)]
+
+def medir_ronda(caso, tamano, memoria=False):
+    """
+    Una ronda de un caso con una carga de 'tamano' bytes
+    Returns:
+        tuple: (tiempos de cada llamada en segundos, pico de memoria en bytes
+        o None si no se pidió)
+    """
+    carga = random.Random(SEMILLA + tamano).randbytes(tamano)
+    funcion = caso.preparar(carga)
+    if tamano < 1 << 20:
+        # Tablas, cachés y lru_cache; en cargas grandes su costo no se nota
+        funcion()
+    tiempos = []
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeticiones(tamano)):
+            inicio = time.perf_counter()
+            funcion()
+            tiempos.append(time.perf_counter() - inicio)
+    finally:
+        gc.enable()
+
+    pico = None
+    if memoria:
+        tracemalloc.start()
+        try:
+            funcion()
+            pico = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return tiempos, pico
+
+def resumir(tamano, rondas, pico):
+    """Métricas de un caso a partir de los tiempos de cada ronda"""
+    medianas = [percentil(sorted(tiempos), 50) for tiempos in rondas]
+    tiempos = sorted(t for ronda in rondas for t in ronda)
+    mejor = min(medianas)
+    return {
+        "mb_s": round(tamano / 1e6 / mejor, 3) if mejor else None,
+        "ruido": round((max(medianas) - mejor) / mejor, 3) if mejor else None,
+        "p50_us": round(percentil(tiempos, 50) * 1e6, 2),
+        "p90_us": round(percentil(tiempos, 90) * 1e6, 2),
+        "p99_us": round(percentil(tiempos, 99) * 1e6, 2),
+        "memoria_pico_kb": round(pico / 1024, 1),
+        "repeticiones": len(tiempos),
+    }
+
+def entorno():
+    return {
+        "python": platform.python_version(),
+        "implementacion": platform.python_implementation(),
+        "plataforma": platform.platform(),
+        "procesador": platform.machine(),
+        "nucleos": os.cpu_count(),
+        "numpy": numpy.__version__ if numpy is not None else None,
+        "fecha": datetime.now(timezone.utc).isoformat(timespec='seconds'),
+    }
+
+def comparar(base, actual, umbral):
+    """
+    Returns:
+        tuple: (regresiones, informativos), listas de (caso, tamaño,
+        métrica, base, actual, cambio relativo). Regresiones: caídas de
+        MB/s mayores que el umbral y que el ruido sumado de ambas corridas.
+        Informativos: aumentos de p99 o de memoria mayores que el umbral
+    """
+    regresiones = []
+    informativos = []
+    for caso, por_tamano in actual.items():
+        for tamano, metricas in por_tamano.items():
+            anterior = base.get(caso, {}).get(tamano)
+            if anterior is None:
+                continue
+            for metrica, mayor_mejor in (('mb_s', True), ('p99_us', False), ('memoria_pico_kb', False)):
+                valor_base, valor = anterior.get(metrica), metricas.get(metrica)
+                if not valor_base or valor is None:
+                    continue
+                cambio = (valor - valor_base) / valor_base
+                peor = -cambio if mayor_mejor else cambio
+                if metrica != 'mb_s':
+                    if peor > umbral:
+                        informativos.append((caso, tamano, metrica, valor_base, valor, cambio))
+                    continue
+                ruido = (anterior.get('ruido') or 0.0) + (metricas.get('ruido') or 0.0)
+                if peor > max(umbral, ruido):
+                    regresiones.append((caso, tamano, metrica, valor_base, valor, cambio))
+    return regresiones, informativos
+
+def _tamano(texto):
+    unidades = {'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30}
+    texto = texto.strip().upper().rstrip('B')
+    if texto[-1:] in unidades:
+        return int(float(texto[:-1]) * unidades[texto[-1]])
+    return int(texto)
+
+def _formato_tamano(tamano):
+    for unidad, valor in (('M', 1 << 20), ('K', 1 << 10)):
+        if tamano >= valor and not tamano % valor:
+            return f"{tamano // valor} {unidad}B"
+    return f"{tamano} B"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Suite de benchmarks de códigos y capas')
+    parser.add_argument('--casos', default='',
+                        help='Solo los casos cuyo nombre contiene alguno de estos textos, separados por coma '
+                             '(subcadenas: crc32 elige también CapaEnlace[crc32+...]; ver --listar)')
+    parser.add_argument('--tamanos', type=lambda s: [_tamano(t) for t in s.split(',')], default=TAMANOS,
+                        help='Tamaños de carga, por ejemplo 1,1K,64K,1M,100M')
+    parser.add_argument('--linea-base', default=LINEA_BASE, help='Archivo JSON de la línea base')
+    parser.add_argument('--umbral', type=float, default=UMBRAL,
+                        help='Caída relativa de MB/s que cuenta como regresión (0.15 = 15%%)')
+    parser.add_argument('--actualizar', action='store_true',
+                        help='Guarda esta corrida como línea base (la crea si no existe)')
+    parser.add_argument('--salida', help='Además guarda esta corrida en este archivo JSON')
+    parser.add_argument('--listar', action='store_true', help='Muestra los casos y termina')
+    args = parser.parse_args(argv)
+    configurar(silencioso=True)
+
+    filtros = [f for f in args.casos.split(',') if f]
+    seleccion = [c for c in casos() if not filtros or any(f in c.nombre for f in filtros)]
+    if args.listar:
+        for caso in seleccion:
+            print(caso.nombre)
+        return 0
+    if not seleccion:
+        parser.error(f"ningún caso contiene {', '.join(filtros)} (ver --listar)")
+    if not args.actualizar and not os.path.exists(args.linea_base):
+        parser.error(f"no existe la línea base {args.linea_base}; créela en esta máquina con --actualizar")
+
+    trabajos = [(caso, tamano) for caso in seleccion for tamano in args.tamanos
+                if caso.maximo is None or tamano <= caso.maximo]
+    rondas = {}
+    picos = {}
+    for ronda in range(RONDAS):
+        print(f"Ronda {ronda + 1}/{RONDAS}...", flush=True)
+        for caso, tamano in trabajos:
+            tiempos, pico = medir_ronda(caso, tamano, memoria=ronda == 0)
+            rondas.setdefault((caso.nombre, tamano), []).append(tiempos)
+            if pico is not None:
+                picos[caso.nombre, tamano] = pico
+
+    print(f"{'Caso':>52} | {'Tamaño':>7} | {'MB/s':>9} | {'Ruido':>6} | {'p50 (µs)':>11} | {'p90 (µs)':>11} | "
+          f"{'p99 (µs)':>11} | {'Memoria (KB)':>12}")
+    resultados = {}
+    for caso, tamano in trabajos:
+        m = resumir(tamano, rondas[caso.nombre, tamano], picos[caso.nombre, tamano])
+        resultados.setdefault(caso.nombre, {})[str(tamano)] = m
+        mb_s = f"{m['mb_s']:.2f}" if m['mb_s'] is not None else '-'
+        ruido = f"{m['ruido']:.0%}" if m['ruido'] is not None else '-'
+        print(f"{caso.nombre:>52} | {_formato_tamano(tamano):>7} | {mb_s:>9} | {ruido:>6} | {m['p50_us']:>11.1f} | "
+              f"{m['p90_us']:>11.1f} | {m['p99_us']:>11.1f} | {m['memoria_pico_kb']:>12.1f}")
+
+    corrida = {"entorno": entorno(), "resultados": resultados}
+    if args.salida:
+        with open(args.salida, 'w', encoding='utf-8') as archivo:
+            json.dump(corrida, archivo, indent=2, ensure_ascii=False)
+
+    base = None
+    if os.path.exists(args.linea_base):
+        with open(args.linea_base, encoding='utf-8') as archivo:
+            base = json.load(archivo)
+
+    regresiones = []
+    if base is not None:
+        anterior, actual = base.get("entorno", {}), corrida["entorno"]
+        distintos = [k for k in ('python', 'implementacion', 'plataforma', 'procesador', 'nucleos', 'numpy')
+                     if anterior.get(k) != actual[k]]
+        if distintos:
+            print(f"\n⚠️ La línea base es de otro entorno ({', '.join(distintos)}): las diferencias "
+                  f"pueden no deberse al código")
+        regresiones, informativos = comparar(base.get("resultados", {}), resultados, args.umbral)
+        if informativos:
+            print(f"\nℹ️ {len(informativos)} cambios de p99 o memoria (no cuentan como regresión):")
+            for caso, tamano, metrica, valor_base, valor, cambio in informativos:
+                print(f"  {caso} [{_formato_tamano(int(tamano))}] {metrica}: {valor_base:g} -> {valor:g} "
+                      f"({cambio:+.1%})")
+        if regresiones:
+            print(f"\n❌ {len(regresiones)} regresiones (umbral {args.umbral:.0%}, base {args.linea_base}):")
+            for caso, tamano, metrica, valor_base, valor, cambio in regresiones:
+                print(f"  {caso} [{_formato_tamano(int(tamano))}] {metrica}: {valor_base:g} -> {valor:g} "
+                      f"({cambio:+.1%})")
+        else:
+            print(f"\n✅ Sin regresiones respecto a {args.linea_base} (umbral {args.umbral:.0%})")
+
+    if args.actualizar:
+        if base is not None:
+            # Los casos y tamaños que no se corrieron conservan su valor anterior
+            for caso, por_tamano in base.get("resultados", {}).items():
+                for tamano, metricas in por_tamano.items():
+                    resultados.setdefault(caso, {}).setdefault(tamano, metricas)
+        with open(args.linea_base, 'w', encoding='utf-8') as archivo:
+            json.dump(corrida, archivo, indent=2, ensure_ascii=False)
+        print(f"Línea base guardada en {args.linea_base}")
+    return 1 if regresiones else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
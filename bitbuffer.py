@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+BitBuffer - Secuencia de bits empaquetada
+Universidad del Valle de Guatemala - CC3067 Redes
+Representa las tramas con 1 bit por bit (en lugar de un carácter '0'/'1'),
+sobre un bytearray con el primer bit en el bit más significativo del byte 0
+"""
+
+class BitBuffer:
+    """
+    Secuencia de bits empaquetada en un bytearray (MSB primero)
+
+    Los bits de relleno del último byte siempre valen 0, de modo que dos
+    buffers con los mismos bits tienen exactamente los mismos bytes.
+    """
+
+    __slots__ = ('_datos', '_longitud')
+
+    def __init__(self, datos=b'', longitud=None):
+        """
+        Args:
+            datos: Bytes empaquetados (MSB primero)
+            longitud: Número de bits válidos (por defecto len(datos) * 8)
+        """
+        datos = bytearray(datos)
+        if longitud is None:
+            longitud = len(datos) * 8
+        elif not 0 <= longitud <= len(datos) * 8:
+            raise ValueError("La longitud excede el tamaño de los datos")
+        del datos[(longitud + 7) // 8:]
+        resto = longitud & 7
+        if resto:
+            datos[-1] &= (0xFF00 >> resto) & 0xFF
+        self._datos = datos
+        self._longitud = longitud
+
+    @classmethod
+    def _crear(cls, datos, longitud):
+        """Construye un buffer a partir de un bytearray ya normalizado (sin copiar)"""
+        buffer = cls.__new__(cls)
+        buffer._datos = datos
+        buffer._longitud = longitud
+        return buffer
+
+    @classmethod
+    def desde_cadena(cls, bits):
+        """Crea un buffer a partir de una cadena de '0'/'1'"""
+        longitud = len(bits)
+        if not longitud:
+            return cls()
+        if bits.strip('01'):
+            raise ValueError("La cadena debe contener solo 0s y 1s")
+        relleno = -longitud & 7
+        valor = int(bits, 2) << relleno
+        return cls._crear(bytearray(valor.to_bytes((longitud + relleno) // 8, 'big')), longitud)
+
+    @classmethod
+    def desde_entero(cls, valor, longitud):
+        """Crea un buffer con los longitud bits menos significativos de valor"""
+        relleno = -longitud & 7
+        valor &= (1 << longitud) - 1
+        return cls._crear(bytearray((valor << relleno).to_bytes((longitud + relleno) // 8, 'big')), longitud)
+
+    @classmethod
+    def ceros(cls, longitud):
+        """Crea un buffer de longitud bits en 0"""
+        return cls._crear(bytearray((longitud + 7) // 8), longitud)
+
+    @classmethod
+    def convertir(cls, valor):
+        """Retorna valor como BitBuffer (acepta BitBuffer, cadena '0'/'1' o bytes)"""
+        if isinstance(valor, cls):
+            return valor
+        if isinstance(valor, str):
+            return cls.desde_cadena(valor)
+        return cls(valor)
+
+    def __len__(self):
+        return self._longitud
+
+    def a_entero(self):
+        """Retorna los bits como entero (el primer bit es el más significativo)"""
+        return int.from_bytes(self._datos, 'big') >> (-self._longitud & 7)
+
+    def tobytes(self):
+        """Retorna los bytes empaquetados (relleno con ceros al final)"""
+        return bytes(self._datos)
+
+    def bytes_alineados_derecha(self):
+        """
+        Retorna los bits como bytes con el relleno a la izquierda, que es
+        como los empaqueta bits_a_bytes para cadenas de texto
+        """
+        if not self._longitud & 7:
+            return self.vista()
+        return self.a_entero().to_bytes((self._longitud + 7) // 8, 'big')
+
+    def vista(self):
+        """Retorna una memoryview de solo lectura sobre los bytes (sin copiar)"""
+        return memoryview(self._datos).toreadonly()
+
+    def contar_unos(self):
+        """Número de bits en 1"""
+        return self.a_entero().bit_count()
+
+    def _indice(self, i):
+        if i < 0:
+            i += self._longitud
+        if not 0 <= i < self._longitud:
+            raise IndexError("Índice de bit fuera de rango")
+        return i
+
+    def __getitem__(self, clave):
+        if isinstance(clave, slice):
+            inicio, fin, paso = clave.indices(self._longitud)
+            if paso != 1:
+                return BitBuffer.desde_cadena(str(self)[clave])
+            longitud = max(0, fin - inicio)
+            if not inicio & 7:
+                # Inicio alineado a byte: basta copiar los bytes
+                return BitBuffer(self._datos[inicio >> 3:(fin + 7) >> 3], longitud)
+            # Solo se convierten los bytes que cubren el rango pedido
+            primer_byte, fin_byte = inicio >> 3, (fin + 7) >> 3
+            valor = int.from_bytes(self._datos[primer_byte:fin_byte], 'big') >> (fin_byte * 8 - fin)
+            return BitBuffer.desde_entero(valor, longitud)
+        i = self._indice(clave)
+        return (self._datos[i >> 3] >> (7 - (i & 7))) & 1
+
+    def __setitem__(self, i, bit):
+        i = self._indice(i)
+        mascara = 0x80 >> (i & 7)
+        if bit:
+            self._datos[i >> 3] |= mascara
+        else:
+            self._datos[i >> 3] &= ~mascara & 0xFF
+
+    def invertir(self, i):
+        """Invierte el bit en la posición i"""
+        i = self._indice(i)
+        self._datos[i >> 3] ^= 0x80 >> (i & 7)
+
+    def __iter__(self):
+        for i in range(self._longitud):
+            yield (self._datos[i >> 3] >> (7 - (i & 7))) & 1
+
+    def __xor__(self, otro):
+        if not isinstance(otro, BitBuffer):
+            return NotImplemented
+        if len(otro) != self._longitud:
+            raise ValueError("XOR requiere buffers de la misma longitud")
+        n = len(self._datos)
+        valor = int.from_bytes(self._datos, 'big') ^ int.from_bytes(otro._datos, 'big')
+        return BitBuffer._crear(bytearray(valor.to_bytes(n, 'big')), self._longitud)
+
+    def __add__(self, otro):
+        if isinstance(otro, str):
+            otro = BitBuffer.desde_cadena(otro)
+        elif not isinstance(otro, BitBuffer):
+            return NotImplemented
+        if not self._longitud & 7:
+            return BitBuffer._crear(self._datos + otro._datos, self._longitud + otro._longitud)
+        valor = (self.a_entero() << otro._longitud) | otro.a_entero()
+        return BitBuffer.desde_entero(valor, self._longitud + otro._longitud)
+
+    def __radd__(self, otro):
+        if isinstance(otro, str):
+            return BitBuffer.desde_cadena(otro) + self
+        return NotImplemented
+
+    def __eq__(self, otro):
+        if isinstance(otro, BitBuffer):
+            return self._longitud == otro._longitud and self._datos == otro._datos
+        if isinstance(otro, str):
+            return str(self) == otro
+        return NotImplemented
+
+    __hash__ = None
+
+    def copy(self):
+        """Retorna una copia independiente"""
+        return BitBuffer._crear(bytearray(self._datos), self._longitud)
+
+    def __str__(self):
+        if not self._longitud:
+            return ''
+        return format(self.a_entero(), f'0{self._longitud}b')
+
+    def __repr__(self):
+        if self._longitud <= 64:
+            return f"BitBuffer('{self}')"
+        return f"BitBuffer(<{self._longitud} bits>)"
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Canal con Ruido - Modelos de error para simular la transmisión
+Universidad del Valle de Guatemala - CC3067 Redes
+Genera las posiciones de error en bloque (muestreo por saltos geométricos)
+y las aplica con XOR sobre tramas en texto, BitBuffer o bytes empaquetados
+(con NumPy, una sola XOR vectorizada cuando hay muchas posiciones)
+"""
+
+import math
+import os
+import random
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from bitbuffer import BitBuffer
+
+try:
+    import numpy as np
+except ImportError:
+    # Sin NumPy los bits se invierten uno por uno
+    np = None
+
+# Con menos posiciones, recorrerlas en Python cuesta menos que convertirlas
+# a un arreglo de NumPy
+MINIMO_VECTORIZADO = 128
+
+def _saltos_geometricos(rng, probabilidad, inicio, fin, posiciones):
+    """
+    Agrega a posiciones los bits en [inicio, fin) que sufren error, cuando cada
+    bit falla de forma independiente con la probabilidad dada.
+    En lugar de sortear cada bit se sortea directamente la distancia al
+    siguiente error, por lo que el costo es proporcional a la cantidad de errores
+    """
+    if probabilidad <= 0.0 or inicio >= fin:
+        return
+    if probabilidad >= 1.0:
+        posiciones.extend(range(inicio, fin))
+        return
+
+    log_q = math.log1p(-probabilidad)
+    pos = inicio
+    while True:
+        pos += int(math.log(1.0 - rng.random()) / log_q)
+        if pos >= fin:
+            return
+        posiciones.append(pos)
+        pos += 1
+
+class CanalIID:
+    """Canal binario simétrico: cada bit se invierte con probabilidad tasa_error"""
+
+    def __init__(self, tasa_error=0.01, semilla=None):
+        """
+        Args:
+            tasa_error: Probabilidad de que un bit sea alterado (0.01 = 1%)
+            semilla: Semilla del generador para corridas reproducibles
+        """
+        if not 0.0 <= tasa_error <= 1.0:
+            raise ValueError("La tasa de error debe estar entre 0.0 y 1.0")
+        self.tasa_error = tasa_error
+        self.rng = random.Random(semilla)
+
+    def posiciones_error(self, n):
+        """Retorna la lista ordenada de posiciones alteradas en una trama de n bits"""
+        posiciones = []
+        _saltos_geometricos(self.rng, self.tasa_error, 0, n, posiciones)
+        return posiciones
+
+class CanalGilbertElliott:
+    """
+    Canal de Gilbert-Elliott: cadena de Markov de dos estados (bueno/malo)
+    con una tasa de error distinta en cada uno, para modelar ráfagas.
+    El estado se conserva entre tramas consecutivas
+    """
+
+    def __init__(self, p_bueno_a_malo=0.001, p_malo_a_bueno=0.1,
+                 tasa_error_bueno=0.0, tasa_error_malo=0.5, semilla=None):
+        """
+        Args:
+            p_bueno_a_malo: Probabilidad de pasar al estado malo tras cada bit
+            p_malo_a_bueno: Probabilidad de volver al estado bueno tras cada bit
+            tasa_error_bueno: Tasa de error de bit en el estado bueno
+            tasa_error_malo: Tasa de error de bit en el estado malo
+            semilla: Semilla del generador para corridas reproducibles
+        """
+        for valor in (p_bueno_a_malo, p_malo_a_bueno, tasa_error_bueno, tasa_error_malo):
+            if not 0.0 <= valor <= 1.0:
+                raise ValueError("Las probabilidades deben estar entre 0.0 y 1.0")
+        self.transicion = (p_bueno_a_malo, p_malo_a_bueno)
+        self.tasa_error = (tasa_error_bueno, tasa_error_malo)
+        self.rng = random.Random(semilla)
+        self.estado_malo = False
+        # Bits que le quedan al estado actual antes de cambiar (None = sortear)
+        self._restante = None
+
+    def _duracion_estado(self):
+        """Sortea cuántos bits dura el estado actual (distribución geométrica)"""
+        p = self.transicion[self.estado_malo]
+        if p <= 0.0:
+            return math.inf
+        if p >= 1.0:
+            return 1
+        return 1 + int(math.log(1.0 - self.rng.random()) / math.log1p(-p))
+
+    def tasa_error_promedio(self):
+        """Tasa de error de bit en estado estacionario"""
+        p_bm, p_mb = self.transicion
+        if p_bm + p_mb == 0:
+            return self.tasa_error[self.estado_malo]
+        fraccion_malo = p_bm / (p_bm + p_mb)
+        return (1 - fraccion_malo) * self.tasa_error[0] + fraccion_malo * self.tasa_error[1]
+
+    def posiciones_error(self, n):
+        """Retorna la lista ordenada de posiciones alteradas en una trama de n bits"""
+        posiciones = []
+        pos = 0
+        while pos < n:
+            if self._restante is None:
+                self._restante = self._duracion_estado()
+            fin = min(n, pos + self._restante)
+            _saltos_geometricos(self.rng, self.tasa_error[self.estado_malo], pos, fin, posiciones)
+            self._restante -= fin - pos
+            pos = fin
+            if self._restante == 0:
+                self.estado_malo = not self.estado_malo
+                self._restante = None
+        return posiciones
+
+def longitud_bits(trama):
+    """Número de bits de una trama en texto ('0'/'1'), BitBuffer o bytes"""
+    if isinstance(trama, (str, BitBuffer)):
+        return len(trama)
+    return len(trama) * 8
+
+def _invertir_bits(datos, posiciones):
+    """Copia (bytearray) de los bytes empaquetados con los bits indicados invertidos"""
+    buffer = bytearray(datos)
+    if np is not None and len(posiciones) >= MINIMO_VECTORIZADO:
+        pos = np.fromiter(posiciones, dtype=np.int64, count=len(posiciones))
+        # ufunc.at aplica todas las posiciones sobre el buffer en una sola
+        # llamada, acumulando las que caen en el mismo byte
+        np.bitwise_xor.at(np.frombuffer(buffer, dtype=np.uint8), pos >> 3,
+                          (0x80 >> (pos & 7)).astype(np.uint8))
+    else:
+        for pos in posiciones:
+            buffer[pos >> 3] ^= 0x80 >> (pos & 7)
+    return buffer
+
+def aplicar_errores(trama, posiciones):
+    """
+    Invierte los bits indicados con XOR
+    Args:
+        trama: Cadena de '0'/'1', BitBuffer, o bytes/bytearray empaquetados
+            (MSB primero)
+        posiciones: Posiciones (0-based) a invertir
+    Returns:
+        Trama alterada, del mismo tipo que la recibida
+    """
+    posiciones = posiciones if isinstance(posiciones, (list, tuple)) else list(posiciones)
+    if isinstance(trama, BitBuffer):
+        if np is not None and len(posiciones) >= MINIMO_VECTORIZADO:
+            return BitBuffer(_invertir_bits(trama.vista(), posiciones), len(trama))
+        # Pocas posiciones: evita la segunda copia del constructor
+        alterada = trama.copy()
+        for pos in posiciones:
+            alterada.invertir(pos)
+        return alterada
+
+    if isinstance(trama, str):
+        # '0' (0x30) y '1' (0x31) difieren solo en el bit menos significativo
+        buffer = bytearray(trama, 'ascii')
+        for pos in posiciones:
+            buffer[pos] ^= 1
+        return buffer.decode('ascii')
+
+    alterada = _invertir_bits(trama, posiciones)
+    return bytes(alterada) if isinstance(trama, bytes) else alterada
+
+def transmitir(trama, canal):
+    """
+    Pasa una trama por el canal
+    Returns:
+        tuple: (trama alterada, posiciones alteradas)
+    """
+    posiciones = canal.posiciones_error(longitud_bits(trama))
+    if not posiciones:
+        return trama, posiciones
+    return aplicar_errores(trama, posiciones), posiciones
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Checksums - Registro de códigos de detección para la capa de enlace
+Universidad del Valle de Guatemala - CC3067 Redes
+
+Cada código calcula su valor sobre bytes y protege una trama agregando
+ese valor al final (bits de sobrecarga). Las tramas que no ocupan bytes
+completos se rellenan con ceros a la izquierda, igual que el CRC-32.
+
+Códigos registrados:
+    crc32        CRC-32 no reflejado de crc32Emisor (zlib + inversión de bits)
+    crc32c       CRC-32C (Castagnoli); usa el paquete crc32c si está instalado
+    crc16-ccitt  CRC-16/CCITT-FALSE (binascii.crc_hqx)
+    fletcher16   Fletcher-16 (alias: fletcher)
+    fletcher32   Fletcher-32 sobre palabras de 16 bits little-endian
+    adler32      Adler-32 (zlib.adler32)
+"""
+
+import binascii
+import os
+import struct
+import sys
+import zlib
+from array import array
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from bitbuffer import BitBuffer
+from crc32Emisor import crc32_bytes
+
+try:
+    from crc32c import crc32c as _crc32c_nativo
+except ImportError:
+    _crc32c_nativo = None
+
+# Bytes por bloque al calcular Fletcher: limita el tamaño de los enteros
+# intermedios de int.from_bytes
+_BLOQUE_FLETCHER = 1 << 20
+
+class Checksum:
+    """
+    Código de detección: subclases definen nombre, bits y calcular()
+    """
+
+    nombre = None
+    # Bits de sobrecarga que agrega a cada trama
+    bits = 0
+
+    def calcular(self, datos):
+        """Valor del código para un objeto bytes-like"""
+        raise NotImplementedError
+
+    def verificar_bytes(self, datos, valor):
+        """True si valor coincide con el código de datos"""
+        return self.calcular(datos) == valor
+
+    def proteger(self, trama):
+        """Retorna la trama (BitBuffer o cadena '0'/'1') con el código al final"""
+        trama = BitBuffer.convertir(trama)
+        valor = self.calcular(trama.bytes_alineados_derecha())
+        return trama + BitBuffer.desde_entero(valor, self.bits)
+
+    def verificar(self, trama):
+        """
+        Verifica una trama protegida
+        Returns:
+            tuple: (íntegra, datos sin el código) o (False, None)
+        """
+        trama = BitBuffer.convertir(trama)
+        if len(trama) < self.bits:
+            return False, None
+        datos = trama[:len(trama) - self.bits]
+        valor = trama[len(trama) - self.bits:].a_entero()
+        if self.verificar_bytes(datos.bytes_alineados_derecha(), valor):
+            return True, datos
+        return False, None
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.nombre} ({self.bits} bits)>"
+
+class CRC32(Checksum):
+    nombre = 'crc32'
+    bits = 32
+
+    def calcular(self, datos):
+        return crc32_bytes(datos)
+
+def _generar_tablas_reflejadas(polinomio, cantidad=8):
+    """
+    Tablas para slicing-by-N: tablas[k][b] es el CRC de b seguido de k bytes
+    en cero, de modo que N bytes se procesan con N consultas
+    """
+    base = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ polinomio if crc & 1 else crc >> 1
+        base.append(crc)
+    tablas = [tuple(base)]
+    for _ in range(cantidad - 1):
+        anterior = tablas[-1]
+        tablas.append(tuple((c >> 8) ^ base[c & 0xFF] for c in anterior))
+    return tablas
+
+_TABLAS_CRC32C = _generar_tablas_reflejadas(0x82F63B78)
+_PALABRAS_CRC = struct.Struct('<II')
+
+class CRC32C(Checksum):
+    """CRC-32C (polinomio de Castagnoli, reflejado); detecta más errores que CRC-32"""
+
+    nombre = 'crc32c'
+    bits = 32
+
+    def calcular(self, datos):
+        if _crc32c_nativo is not None:
+            return _crc32c_nativo(bytes(datos))
+        datos = memoryview(datos).cast('B')
+        t0, t1, t2, t3, t4, t5, t6, t7 = _TABLAS_CRC32C
+        crc = 0xFFFFFFFF
+        # Slicing-by-8: dos palabras de 32 bits por iteración
+        alineado = len(datos) & ~7
+        for a, b in _PALABRAS_CRC.iter_unpack(datos[:alineado]):
+            crc ^= a
+            crc = (t7[crc & 0xFF] ^ t6[(crc >> 8) & 0xFF] ^ t5[(crc >> 16) & 0xFF] ^ t4[crc >> 24] ^
+                   t3[b & 0xFF] ^ t2[(b >> 8) & 0xFF] ^ t1[(b >> 16) & 0xFF] ^ t0[b >> 24])
+        for byte in datos[alineado:]:
+            crc = t0[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+        return crc ^ 0xFFFFFFFF
+
+class CRC16CCITT(Checksum):
+    nombre = 'crc16-ccitt'
+    bits = 16
+
+    def calcular(self, datos):
+        return binascii.crc_hqx(datos, 0xFFFF)
+
+class Adler32(Checksum):
+    nombre = 'adler32'
+    bits = 32
+
+    def calcular(self, datos):
+        return zlib.adler32(datos)
+
+def _fletcher(datos, formato, modulo):
+    """
+    Sumas de Fletcher (suma, suma de sumas) módulo modulo sobre los valores
+    little-endian de datos ('B' = bytes, 'H' = palabras de 16 bits)
+
+    La suma de sumas de v_0..v_{n-1} es n*S - sum(i*v_i). Como la base
+    B = modulo + 1 cumple B**i = 1 + i*modulo (mod modulo**2), el entero
+    little-endian de los datos vale S + modulo*sum(i*v_i) módulo modulo**2,
+    y ambas sumas salen de int.from_bytes sin recorrer valor por valor.
+    """
+    datos = memoryview(datos).cast('B')
+    ancho = 1 if formato == 'B' else 2
+    cuadrado = modulo * modulo
+    suma1 = suma2 = 0
+    for inicio in range(0, len(datos), _BLOQUE_FLETCHER):
+        bloque = datos[inicio:inicio + _BLOQUE_FLETCHER]
+        if ancho == 1:
+            # sum() recorre un bytes más rápido que una memoryview
+            suma = sum(bytes(bloque))
+        else:
+            valores = array('H')
+            valores.frombytes(bloque[:len(bloque) & ~1])
+            if sys.byteorder == 'big':
+                valores.byteswap()
+            # Último byte impar: palabra completada con un cero
+            suma = sum(valores) + (bloque[-1] if len(bloque) & 1 else 0)
+        n = -(-len(bloque) // ancho)
+        ponderada = ((int.from_bytes(bloque, 'little') - suma) % cuadrado) // modulo
+        # Los valores anteriores al bloque se suman una vez más por cada valor del bloque
+        suma2 = (suma2 + n * suma1 + n * suma - ponderada) % modulo
+        suma1 = (suma1 + suma) % modulo
+    return suma1, suma2
+
+class Fletcher16(Checksum):
+    nombre = 'fletcher16'
+    bits = 16
+
+    def calcular(self, datos):
+        suma1, suma2 = _fletcher(datos, 'B', 255)
+        return (suma2 << 8) | suma1
+
+class Fletcher32(Checksum):
+    nombre = 'fletcher32'
+    bits = 32
+
+    def calcular(self, datos):
+        suma1, suma2 = _fletcher(datos, 'H', 65535)
+        return (suma2 << 16) | suma1
+
+_CODECS = {}
+_ALIAS = {'fletcher': 'fletcher16'}
+
+def registrar(codec):
+    """Registra una instancia de Checksum por su nombre (reemplaza la anterior)"""
+    _CODECS[codec.nombre] = codec
+    return codec
+
+def obtener(nombre):
+    """Retorna el código registrado con ese nombre (o alias)"""
+    try:
+        return _CODECS[_ALIAS.get(nombre, nombre)]
+    except KeyError:
+        raise ValueError(f"Método de detección no soportado: {nombre}") from None
+
+def disponibles():
+    """Nombres registrados (sin alias)"""
+    return tuple(_CODECS)
+
+for _codec in (CRC32(), CRC32C(), CRC16CCITT(), Fletcher16(), Fletcher32(), Adler32()):
+    registrar(_codec)
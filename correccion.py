@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Códigos de corrección compartidos por el emisor y el receptor
+Universidad del Valle de Guatemala - CC3067 Redes
+Resuelve metodo_correccion al código que se aplica sobre la trama ya
+protegida con el código de detección
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    import entrelazado
+    import reedsolomon
+    import adaptativo
+except ImportError:
+    # entrelazado y reedsolomon usan NumPy; sin él solo están 'hamming' y 'none'
+    entrelazado = reedsolomon = adaptativo = None
+
+def codigo_correccion(metodo_deteccion, metodo_correccion, simbolos_paridad=None):
+    """
+    Código que se aplica sobre la trama protegida (CodigoEntrelazado o
+    ReedSolomon), o None para 'hamming', 'none' y 'adaptativo' (que cambia
+    de código trama a trama)
+    """
+    if metodo_correccion in ('hamming', 'none'):
+        return None
+    if entrelazado is None:
+        raise ValueError(f"El método de corrección {metodo_correccion} requiere NumPy")
+    if metodo_deteccion == 'hamming':
+        raise ValueError(f"{metodo_correccion} requiere un código de detección de checksums.py")
+    if metodo_correccion == 'reed-solomon':
+        return reedsolomon.obtener(simbolos_paridad or reedsolomon.SIMBOLOS_PARIDAD)
+    if metodo_correccion == 'adaptativo':
+        return None
+    return entrelazado.obtener(metodo_correccion)
+
+def metodos_correccion():
+    """Valores aceptados para metodo_correccion"""
+    if entrelazado is None:
+        return ('hamming', 'none')
+    return ('hamming', 'none') + entrelazado.disponibles() + ('reed-solomon', 'adaptativo')
@@ -4,70 +4,286 @@ CRC-32 Emisor - Algoritmo de Detección de Errores
 Universidad del Valle de Guatemala - CC3067 Redes
 """
 
-def crc32_table():
-    """Genera la tabla CRC-32 usando el polinomio estándar IEEE 802.3"""
-    # Polinomio CRC-32 IEEE 802.3: 0x04C11DB7
-    polynomial = 0x04C11DB7
+import argparse
+import os
+import sys
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+from multiprocessing import shared_memory
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from bitbuffer import BitBuffer
+import lineas
+from registro import configurar, obtener_logger
+
+log = obtener_logger('crc32')
+
+# Polinomio CRC-32 IEEE 802.3
+POLINOMIO_CRC32 = 0x04C11DB7
+
+# Tamaño de los bloques que se procesan por llamada en CRC32.update
+# (acota la memoria temporal al procesar buffers grandes)
+TAMANO_BLOQUE = 1 << 20
+
+# Tamaño de los bloques que se reparten entre trabajadores en crc32_paralelo
+TAMANO_BLOQUE_PARALELO = 4 << 20
+
+# Polinomio reflejado (el que usa zlib internamente)
+_POLINOMIO_REFLEJADO = 0xEDB88320
+
+def _generar_tabla_crc32():
+    """Genera la tabla CRC-32 (MSB primero) una sola vez al importar el módulo"""
     table = []
     
     for i in range(256):
         crc = i << 24
         for j in range(8):
             if crc & 0x80000000:
-                crc = (crc << 1) ^ polynomial
+                crc = (crc << 1) ^ POLINOMIO_CRC32
             else:
                 crc = crc << 1
             crc &= 0xFFFFFFFF
         table.append(crc)
     
-    return table
+    return tuple(table)
 
-def calculate_crc32(data_bits):
+_TABLA_CRC32 = _generar_tabla_crc32()
+
+# Tabla de traducción que invierte el orden de los bits de cada byte.
+# El CRC-32 de este laboratorio procesa los bits MSB primero (sin reflejar),
+# mientras que zlib implementa la variante reflejada. Reflejando cada byte de
+# entrada y el resultado final se obtiene el mismo valor, aprovechando la
+# implementación en C (slicing-by-N) de zlib.
+_INVERTIR_BITS = bytes(int(format(i, '08b')[::-1], 2) for i in range(256))
+
+def crc32_table():
+    """Genera la tabla CRC-32 usando el polinomio estándar IEEE 802.3"""
+    # La tabla se construye una sola vez; se devuelve una copia
+    return list(_TABLA_CRC32)
+
+def _invertir32(valor):
+    """Invierte el orden de los 32 bits de un entero"""
+    return int.from_bytes(valor.to_bytes(4, 'big').translate(_INVERTIR_BITS), 'little')
+
+def bits_a_bytes(data_bits):
     """
-    Calcula el CRC-32 de una cadena de bits
+    Convierte una cadena de bits a bytes, agregando ceros a la izquierda
+    hasta completar un múltiplo de 8 bits
     Args:
-        data_bits (str): Cadena binaria de datos
+        data_bits (str): Cadena binaria
     Returns:
-        int: Valor CRC-32
+        bytes: Datos empaquetados (big-endian)
     """
-    # Convertir bits a bytes
-    # Agregar padding si es necesario para completar bytes
-    while len(data_bits) % 8 != 0:
-        data_bits = '0' + data_bits
+    if not data_bits:
+        return b''
+    return int(data_bits, 2).to_bytes((len(data_bits) + 7) // 8, 'big')
+
+class CRC32:
+    """
+    Motor CRC-32 incremental (polinomio 0x04C11DB7, MSB primero,
+    valor inicial 0xFFFFFFFF e inversión final)
     
-    # Convertir a bytes
-    data_bytes = []
-    for i in range(0, len(data_bits), 8):
-        byte_str = data_bits[i:i+8]
-        data_bytes.append(int(byte_str, 2))
+    Acepta bytes, bytearray o memoryview y permite calcular el checksum
+    de una trama por partes:
     
-    # Calcular CRC-32
-    table = crc32_table()
-    crc = 0xFFFFFFFF  # Valor inicial
+        crc = CRC32()
+        crc.update(parte1)
+        crc.update(parte2)
+        crc.intdigest()
+    """
+    
+    __slots__ = ('_estado',)
+    
+    def __init__(self, datos=b''):
+        # Estado reflejado en el formato de zlib.crc32
+        self._estado = 0
+        if datos:
+            self.update(datos)
+    
+    def update(self, datos):
+        """Agrega datos (bytes-like) al cálculo"""
+        vista = memoryview(datos).cast('B')
+        estado = self._estado
+        for inicio in range(0, len(vista), TAMANO_BLOQUE):
+            bloque = vista[inicio:inicio + TAMANO_BLOQUE].tobytes()
+            estado = zlib.crc32(bloque.translate(_INVERTIR_BITS), estado)
+        self._estado = estado
+        return self
+    
+    def intdigest(self):
+        """Retorna el CRC-32 acumulado como entero"""
+        return _invertir32(self._estado)
+    
+    def digest(self):
+        """Retorna el CRC-32 acumulado como 4 bytes (big-endian)"""
+        return self.intdigest().to_bytes(4, 'big')
     
-    for byte in data_bytes:
-        tbl_idx = ((crc >> 24) ^ byte) & 0xFF
-        crc = ((crc << 8) ^ table[tbl_idx]) & 0xFFFFFFFF
+    def hexdigest(self):
+        """Retorna el CRC-32 acumulado en hexadecimal"""
+        return format(self.intdigest(), '08x')
     
-    return crc ^ 0xFFFFFFFF  # Inversión final
+    def copy(self):
+        """Retorna una copia independiente del estado actual"""
+        copia = type(self)()
+        copia._estado = self._estado
+        return copia
+
+def crc32_bytes(datos):
+    """
+    Calcula el CRC-32 de datos binarios
+    Args:
+        datos (bytes | bytearray | memoryview): Datos a procesar
+    Returns:
+        int: Valor CRC-32
+    """
+    return CRC32(datos).intdigest()
+
+def _multiplicar_mod_p(a, b):
+    """
+    Producto a*b módulo el polinomio del CRC en GF(2), con los polinomios
+    en la representación reflejada de zlib (x^0 en el bit 31)
+    """
+    m = 1 << 31
+    p = 0
+    while True:
+        if a & m:
+            p ^= b
+            if not a & (m - 1):
+                return p
+        m >>= 1
+        b = (b >> 1) ^ _POLINOMIO_REFLEJADO if b & 1 else b >> 1
+
+def _generar_potencias_x():
+    """x^(2^k) módulo el polinomio, para k = 0..31"""
+    potencias = [1 << 30]  # x^1
+    for _ in range(31):
+        potencias.append(_multiplicar_mod_p(potencias[-1], potencias[-1]))
+    return tuple(potencias)
+
+_POTENCIAS_X = _generar_potencias_x()
+
+def _x_a_la_8n(n):
+    """x^(8n) módulo el polinomio: el operador que avanza el CRC n bytes en cero"""
+    p = 1 << 31  # x^0
+    k = 3
+    while n:
+        if n & 1:
+            p = _multiplicar_mod_p(_POTENCIAS_X[k & 31], p)
+        n >>= 1
+        k += 1
+    return p
+
+def _combinar_reflejado(estado1, estado2, longitud2):
+    """crc32_combine de zlib sobre estados reflejados"""
+    return _multiplicar_mod_p(_x_a_la_8n(longitud2), estado1) ^ estado2
+
+def crc32_combinar(crc1, crc2, longitud2):
+    """
+    CRC-32 de A + B a partir de crc1 = CRC(A), crc2 = CRC(B) y len(B) en bytes,
+    sin volver a recorrer los datos (equivalente a crc32_combine de zlib)
+    
+    Avanzar un CRC sobre n bytes en cero es aplicar una matriz 32x32 sobre
+    GF(2); esa matriz equivale a multiplicar por x^(8n) módulo el polinomio,
+    que se arma con O(log n) productos a partir de x^(2^k) precalculados.
+    """
+    return _invertir32(_combinar_reflejado(_invertir32(crc1), _invertir32(crc2), longitud2))
+
+def _estado_bloque(bloque):
+    # La copia y la inversión de bits (translate) se hacen con el GIL tomado;
+    # solo zlib.crc32 lo libera
+    return zlib.crc32(bytes(bloque).translate(_INVERTIR_BITS))
+
+def _estado_bloque_compartido(nombre, inicio, fin):
+    """Estado reflejado de datos[inicio:fin], leídos de la memoria compartida"""
+    memoria = shared_memory.SharedMemory(name=nombre)
+    try:
+        with memoria.buf[inicio:fin] as bloque:
+            return _estado_bloque(bloque)
+    finally:
+        memoria.close()
+
+def crc32_paralelo(datos, trabajadores=None, tamano_bloque=TAMANO_BLOQUE_PARALELO, ejecutor='procesos'):
+    """
+    Calcula el CRC-32 de un buffer grande repartiendo bloques entre varios
+    núcleos y combinando los CRC parciales; el resultado es idéntico al de
+    crc32_bytes
+    Args:
+        datos (bytes | bytearray | memoryview): Datos a procesar
+        trabajadores: Hilos o procesos (por defecto, los núcleos disponibles)
+        tamano_bloque: Bytes por bloque
+        ejecutor: 'procesos' (los datos se copian una vez a memoria
+            compartida y cada proceso invierte los bits de sus bloques) o
+            'hilos' (la inversión de bits de cada bloque toma el GIL, así
+            que solo zlib corre en paralelo y escala poco)
+    Returns:
+        int: Valor CRC-32
+    """
+    vista = memoryview(datos).cast('B')
+    if len(vista) <= tamano_bloque:
+        return crc32_bytes(vista)
+    if ejecutor not in ('hilos', 'procesos'):
+        raise ValueError(f"Ejecutor no soportado: {ejecutor}")
+    
+    inicios = range(0, len(vista), tamano_bloque)
+    trabajadores = trabajadores or os.cpu_count() or 1
+    if ejecutor == 'hilos':
+        with ThreadPoolExecutor(max_workers=trabajadores) as pool:
+            estados = list(pool.map(_estado_bloque, (vista[i:i + tamano_bloque] for i in inicios)))
+    else:
+        # Una sola copia en el proceso padre en lugar de serializar cada bloque
+        memoria = shared_memory.SharedMemory(create=True, size=len(vista))
+        try:
+            memoria.buf[:len(vista)] = vista
+            finales = (min(i + tamano_bloque, len(vista)) for i in inicios)
+            with ProcessPoolExecutor(max_workers=trabajadores) as pool:
+                estados = list(pool.map(_estado_bloque_compartido, repeat(memoria.name), inicios, finales))
+        finally:
+            memoria.close()
+            memoria.unlink()
+    
+    # Todos los bloques salvo el último tienen el mismo tamaño
+    estado = estados[0]
+    avance = _x_a_la_8n(tamano_bloque)
+    for i, estado_bloque in enumerate(estados[1:], 1):
+        if i == len(estados) - 1:
+            avance = _x_a_la_8n(len(vista) - inicios[-1])
+        estado = _multiplicar_mod_p(avance, estado) ^ estado_bloque
+    return _invertir32(estado)
+
+def calculate_crc32(data_bits):
+    """
+    Calcula el CRC-32 de una cadena de bits
+    Args:
+        data_bits (str | BitBuffer | bytes-like): Cadena binaria de datos,
+            BitBuffer, o datos ya empaquetados en bytes
+    Returns:
+        int: Valor CRC-32
+    """
+    if isinstance(data_bits, str):
+        # Padding a la izquierda hasta completar bytes y conversión en bloque
+        data_bits = bits_a_bytes(data_bits)
+    elif isinstance(data_bits, BitBuffer):
+        data_bits = data_bits.bytes_alineados_derecha()
+    return crc32_bytes(data_bits)
 
 def crc32_sender(message_bits):
     """
     Emisor CRC-32: Agrega el checksum CRC-32 al mensaje
     Args:
-        message_bits (str): Mensaje en binario
+        message_bits (str | BitBuffer): Mensaje en binario
     Returns:
-        str: Mensaje + CRC-32 en binario
+        str | BitBuffer: Mensaje + CRC-32 en binario (mismo tipo que la entrada)
     """
-    print(f"=== CRC-32 EMISOR ===")
-    print(f"Mensaje original: {message_bits}")
-    print(f"Longitud del mensaje: {len(message_bits)} bits")
+    log.debug("=== CRC-32 EMISOR ===")
+    log.debug("Mensaje original: %s", message_bits)
+    log.debug("Longitud del mensaje: %d bits", len(message_bits))
     
     # Asegurar que el mensaje tenga al menos 32 bits
     if len(message_bits) < 32:
         padding_needed = 32 - len(message_bits)
         message_bits = '0' * padding_needed + message_bits
-        print(f"Mensaje con padding: {message_bits}")
+        log.debug("Mensaje con padding: %s", message_bits)
     
     # Calcular CRC-32
     crc_value = calculate_crc32(message_bits)
@@ -76,15 +292,32 @@ def crc32_sender(message_bits):
     # Mensaje final: datos originales + CRC-32
     final_message = message_bits + crc_bits
     
-    print(f"CRC-32 calculado: {crc_value} (decimal)")
-    print(f"CRC-32 en binario: {crc_bits}")
-    print(f"Mensaje final: {final_message}")
-    print(f"Longitud final: {len(final_message)} bits")
+    log.debug("CRC-32 calculado: %d (decimal)", crc_value)
+    log.debug("CRC-32 en binario: %s", crc_bits)
+    log.debug("Mensaje final: %s", final_message)
+    log.debug("Longitud final: %d bits", len(final_message))
     
     return final_message
 
-def main():
+CAMPOS_LOTE = ('linea', 'estado', 'crc32', 'trama', 'error')
+
+def _fila_lote(message_bits):
+    """Resultado compacto de una trama del modo por lotes (misma trama que crc32_sender)"""
+    if len(message_bits) < 32:
+        message_bits = message_bits.zfill(32)
+    crc_value = calculate_crc32(message_bits)
+    return {"estado": "ok", "crc32": format(crc_value, '08x'), "trama": message_bits + format(crc_value, '032b')}
+
+def main(argv=None):
     """Función principal para probar el emisor CRC-32"""
+    parser = argparse.ArgumentParser(description="Emisor CRC-32")
+    lineas.agregar_argumentos(parser)
+    args = parser.parse_args(argv)
+    if args.lote is not None:
+        lineas.informar(lineas.procesar_lineas(_fila_lote, CAMPOS_LOTE, args.lote, args.salida, args.formato))
+        return
+    
+    configurar('debug')
     print("=== EMISOR CRC-32 ===")
     
     while True:
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+CRC-32 Receptor - Algoritmo de Detección de Errores
+Universidad del Valle de Guatemala - CC3067 Redes
+Contraparte en Python de crc32Receptor.js
+"""
+
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from crc32Emisor import CRC32, bits_a_bytes
+from bitbuffer import BitBuffer
+
+# Residuo constante del CRC-32 (MSB primero, con inversión final) calculado
+# sobre datos + CRC. Cualquier trama íntegra produce este valor, por lo que la
+# verificación no necesita separar los datos ni recalcular su CRC.
+CRC32_RESIDUO = 0x38FB2284
+
+class VerificadorCRC32(CRC32):
+    """
+    Verificador CRC-32 por residuo que funciona sobre un flujo de bytes
+
+    Se alimenta con la trama completa (datos seguidos de los 4 bytes del CRC)
+    en tantas partes como se desee y al final se consulta es_valido().
+    """
+
+    __slots__ = ()
+
+    def es_valido(self):
+        """Indica si lo procesado hasta ahora es una trama íntegra"""
+        return self.intdigest() == CRC32_RESIDUO
+
+def crc32_verificar(trama):
+    """
+    Verifica una trama (datos + CRC-32) mediante el residuo
+    Args:
+        trama (str | BitBuffer | bytes-like): Trama en binario, BitBuffer
+            o ya empaquetada en bytes
+    Returns:
+        bool: True si la trama es íntegra
+    """
+    # El padding a la izquierda es el mismo que usó el emisor, ya que
+    # el CRC ocupa exactamente 4 bytes
+    if isinstance(trama, str):
+        trama = bits_a_bytes(trama)
+    elif isinstance(trama, BitBuffer):
+        trama = trama.bytes_alineados_derecha()
+    return VerificadorCRC32(trama).es_valido()
+
+def crc32_receiver(received_message):
+    """
+    Receptor CRC-32: Verifica la integridad del mensaje
+    Args:
+        received_message (str | BitBuffer): Mensaje recibido en binario (datos + CRC-32)
+    Returns:
+        dict: Resultado del procesamiento
+    """
+    if len(received_message) < 32:
+        return {
+            "status": "error",
+            "message": None,
+            "error": True,
+            "details": "Mensaje demasiado corto para contener CRC-32"
+        }
+
+    data_part = received_message[:-32]
+
+    if crc32_verificar(received_message):
+        return {
+            "status": "success",
+            "message": data_part,
+            "error": False
+        }
+
+    return {
+        "status": "error",
+        "message": None,
+        "error": True,
+        "details": "CRC-32 no coincide"
+    }
+
+def main():
+    """Función principal para probar el receptor CRC-32"""
+    print("=== RECEPTOR CRC-32 ===")
+
+    while True:
+        try:
+            message = input("\nIngrese el mensaje recibido (o 'quit' para salir): ").strip()
+
+            if message.lower() == 'quit':
+                break
+
+            # Validar que sea binario
+            if not all(c in '01' for c in message):
+                print("Error: Ingrese solo 0s y 1s")
+                continue
+
+            if len(message) == 0:
+                print("Error: Mensaje vacío")
+                continue
+
+            # Procesar con CRC-32
+            result = crc32_receiver(message)
+            if result["status"] == "success":
+                print("✅ RESULTADO: No se detectaron errores")
+                print(f"Trama original: {result['message']}")
+            else:
+                print(f"❌ RESULTADO: Se detectaron errores - Trama descartada ({result['details']})")
+            print("\n" + "="*50)
+
+        except KeyboardInterrupt:
+            print("\nSaliendo...")
+            break
+        except Exception as e:
+            print(f"Error: {e}")
+
+if __name__ == "__main__":
+    main()
@@ -5,13 +5,32 @@ Universidad del Valle de Guatemala - CC3067 Redes
 Implementa la arquitectura de capas para el emisor
 """
 
-import random
+import argparse
+import asyncio
+import logging
 import sys
 import os
+import time
+from functools import partial
 
 # Importar los algoritmos existentes
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import checksums
 from crc32Emisor import crc32_sender, calculate_crc32
+from hammingEmisor import hamming_sender
+from bitbuffer import BitBuffer
+from archivos import REINTENTOS_ARCHIVO, TAMANO_SEGMENTO_ARCHIVO, LectorArchivo, memoria_maxima_mb, rangos
+from canal import CanalIID, transmitir
+from lotes import TAMANO_LOTE, ejecutar_en_lotes
+from presentacion import CapaPresentacion
+from segmentacion import TAMANO_SEGMENTO, generar_tramas
+from transporte import EmisorTCP, EmisorUDP, ESTADO_ACEPTADA
+from registro import agregar_argumentos, configurar, obtener_logger
+from correccion import adaptativo, codigo_correccion, metodos_correccion
+import metricas
+from metricas import METRICAS, instrumentar
+
+log = obtener_logger('emisor')
 
 class CapaAplicacion:
     """Capa de Aplicación: Interacción con el usuario y manejo de mensajes"""
@@ -19,117 +38,325 @@ class CapaAplicacion:
     def solicitar_mensaje(self):
         """Solicita un mensaje al usuario y lo retorna"""
         mensaje = input("Ingrese un mensaje para enviar: ")
-        print(f"[APLICACIÓN] Mensaje ingresado: '{mensaje}'")
+        log.info("[APLICACIÓN] Mensaje ingresado: '%s'", mensaje)
         return mensaje
         
     def mostrar_mensaje(self, mensaje):
         """Muestra un mensaje al usuario"""
-        print(f"[APLICACIÓN] Mensaje recibido: '{mensaje}'")
-        return mensaje
-
-class CapaPresentacion:
-    """Capa de Presentación: Codificación y decodificación de mensajes"""
-    
-    def codificar_mensaje(self, mensaje):
-        """Codifica un mensaje de texto a binario"""
-        # Convierte cada carácter a su representación binaria de 8 bits
-        mensaje_binario = ''.join(format(ord(c), '08b') for c in mensaje)
-        print(f"[PRESENTACIÓN] Mensaje codificado: {mensaje_binario}")
-        return mensaje_binario
-        
-    def decodificar_mensaje(self, mensaje_binario):
-        """Decodifica un mensaje binario a texto"""
-        # Agrupa los bits en bytes (8 bits) y convierte cada grupo a un carácter
-        mensaje = ""
-        for i in range(0, len(mensaje_binario), 8):
-            byte = mensaje_binario[i:i+8]
-            if len(byte) == 8:  # Asegurarse de que tenemos 8 bits
-                mensaje += chr(int(byte, 2))
-        print(f"[PRESENTACIÓN] Mensaje decodificado: '{mensaje}'")
+        log.info("[APLICACIÓN] Mensaje recibido: '%s'", mensaje)
         return mensaje
 
 class CapaEnlace:
     """Capa de Enlace: Manejo de integridad y corrección de errores"""
     
-    def __init__(self, metodo_deteccion='crc32', metodo_correccion='hamming'):
+    def __init__(self, metodo_deteccion='crc32', metodo_correccion='hamming', simbolos_paridad=None):
         """
         Inicializa la capa de enlace con métodos de detección y corrección
         
         Args:
-            metodo_deteccion: 'crc32' o 'fletcher'
-            metodo_correccion: 'hamming' o 'none'
+            metodo_deteccion: Nombre de un código de checksums.py ('crc32',
+                'crc32c', 'crc16-ccitt', 'fletcher16', 'fletcher32', 'adler32')
+                o 'hamming'
+            metodo_correccion: 'hamming', 'none', un código de entrelazado.py
+                ('hamming74', 'secded84', 'secded72'), 'reed-solomon' o
+                'adaptativo' (elige uno de adaptativo.PERFILES por trama según
+                los reportes del receptor); estos tres últimos tipos se
+                aplican sobre la trama ya protegida con el código de detección
+            simbolos_paridad: Bytes de paridad por bloque de Reed-Solomon
+                (corrige la mitad; por defecto reedsolomon.SIMBOLOS_PARIDAD)
         """
         self.metodo_deteccion = metodo_deteccion
         self.metodo_correccion = metodo_correccion
-        print(f"[ENLACE] Inicializado con detección: {metodo_deteccion}, corrección: {metodo_correccion}")
+        # ValueError si el método no está registrado
+        self.codec = None if metodo_deteccion == 'hamming' else checksums.obtener(metodo_deteccion)
+        self.simbolos_paridad = simbolos_paridad
+        self.fec = codigo_correccion(metodo_deteccion, metodo_correccion, simbolos_paridad)
+        self.selector = adaptativo.SelectorPerfil() if metodo_correccion == 'adaptativo' else None
+        log.info("[ENLACE] Inicializado con detección: %s, corrección: %s", metodo_deteccion, metodo_correccion)
     
+    @instrumentar('enlace.calcular_integridad')
     def calcular_integridad(self, mensaje_binario):
         """Aplica el algoritmo de detección/corrección al mensaje"""
-        print(f"[ENLACE] Calculando integridad con método {self.metodo_deteccion}")
+        log.info("[ENLACE] Calculando integridad con método %s", self.metodo_deteccion)
         
         if self.metodo_deteccion == 'crc32':
             # Usar implementación CRC-32 existente
             mensaje_con_crc = crc32_sender(mensaje_binario)
-            return mensaje_con_crc
+            return self._entrelazar(mensaje_con_crc)
         elif self.metodo_deteccion == 'hamming' and self.metodo_correccion == 'hamming':
             # Para usar Hamming como método de detección y corrección
-            # Importar dinámicamente para evitar problemas de dependencias circulares
             try:
-                # Intentar importar la versión JavaScript a través de una llamada externa
-                import subprocess
-                result = subprocess.run(['node', 'hammingEmisor.js', mensaje_binario], 
-                                      capture_output=True, text=True)
-                mensaje_con_hamming = result.stdout.strip()
-                print(f"[ENLACE] Mensaje con Hamming: {mensaje_con_hamming}")
+                mensaje_con_hamming = hamming_sender(mensaje_binario)
+                log.debug("[ENLACE] Mensaje con Hamming: %s", mensaje_con_hamming)
                 return mensaje_con_hamming
             except Exception as e:
-                print(f"[ENLACE] Error al usar Hamming: {e}")
+                log.warning("[ENLACE] Error al usar Hamming: %s", e)
                 # Si falla, devolver el mensaje original
                 return mensaje_binario
+        elif self.codec is not None:
+            mensaje_protegido = self.codec.proteger(mensaje_binario)
+            log.debug("[ENLACE] Mensaje con %s: %s", self.codec.nombre, mensaje_protegido)
+            return self._entrelazar(mensaje_protegido)
         
         # Si no se especificó un método válido, devolver el mensaje original
-        print("[ENLACE] Método no implementado, devolviendo mensaje sin modificar")
+        log.warning("[ENLACE] Método no implementado, devolviendo mensaje sin modificar")
         return mensaje_binario
+    
+    def _entrelazar(self, trama):
+        """Aplica el código de corrección (si hay) sobre la trama ya protegida"""
+        if self.selector is not None:
+            return self.selector.codificar(trama)
+        if self.fec is None:
+            return trama
+        trama = self.fec.codificar(trama)
+        log.debug("[ENLACE] Mensaje con %s: %d bits", self.fec.nombre, len(trama))
+        return trama
+    
+    def calcular_integridad_batch(self, mensajes, ejecutor='serie', trabajadores=None,
+                                  tamano_lote=TAMANO_LOTE, ordenado=True):
+        """
+        Protege muchas tramas (mismo resultado que calcular_integridad, sin
+        trazas por trama)
+        
+        Args:
+            mensajes: Iterable de tramas (BitBuffer o cadenas '0'/'1')
+            ejecutor: 'serie', 'hilos', 'procesos' o un Executor (ver lotes.py)
+            trabajadores: Tamaño del pool (por defecto, los núcleos)
+            tamano_lote: Tramas por tarea del pool
+            ordenado: True = tramas protegidas en orden; False = pares
+                (índice, trama) a medida que terminan los bloques
+        
+        Returns:
+            Generador con los resultados
+        """
+        log.info("[ENLACE] Calculando integridad por lotes con método %s (%s, lotes de %d)",
+                 self.metodo_deteccion, ejecutor, tamano_lote)
+        if self.selector is not None:
+            # Durante el lote no llegan reportes: todas las tramas con el perfil actual
+            return ejecutar_en_lotes(_proteger_lote_adaptativo, (self.metodo_deteccion, self.selector.actual),
+                                     mensajes, ejecutor, trabajadores, tamano_lote, ordenado)
+        return ejecutar_en_lotes(_proteger_lote,
+                                 (self.metodo_deteccion, self.metodo_correccion, self.simbolos_paridad),
+                                 mensajes, ejecutor, trabajadores, tamano_lote, ordenado)
+    
+    def calcular_integridad_segmentado(self, mensaje_binario, tamano_segmento=TAMANO_SEGMENTO):
+        """
+        Divide el mensaje en segmentos numerados (segmentacion.py) y protege
+        cada uno como una trama aparte, así un error solo descarta su segmento
+        
+        Returns:
+            list: Tramas protegidas en orden de secuencia (el receptor las
+            junta con receptor.reensamblador_de_mensajes)
+        """
+        return list(generar_tramas(mensaje_binario, self, tamano_segmento))
+    
+    def registrar_reporte(self, reporte):
+        """
+        Entrega al modo adaptativo el reporte de una trama: un
+        adaptativo.Reporte (receptor.procesar_trama_con_reporte) o la tupla
+        equivalente que llega en la respuesta de transporte.py
+        """
+        if self.selector is not None and reporte is not None:
+            self.selector.registrar(adaptativo.Reporte(*reporte))
+    
+    def escribir_en_anillo(self, anillo, mensajes, tiempo_espera=None):
+        """
+        Protege las tramas y las escribe en un anillo de memoria compartida
+        (anillo.ProductorAnillo), para un receptor en la misma máquina
+        
+        Returns:
+            int: Número de tramas escritas
+        """
+        escritas = 0
+        for trama in self.calcular_integridad_batch(mensajes):
+            trama = BitBuffer.convertir(trama)
+            anillo.escribir(trama.vista(), len(trama), tiempo_espera)
+            escritas += 1
+        return escritas
+
+def funcion_proteccion(metodo_deteccion, metodo_correccion, simbolos_paridad=None):
+    """Función trama -> trama protegida equivalente a CapaEnlace.calcular_integridad"""
+    if metodo_deteccion == 'hamming' and metodo_correccion == 'hamming':
+        return _hamming_o_sin_modificar
+    if metodo_deteccion == 'hamming':
+        return lambda mensaje: mensaje
+    proteger = crc32_sender if metodo_deteccion == 'crc32' else checksums.obtener(metodo_deteccion).proteger
+    fec = codigo_correccion(metodo_deteccion, metodo_correccion, simbolos_paridad)
+    if fec is None:
+        return proteger
+    return lambda mensaje: fec.codificar(proteger(mensaje))
+
+def _hamming_o_sin_modificar(mensaje):
+    try:
+        return hamming_sender(mensaje)
+    except Exception:
+        return mensaje
+
+def _proteger_lote(metodo_deteccion, metodo_correccion, simbolos_paridad, mensajes):
+    # El código se resuelve una vez por bloque (y por proceso)
+    proteger = funcion_proteccion(metodo_deteccion, metodo_correccion, simbolos_paridad)
+    return [proteger(m) for m in mensajes]
+
+def _proteger_lote_adaptativo(metodo_deteccion, perfil, mensajes):
+    proteger = funcion_proteccion(metodo_deteccion, 'none')
+    return [adaptativo.codificar(perfil, proteger(m)) for m in mensajes]
 
-def simular_ruido(mensaje_binario, tasa_error=0.01):
+@instrumentar('canal', tamano_de=0)
+def simular_ruido(mensaje_binario, tasa_error=0.01, semilla=None, canal=None):
     """
     Simula ruido en el canal alterando bits aleatoriamente
     
     Args:
         mensaje_binario: Mensaje en formato binario
         tasa_error: Probabilidad de que un bit sea alterado (0.01 = 1%)
+        semilla: Semilla del generador para corridas reproducibles
+        canal: Modelo de canal de canal.py (por ejemplo CanalGilbertElliott);
+            si se indica, se ignoran tasa_error y semilla
     
     Returns:
         Mensaje con bits potencialmente alterados
     """
-    mensaje_con_ruido = list(mensaje_binario)
-    bits_alterados = []
-    
-    for i in range(len(mensaje_con_ruido)):
-        if random.random() < tasa_error:
-            # Invertir el bit (0->1, 1->0)
-            bit_original = mensaje_con_ruido[i]
-            mensaje_con_ruido[i] = '1' if mensaje_con_ruido[i] == '0' else '0'
-            bits_alterados.append((i, bit_original, mensaje_con_ruido[i]))
+    if canal is None:
+        canal = CanalIID(tasa_error, semilla)
+    mensaje_con_ruido, bits_alterados = transmitir(mensaje_binario, canal)
+    METRICAS.contar('canal_bits_alterados', len(bits_alterados))
     
     if bits_alterados:
-        print(f"[CANAL] ⚠️ Se alteraron {len(bits_alterados)} bits:")
-        for pos, original, nuevo in bits_alterados:
-            print(f"   - Posición {pos}: {original} → {nuevo}")
+        log.info("[CANAL] ⚠️ Se alteraron %d bits:", len(bits_alterados))
+        if log.isEnabledFor(logging.DEBUG):
+            for pos in bits_alterados:
+                log.debug("   - Posición %d: %s → %s", pos, mensaje_binario[pos], mensaje_con_ruido[pos])
     else:
-        print("[CANAL] No se alteró ningún bit durante la transmisión")
+        log.info("[CANAL] No se alteró ningún bit durante la transmisión")
     
-    return ''.join(mensaje_con_ruido)
+    return mensaje_con_ruido
+
+async def enviar_archivo(enlace, ruta, host, puerto, tamano_segmento=TAMANO_SEGMENTO_ARCHIVO,
+                         reintentos=REINTENTOS_ARCHIVO):
+    """
+    Envía un archivo por TCP (el receptor debe ejecutarse con --salida) y
+    reenvía los segmentos que el receptor descarta
+    
+    Returns:
+        dict: bytes, duración (s), MB/s, tramas descartadas, segmentos
+        reenviados y memoria máxima (MB)
+    Raises:
+        ConnectionError: Si quedan segmentos descartados tras los reintentos
+    """
+    transporte = EmisorTCP(host, puerto, al_reporte=enlace.registrar_reporte)
+    await transporte.conectar()
+    try:
+        with LectorArchivo(ruta, tamano_segmento) as lector:
+            inicio = time.perf_counter()
+            # El descriptor debe llegar antes que los datos
+            estado = await transporte.enviar_y_esperar(enlace.calcular_integridad(lector.descriptor()))
+            if estado != ESTADO_ACEPTADA:
+                raise ConnectionError("El receptor rechazó el descriptor del archivo")
+            descartados = []
+            
+            def al_responder(secuencia, futuro):
+                if not futuro.cancelled() and futuro.exception() is None and futuro.result() != ESTADO_ACEPTADA:
+                    descartados.append(secuencia)
+            
+            async def enviar(secuencia, trama):
+                futuro = await transporte.enviar(trama)
+                futuro.add_done_callback(partial(al_responder, secuencia))
+            
+            # Los segmentos se numeran desde 0 en el orden de lector.tramas()
+            for secuencia, trama in enumerate(enlace.calcular_integridad_batch(lector.tramas())):
+                await enviar(secuencia, trama)
+            await transporte.esperar_pendientes()
+            reenviados = 0
+            for intento in range(reintentos):
+                if not descartados:
+                    break
+                pendientes = sorted(descartados)
+                descartados.clear()
+                log.warning("[ARCHIVO] Reenviando %d segmentos descartados (%s), intento %d",
+                            len(pendientes), rangos(pendientes), intento + 1)
+                reenviados += len(pendientes)
+                for secuencia in pendientes:
+                    await enviar(secuencia, enlace.calcular_integridad(lector.trama(secuencia)))
+                await transporte.esperar_pendientes()
+            if descartados:
+                raise ConnectionError(f"Segmentos descartados tras {reintentos} reintentos: "
+                                      f"{rangos(sorted(descartados))}")
+            duracion = time.perf_counter() - inicio
+            tamano = lector.tamano
+    finally:
+        await transporte.cerrar()
+    return {
+        "bytes": tamano,
+        "duracion": duracion,
+        "mb_por_segundo": tamano / 1e6 / duracion if duracion else 0.0,
+        "descartadas": transporte.estadisticas.descartadas,
+        "reenviados": reenviados,
+        "memoria_maxima_mb": memoria_maxima_mb(),
+    }
 
-def main():
+def main(argv=None):
     """Función principal para probar el emisor con arquitectura de capas"""
+    parser = argparse.ArgumentParser(description="Emisor con arquitectura de capas")
+    parser.add_argument('--puerto', type=int, help="Enviar las tramas al receptor en este puerto")
+    parser.add_argument('--host', default='127.0.0.1', help="Dirección del receptor")
+    parser.add_argument('--udp', action='store_true', help="Usar UDP en lugar de TCP")
+    parser.add_argument('--deteccion', default='crc32', choices=checksums.disponibles() + ('hamming',),
+                        help="Método de detección de la capa de enlace (por defecto crc32)")
+    parser.add_argument('--correccion', default='hamming',
+                        choices=metodos_correccion(),
+                        help="Método de corrección (los códigos entrelazados y Reed-Solomon se aplican "
+                             "sobre --deteccion)")
+    parser.add_argument('--paridad', type=int, metavar='BYTES',
+                        help="Bytes de paridad por bloque de Reed-Solomon (por defecto 16)")
+    parser.add_argument('--archivo', help="Enviar este archivo en lugar de mensajes de texto; requiere --puerto")
+    parser.add_argument('--segmento', type=int,
+                        help=f"Bytes de datos por trama al enviar un archivo (por defecto "
+                             f"{TAMANO_SEGMENTO_ARCHIVO}) o con --segmentar (por defecto {TAMANO_SEGMENTO})")
+    parser.add_argument('--segmentar', action='store_true',
+                        help="Dividir cada mensaje en tramas de --segmento bytes (el receptor también "
+                             "debe usar --segmentar)")
+    agregar_argumentos(parser)
+    metricas.agregar_argumentos(parser)
+    args = parser.parse_args(argv)
+    configurar(args.nivel, args.silencioso)
+    metricas.configurar(args)
+    if args.archivo is not None and (args.puerto is None or args.udp):
+        parser.error("--archivo requiere --puerto y TCP")
+    
     print("=== EMISOR CON ARQUITECTURA DE CAPAS ===")
     
     # Inicializar las capas
     aplicacion = CapaAplicacion()
     presentacion = CapaPresentacion()
     # Por defecto usamos CRC-32 como método de detección
-    enlace = CapaEnlace(metodo_deteccion='crc32')
+    enlace = CapaEnlace(metodo_deteccion=args.deteccion, metodo_correccion=args.correccion,
+                        simbolos_paridad=args.paridad)
+    
+    if args.archivo is not None:
+        try:
+            resultado = asyncio.run(enviar_archivo(enlace, args.archivo, args.host, args.puerto,
+                                                   args.segmento or TAMANO_SEGMENTO_ARCHIVO))
+        except ConnectionError as e:
+            print(f"[EMISOR] ❌ Archivo {args.archivo} no entregado: {e}", file=sys.stderr)
+            metricas.finalizar(args)
+            sys.exit(1)
+        print(f"[EMISOR] Archivo {args.archivo}: {resultado['bytes']} bytes en {resultado['duracion']:.2f} s "
+              f"({resultado['mb_por_segundo']:.1f} MB/s), {resultado['descartadas']} tramas descartadas, "
+              f"{resultado['reenviados']} segmentos reenviados, "
+              f"memoria máxima {resultado['memoria_maxima_mb']:.1f} MB")
+        metricas.finalizar(args)
+        return
+    
+    # Conexión persistente con el receptor (si se indicó un puerto)
+    loop = None
+    transporte = None
+    if args.puerto is not None:
+        loop = asyncio.new_event_loop()
+        # El modo adaptativo elige el perfil con los reportes que vienen en las respuestas
+        transporte = (EmisorUDP if args.udp else EmisorTCP)(args.host, args.puerto,
+                                                            al_reporte=enlace.registrar_reporte)
+        loop.run_until_complete(transporte.conectar())
+        print(f"[EMISOR] Conectado a {args.host}:{args.puerto} ({'UDP' if args.udp else 'TCP'})")
     
     while True:
         try:
@@ -142,27 +369,44 @@ def main():
             # Capa de Presentación - Codificar mensaje
             mensaje_binario = presentacion.codificar_mensaje(mensaje)
             
-            # Capa de Enlace - Calcular integridad
-            mensaje_con_integridad = enlace.calcular_integridad(mensaje_binario)
+            # Capa de Enlace - Calcular integridad (una trama por segmento con --segmentar)
+            if args.segmentar:
+                tramas = enlace.calcular_integridad_segmentado(mensaje_binario, args.segmento or TAMANO_SEGMENTO)
+            else:
+                tramas = [enlace.calcular_integridad(mensaje_binario)]
             
             # Simular canal con ruido
             tasa_error = float(input("Ingrese la tasa de error para el canal (0.0 - 1.0): "))
-            mensaje_transmitido = simular_ruido(mensaje_con_integridad, tasa_error)
+            transmitidas = [simular_ruido(trama, tasa_error) for trama in tramas]
             
             print("\n[EMISOR] Mensaje preparado para transmisión:")
             print(f"   - Original: {mensaje}")
             print(f"   - Codificado: {mensaje_binario}")
-            print(f"   - Con integridad: {mensaje_con_integridad}")
-            print(f"   - Transmitido (con ruido): {mensaje_transmitido}")
-            print("="*50)
+            for mensaje_con_integridad, mensaje_transmitido in zip(tramas, transmitidas):
+                print(f"   - Con integridad: {mensaje_con_integridad}")
+                print(f"   - Transmitido (con ruido): {mensaje_transmitido}")
             
-            # En una implementación real, aquí enviaríamos el mensaje al receptor
+            # Enviar el mensaje al receptor
+            if transporte is not None:
+                estados = [loop.run_until_complete(transporte.enviar_y_esperar(trama)) for trama in transmitidas]
+                aceptadas = sum(estado == ESTADO_ACEPTADA for estado in estados)
+                if len(estados) == 1:
+                    print(f"   - Receptor: {'trama aceptada' if aceptadas else 'trama descartada'}")
+                else:
+                    print(f"   - Receptor: {aceptadas} de {len(estados)} tramas aceptadas")
+            print("="*50)
             
         except KeyboardInterrupt:
             print("\nSaliendo del emisor...")
             break
         except Exception as e:
             print(f"Error: {e}")
+    
+    if transporte is not None:
+        print(f"[EMISOR] Estadísticas: {transporte.estadisticas.resumen()}")
+        loop.run_until_complete(transporte.cerrar())
+        loop.close()
+    metricas.finalizar(args)
             
 if __name__ == "__main__":
     main()
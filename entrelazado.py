@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Entrelazado - Hamming corto con entrelazado de bloque para errores en ráfaga
+Universidad del Valle de Guatemala - CC3067 Redes
+
+hamming_sender protege toda la trama con un solo código, que corrige un
+único bit: cualquier ráfaga de 2 o más errores descarta la trama (o la
+corrige mal). Aquí la trama se divide en muchas palabras cortas y se
+transmiten entrelazadas, columna por columna:
+
+    palabra 0:  a0 a1 a2 ... a(n-1)
+    palabra 1:  b0 b1 b2 ... b(n-1)       se envía  a0 b0 c0 ... a1 b1 c1 ...
+    palabra 2:  c0 c1 c2 ... c(n-1)
+
+Las palabras se guardan como columnas de una matriz (n x B), de modo que
+la trama entrelazada es la matriz recorrida por filas (sin transponer);
+los datos se reparten igual, el bit i va a la palabra i mod B.
+
+Una ráfaga de hasta B bits (B = palabras de la trama) toca cada palabra
+como mucho una vez, y cada palabra corrige su error por separado.
+
+Códigos registrados (metodo_correccion de la capa de enlace):
+    hamming74   Hamming (7,4): corrige 1 bit por palabra
+    secded84    Hamming extendido (8,4): corrige 1 bit y detecta 2
+    secded72    Hamming extendido (72,64): corrige 1 bit y detecta 2
+
+Las posiciones siguen hammingEmisor (paridad en las potencias de 2); los
+códigos extendidos agregan al final la paridad de toda la palabra. Los
+datos se completan hasta un múltiplo de k con un 1 seguido de ceros, así
+el receptor recupera la longitud original sin cabecera. Codificación,
+síndromes y (des)entrelazado se calculan para todas las palabras a la vez
+con NumPy.
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from bitbuffer import BitBuffer
+from hammingLote import columnas_datos, matriz_paridad
+
+class CodigoEntrelazado:
+    """Hamming (n, k) por palabras, con entrelazado de bloque sobre toda la trama"""
+
+    def __init__(self, nombre, n, extendido):
+        """
+        Args:
+            nombre: Nombre del código en el registro
+            n: Longitud del código Hamming (sin la paridad global)
+            extendido: True agrega la paridad global (SECDED)
+        """
+        self.nombre = nombre
+        self.extendido = extendido
+        self._n = n
+        self._H = matriz_paridad(n)
+        self._columnas = columnas_datos(n)
+        self._paridades = (1 << np.arange(self._H.shape[0])) - 1
+        self._H_datos = np.ascontiguousarray(self._H[:, self._columnas])
+        self._pesos = 1 << np.arange(self._H.shape[0], dtype=np.int64)
+        # Bits de datos y bits transmitidos por palabra
+        self.k = len(self._columnas)
+        self.n = n + extendido
+
+    def codificar(self, trama):
+        """
+        Protege una trama (BitBuffer o cadena '0'/'1')
+        Returns:
+            BitBuffer: Palabras codificadas y entrelazadas
+        """
+        trama = BitBuffer.convertir(trama)
+        longitud = len(trama)
+        palabras = longitud // self.k + 1
+        bits = np.zeros(palabras * self.k, dtype=np.uint8)
+        bits[:longitud] = np.unpackbits(np.frombuffer(trama.vista(), dtype=np.uint8))[:longitud]
+        bits[longitud] = 1
+        datos = bits.reshape(self.k, palabras)
+
+        # Una palabra por columna
+        codigo = np.zeros((self.n, palabras), dtype=np.uint8)
+        codigo[self._columnas] = datos
+        codigo[self._paridades] = (self._H_datos @ datos.astype(np.float32)).astype(np.uint8) & 1
+        if self.extendido:
+            codigo[self._n] = codigo[:self._n].sum(axis=0) & 1
+        return BitBuffer(np.packbits(codigo).tobytes(), palabras * self.n)
+
+    def decodificar(self, trama):
+        """
+        Desentrelaza y corrige una trama recibida
+        Returns:
+            tuple: (íntegra, datos, palabras corregidas); (False, None,
+            palabras no corregibles) si alguna palabra tiene más errores
+            de los que el código corrige (o detecta)
+        """
+        trama = BitBuffer.convertir(trama)
+        longitud = len(trama)
+        if not longitud or longitud % self.n:
+            return False, None, 0
+        palabras = longitud // self.n
+        bits = np.unpackbits(np.frombuffer(trama.vista(), dtype=np.uint8))[:longitud]
+        codigo = bits.reshape(self.n, palabras)
+
+        conteos = self._H @ codigo[:self._n].astype(np.float32)
+        sindrome = self._pesos @ (conteos.astype(np.int64) & 1)
+        if self.extendido:
+            impar = (codigo.sum(axis=0) & 1).astype(bool)
+            # Paridad global par con síndrome != 0: dos errores
+            no_corregibles = (~impar & (sindrome != 0)) | (impar & (sindrome > self._n))
+            corregir = impar & (sindrome != 0) & (sindrome <= self._n)
+            # Con síndrome 0 y paridad impar el error está en la paridad global
+            corregidas = int(impar.sum())
+        else:
+            no_corregibles = sindrome > self._n
+            corregir = (sindrome != 0) & ~no_corregibles
+            corregidas = int(corregir.sum())
+        if no_corregibles.any():
+            return False, None, int(no_corregibles.sum())
+        palabras_corregidas = np.flatnonzero(corregir)
+        codigo[sindrome[palabras_corregidas] - 1, palabras_corregidas] ^= 1
+
+        datos = codigo[self._columnas].ravel()
+        # La marca de relleno está en los últimos k bits
+        unos = np.flatnonzero(datos[-self.k:])
+        if not unos.size:
+            return False, None, 0
+        longitud_datos = datos.size - self.k + int(unos[-1])
+        return True, BitBuffer(np.packbits(datos[:longitud_datos]).tobytes(), longitud_datos), corregidas
+
+    def __repr__(self):
+        return f"<CodigoEntrelazado {self.nombre} ({self.n},{self.k})>"
+
+CODIGOS = {
+    'hamming74': CodigoEntrelazado('hamming74', 7, False),
+    'secded84': CodigoEntrelazado('secded84', 7, True),
+    'secded72': CodigoEntrelazado('secded72', 71, True),
+}
+
+def obtener(nombre):
+    """Código entrelazado registrado con ese nombre"""
+    try:
+        return CODIGOS[nombre]
+    except KeyError:
+        raise ValueError(f"Método de corrección no soportado: {nombre}") from None
+
+def disponibles():
+    return tuple(CODIGOS)
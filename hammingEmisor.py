@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Código de Hamming Emisor - Algoritmo de Corrección de Errores
+Universidad del Valle de Guatemala - CC3067 Redes
+Contraparte en Python de hammingEmisor.js
+Implementa código de Hamming (n,m) donde m + r + 1 <= 2^r
+"""
+
+import os
+import sys
+from functools import lru_cache, reduce
+from itertools import compress
+from operator import xor
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from bitbuffer import BitBuffer
+
+# Traduce '0'/'1' a bytes 0/1 para usarlos como selectores
+_BITS_A_SELECTORES = bytes.maketrans(b'01', b'\x00\x01')
+
+def calculate_parity_bits(data_length):
+    """Calcula el número de bits de paridad necesarios"""
+    r = 1
+    while data_length + r + 1 > 2**r:
+        r += 1
+    return r
+
+@lru_cache(maxsize=128)
+def disposicion_hamming(data_length):
+    """
+    Calcula (una sola vez por longitud de datos) la disposición del código
+    Args:
+        data_length (int): Número de bits de datos (m)
+    Returns:
+        tuple: (r, posiciones de datos (1-based), segmentos de datos)
+            donde cada segmento (inicio, fin) es el rango de bits de datos
+            que va justo después de cada bit de paridad
+    """
+    r = calculate_parity_bits(data_length)
+    n = data_length + r
+
+    posiciones = tuple(i for i in range(1, n + 1) if i & (i - 1))
+
+    # Los datos ocupan rangos contiguos entre potencias de 2
+    segmentos = []
+    inicio = 0
+    for k in range(r):
+        parity_pos = 1 << k
+        cantidad = min((parity_pos << 1) - 1, n) - parity_pos
+        segmentos.append((inicio, inicio + cantidad))
+        inicio += cantidad
+
+    return r, posiciones, tuple(segmentos)
+
+@lru_cache(maxsize=128)
+def mascaras_paridad(n):
+    """
+    Máscaras (una sola vez por longitud de código) de las posiciones que
+    cubre cada bit de paridad, como enteros de n bits donde la posición 1
+    es el bit más significativo
+    Args:
+        n (int): Longitud del código Hamming
+    Returns:
+        tuple: Máscara para cada bit de paridad 1, 2, 4, ...
+    """
+    mascaras = []
+    parity_bit = 1
+    while parity_bit <= n:
+        # Patrón de la posición 0 en adelante: parity_bit ceros, parity_bit unos...
+        bloque = '0' * parity_bit + '1' * parity_bit
+        patron = bloque * ((n + 1) // len(bloque) + 1)
+        mascaras.append(int(patron[1:n + 1], 2))
+        parity_bit <<= 1
+    return tuple(mascaras)
+
+def _hamming_sender_buffer(data_bits):
+    """Codifica un BitBuffer operando sobre enteros (sin pasar por texto)"""
+    m = len(data_bits)
+    r, _, segmentos = disposicion_hamming(m)
+    n = m + r
+    datos = data_bits.a_entero()
+
+    codigo = 0
+    for k, (inicio, fin) in enumerate(segmentos):
+        if fin > inicio:
+            tramo = (datos >> (m - fin)) & ((1 << (fin - inicio)) - 1)
+            ultima_posicion = (1 << k) + fin - inicio
+            codigo |= tramo << (n - ultima_posicion)
+
+    # Los bits de paridad aún valen 0, así que no alteran su propia máscara
+    for k, mascara in enumerate(mascaras_paridad(n)):
+        if (codigo & mascara).bit_count() & 1:
+            codigo |= 1 << (n - (1 << k))
+
+    return BitBuffer.desde_entero(codigo, n)
+
+def hamming_sender(data_bits):
+    """
+    Emisor de Hamming: Codifica el mensaje con bits de paridad
+    Args:
+        data_bits (str | BitBuffer): Mensaje en binario
+    Returns:
+        str | BitBuffer: Código Hamming (compatible bit a bit con
+            hammingEmisor.js), del mismo tipo que la entrada
+    """
+    if isinstance(data_bits, BitBuffer):
+        return _hamming_sender_buffer(data_bits)
+
+    r, posiciones, segmentos = disposicion_hamming(len(data_bits))
+
+    # El bit de paridad 2^k es el bit k del XOR de las posiciones de los
+    # datos en 1, así que basta una sola pasada sobre los datos
+    selectores = data_bits.encode('ascii').translate(_BITS_A_SELECTORES)
+    sindrome = reduce(xor, compress(posiciones, selectores), 0)
+
+    partes = []
+    for k, (inicio, fin) in enumerate(segmentos):
+        partes.append('1' if (sindrome >> k) & 1 else '0')
+        partes.append(data_bits[inicio:fin])
+
+    return ''.join(partes)
+
+def main():
+    """Función principal para probar el emisor Hamming"""
+    print("=== EMISOR CÓDIGO DE HAMMING ===")
+
+    while True:
+        try:
+            message = input("\nIngrese la trama en binario (o 'quit' para salir): ").strip()
+
+            if message.lower() == 'quit':
+                break
+
+            # Validar que sea binario
+            if not all(c in '01' for c in message):
+                print("Error: Ingrese solo 0s y 1s")
+                continue
+
+            if len(message) == 0:
+                print("Error: Mensaje vacío")
+                continue
+
+            # Procesar con Hamming
+            r, _, _ = disposicion_hamming(len(message))
+            result = hamming_sender(message)
+            print(f"Bits de datos (m): {len(message)}")
+            print(f"Bits de paridad necesarios (r): {r}")
+            print(f"Longitud total (n): {len(result)}")
+            print(f"\n>>> RESULTADO FINAL: {result}")
+            print("="*50)
+
+        except KeyboardInterrupt:
+            print("\nSaliendo...")
+            break
+        except Exception as e:
+            print(f"Error: {e}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Código de Hamming Receptor por Lotes - Decodificación vectorizada con NumPy
+Universidad del Valle de Guatemala - CC3067 Redes
+Decodifica muchos códigos Hamming de la misma longitud a la vez
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+# Estados por fila (equivalentes al campo "status" de hamming_receiver)
+ESTADO_SUCCESS = 0
+ESTADO_CORRECTED = 1
+ESTADO_ERROR = 2
+
+NOMBRES_ESTADO = ("success", "corrected", "error")
+
+ResultadoLote = namedtuple('ResultadoLote', ['datos', 'estado', 'posicion_error'])
+ResultadoLote.__doc__ = """
+Resultado de hamming_decode_batch
+    datos: matriz (N x m) uint8 con los bits de datos (corregidos)
+    estado: vector (N,) int8 con ESTADO_SUCCESS, ESTADO_CORRECTED o ESTADO_ERROR
+    posicion_error: vector (N,) con el síndrome (posición 1-based, 0 si no hay error)
+"""
+
+@lru_cache(maxsize=64)
+def matriz_paridad(n):
+    """
+    Matriz de verificación de paridad H (r x n) para códigos de longitud n
+    La columna j contiene los bits de la posición j + 1, de modo que
+    H @ c (mod 2) es el síndrome en binario
+    """
+    r = n.bit_length()
+    posiciones = np.arange(1, n + 1)
+    H = ((posiciones[None, :] >> np.arange(r)[:, None]) & 1).astype(np.float32)
+    H.setflags(write=False)
+    return H
+
+@lru_cache(maxsize=64)
+def columnas_datos(n):
+    """Índices 0-based de las columnas de datos (posiciones que no son potencia de 2)"""
+    posiciones = np.arange(1, n + 1)
+    columnas = np.flatnonzero(posiciones & (posiciones - 1))
+    columnas.setflags(write=False)
+    return columnas
+
+def desempaquetar(datos, n):
+    """
+    Convierte bytes empaquetados (cada fila alineada a byte, MSB primero)
+    en una matriz de bits (N x n)
+    """
+    bytes_por_fila = (n + 7) // 8
+    crudo = np.frombuffer(datos, dtype=np.uint8)
+    if crudo.size % bytes_por_fila:
+        raise ValueError(f"El tamaño del buffer no es múltiplo de {bytes_por_fila} bytes por fila")
+    return np.unpackbits(crudo.reshape(-1, bytes_por_fila), axis=1)[:, :n]
+
+def hamming_decode_batch(codigos, n=None):
+    """
+    Decodifica un lote de códigos Hamming de igual longitud
+    Args:
+        codigos: matriz (N x n) de bits 0/1, o bytes-like con las filas
+            empaquetadas (en ese caso se requiere n)
+        n (int): Longitud de cada código (solo para datos empaquetados)
+    Returns:
+        ResultadoLote: datos corregidos, estado y posición de error por fila
+    """
+    if isinstance(codigos, (bytes, bytearray, memoryview)):
+        if n is None:
+            raise ValueError("Se requiere n para decodificar datos empaquetados")
+        matriz = desempaquetar(codigos, n)
+    else:
+        matriz = np.asarray(codigos, dtype=np.uint8)
+        if matriz.ndim != 2:
+            raise ValueError("Se esperaba una matriz (N x n) de bits")
+        n = matriz.shape[1]
+
+    H = matriz_paridad(n)
+
+    # Síndrome como producto matricial: los conteos son enteros exactos en
+    # float32 (n < 2^24), lo que permite usar BLAS
+    conteos = matriz.astype(np.float32) @ H.T
+    bits_sindrome = conteos.astype(np.int64) & 1
+    sindrome = bits_sindrome @ (1 << np.arange(H.shape[0], dtype=np.int64))
+
+    corregible = (sindrome > 0) & (sindrome <= n)
+    filas = np.flatnonzero(corregible)
+
+    # Corregir todas las filas con un solo error mediante indexado vectorizado
+    corregida = matriz.copy() if filas.size else matriz
+    corregida[filas, sindrome[filas] - 1] ^= 1
+
+    estado = np.full(matriz.shape[0], ESTADO_SUCCESS, dtype=np.int8)
+    estado[corregible] = ESTADO_CORRECTED
+    estado[sindrome > n] = ESTADO_ERROR
+
+    return ResultadoLote(corregida[:, columnas_datos(n)], estado, sindrome)
+
+def filas_a_cadenas(matriz):
+    """Convierte una matriz de bits en una lista de cadenas de '0'/'1'"""
+    matriz = np.asarray(matriz, dtype=np.uint8)
+    if matriz.shape[1] == 0:
+        return [''] * matriz.shape[0]
+    texto = (matriz + ord('0')).tobytes().decode('ascii')
+    ancho = matriz.shape[1]
+    return [texto[i:i + ancho] for i in range(0, len(texto), ancho)]
+
+def cadenas_a_filas(codigos):
+    """Convierte una lista de cadenas de '0'/'1' de igual longitud en una matriz de bits"""
+    if not codigos:
+        return np.zeros((0, 0), dtype=np.uint8)
+    crudo = np.frombuffer(''.join(codigos).encode('ascii'), dtype=np.uint8) - ord('0')
+    return crudo.reshape(len(codigos), -1)
@@ -4,6 +4,25 @@ Código de Hamming Receptor - Algoritmo de Corrección de Errores
 Universidad del Valle de Guatemala - CC3067 Redes
 """
 
+import argparse
+import logging
+import os
+import sys
+from functools import lru_cache, reduce
+from itertools import compress
+from operator import xor
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from bitbuffer import BitBuffer
+from hammingEmisor import mascaras_paridad
+import lineas
+from registro import configurar, obtener_logger
+
+log = obtener_logger('hamming')
+
+# Traduce '0'/'1' a bytes 0/1 para usarlos como selectores
+_BITS_A_SELECTORES = bytes.maketrans(b'01', b'\x00\x01')
+
 def is_power_of_two(n):
     """Determina si un número es potencia de 2"""
     return n > 0 and (n & (n - 1)) == 0
@@ -15,104 +34,177 @@ def calculate_parity_bits(data_length):
         r += 1
     return r
 
-def hamming_receiver(received_code):
+@lru_cache(maxsize=64)
+def segmentos_datos(n):
     """
-    Receptor de Hamming: Detecta y corrige errores en código Hamming
+    Índice (cacheado por longitud de código) de los bits de datos
     Args:
-        received_code (str): Código Hamming recibido
+        n (int): Longitud del código Hamming
     Returns:
-        dict: Resultado del procesamiento
+        tuple: Rangos (inicio, fin) 0-based de los bits de datos, que
+            ocupan tramos contiguos entre las posiciones potencia de 2
     """
-    print("=== CÓDIGO DE HAMMING RECEPTOR ===")
-    print(f"Código recibido: {received_code}")
-    print(f"Longitud recibida: {len(received_code)} bits")
-    
-    n = len(received_code)
-    
-    # Convertir a array indexado desde 1
-    hamming_array = [0] + [int(bit) for bit in received_code]
-    
-    print("\nAnálisis de posiciones:")
-    for i in range(1, n + 1):
-        bit_type = "(P)" if is_power_of_two(i) else "(D)"
-        print(f"Posición {i}: {hamming_array[i]} {bit_type}")
-    
-    # Calcular síndrome de error
-    error_position = 0
-    parity_checks = []
-    
-    print("\nVerificación de paridad:")
-    
-    # Verificar cada bit de paridad
+    segmentos = []
     parity_bit = 1
     while parity_bit <= n:
-        parity_value = 0
-        positions_checked = []
-        
-        for i in range(1, n + 1):
-            if (i & parity_bit) != 0:
-                parity_value ^= hamming_array[i]
-                positions_checked.append(i)
-        
-        print(f"Paridad {parity_bit}: posiciones {positions_checked} -> XOR = {parity_value}")
-        parity_checks.append(parity_value)
-        
-        if parity_value != 0:
-            error_position += parity_bit
-        
-        parity_bit *= 2
-    
-    print(f"\nSíndrome de error: {error_position}")
-    
-    # Determinar resultado
+        fin = min((parity_bit << 1) - 1, n)
+        if fin > parity_bit:
+            segmentos.append((parity_bit, fin))
+        parity_bit <<= 1
+    return tuple(segmentos)
+
+def calcular_sindrome(received_code):
+    """
+    Calcula el síndrome en una sola pasada: XOR de las posiciones (1-based)
+    de los bits en 1
+    Args:
+        received_code (str | BitBuffer): Código Hamming recibido
+    Returns:
+        int: Posición del error (0 si no hay error)
+    """
+    if isinstance(received_code, BitBuffer):
+        # Cada bit del síndrome es la paridad de los bits que cubre su máscara
+        codigo = received_code.a_entero()
+        sindrome = 0
+        for k, mascara in enumerate(mascaras_paridad(len(received_code))):
+            sindrome |= ((codigo & mascara).bit_count() & 1) << k
+        return sindrome
+
+    selectores = received_code.encode('ascii').translate(_BITS_A_SELECTORES)
+    if selectores.translate(None, b'\x00\x01'):
+        raise ValueError("El código debe contener solo 0s y 1s")
+    return reduce(xor, compress(range(1, len(received_code) + 1), selectores), 0)
+
+def extraer_datos(code):
+    """Extrae los bits de datos (posiciones que no son potencias de 2)"""
+    if isinstance(code, BitBuffer):
+        n = len(code)
+        codigo = code.a_entero()
+        datos = 0
+        m = 0
+        for inicio, fin in segmentos_datos(n):
+            ancho = fin - inicio
+            datos = (datos << ancho) | ((codigo >> (n - fin)) & ((1 << ancho) - 1))
+            m += ancho
+        return BitBuffer.desde_entero(datos, m)
+    return ''.join([code[inicio:fin] for inicio, fin in segmentos_datos(len(code))])
+
+def hamming_decode(received_code):
+    """
+    Decodifica un código Hamming sin imprimir trazas
+    Args:
+        received_code (str | BitBuffer): Código Hamming recibido
+    Returns:
+        dict: Resultado del procesamiento (mismo formato que hamming_receiver);
+            el mensaje es del mismo tipo que la entrada
+    """
+    n = len(received_code)
+    error_position = calcular_sindrome(received_code)
+
     if error_position == 0:
-        print("✅ RESULTADO: No se detectaron errores")
-        
-        # Extraer datos originales (posiciones que no son potencias de 2)
-        original_data = ""
-        for i in range(1, n + 1):
-            if not is_power_of_two(i):
-                original_data += str(hamming_array[i])
-        
-        print(f"Trama original: {original_data}")
-        
         return {
             "status": "success",
-            "message": original_data,
+            "message": extraer_datos(received_code),
             "error": False,
             "corrected": False
         }
-    
+
+    if error_position > n:
+        # El síndrome apunta fuera del código: hay más de un error
+        return {
+            "status": "error",
+            "message": None,
+            "error": True,
+            "corrected": False,
+            "error_position": error_position
+        }
+
+    # Corregir el error
+    original_bit = int(received_code[error_position - 1])
+    corrected_bit = 1 - original_bit
+    if isinstance(received_code, BitBuffer):
+        corrected_code = received_code.copy()
+        corrected_code.invertir(error_position - 1)
     else:
-        print(f"🔧 RESULTADO: Error detectado y corregido en posición {error_position}")
-        
-        # Corregir el error
-        original_bit = hamming_array[error_position]
-        hamming_array[error_position] = 1 - hamming_array[error_position]
-        corrected_bit = hamming_array[error_position]
-        
-        print(f"Posición {error_position}: {original_bit} -> {corrected_bit}")
+        corrected_code = (received_code[:error_position - 1] + str(corrected_bit) +
+                          received_code[error_position:])
+
+    return {
+        "status": "corrected",
+        "message": extraer_datos(corrected_code),
+        "error": True,
+        "corrected": True,
+        "error_position": error_position,
+        "original_bit": original_bit,
+        "corrected_bit": corrected_bit
+    }
+
+def hamming_receiver(received_code):
+    """
+    Receptor de Hamming: Detecta y corrige errores en código Hamming
+    Args:
+        received_code (str | BitBuffer): Código Hamming recibido
+    Returns:
+        dict: Resultado del procesamiento
+    """
+    n = len(received_code)
+    result = hamming_decode(received_code)
+    error_position = result.get("error_position", 0)
+    
+    # La traza completa cuesta O(n log n); solo se arma si se va a emitir
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("=== CÓDIGO DE HAMMING RECEPTOR ===")
+        log.debug("Código recibido: %s", received_code)
+        log.debug("Longitud recibida: %d bits", n)
         
-        # Extraer datos corregidos
-        corrected_data = ""
+        log.debug("\nAnálisis de posiciones:")
         for i in range(1, n + 1):
-            if not is_power_of_two(i):
-                corrected_data += str(hamming_array[i])
+            bit_type = "(P)" if is_power_of_two(i) else "(D)"
+            log.debug("Posición %d: %s %s", i, received_code[i - 1], bit_type)
         
-        print(f"Trama corregida: {corrected_data}")
+        log.debug("\nVerificación de paridad:")
         
-        return {
-            "status": "corrected",
-            "message": corrected_data,
-            "error": True,
-            "corrected": True,
-            "error_position": error_position,
-            "original_bit": original_bit,
-            "corrected_bit": corrected_bit
-        }
+        # El resultado de cada verificación de paridad es un bit del síndrome
+        parity_bit = 1
+        while parity_bit <= n:
+            positions_checked = [i for i in range(1, n + 1) if i & parity_bit]
+            parity_value = 1 if error_position & parity_bit else 0
+            log.debug("Paridad %d: posiciones %s -> XOR = %d", parity_bit, positions_checked, parity_value)
+            parity_bit *= 2
+        
+        log.debug("\nSíndrome de error: %d", error_position)
+    
+    # Determinar resultado
+    if result["status"] == "success":
+        log.debug("✅ RESULTADO: No se detectaron errores")
+        log.debug("Trama original: %s", result['message'])
+    elif result["status"] == "corrected":
+        log.debug("🔧 RESULTADO: Error detectado y corregido en posición %d", error_position)
+        log.debug("Posición %d: %s -> %s", error_position, result['original_bit'], result['corrected_bit'])
+        log.debug("Trama corregida: %s", result['message'])
+    else:
+        log.warning("❌ RESULTADO: Síndrome %d fuera del código, error no corregible", error_position)
+    
+    return result
+
+CAMPOS_LOTE = ('linea', 'estado', 'posicion_error', 'datos', 'error')
 
-def main():
+def _fila_lote(received_code):
+    """Resultado compacto de un código del modo por lotes"""
+    result = hamming_decode(received_code)
+    return {"estado": result["status"], "posicion_error": result.get("error_position", 0),
+            "datos": result["message"] or ''}
+
+def main(argv=None):
     """Función principal para probar el receptor Hamming"""
+    parser = argparse.ArgumentParser(description="Receptor de código de Hamming")
+    lineas.agregar_argumentos(parser)
+    args = parser.parse_args(argv)
+    if args.lote is not None:
+        lineas.informar(lineas.procesar_lineas(_fila_lote, CAMPOS_LOTE, args.lote, args.salida, args.formato))
+        return
+    
+    configurar('debug')
     print("=== RECEPTOR CÓDIGO DE HAMMING ===")
     
     while True:
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Líneas - Modo por lotes de las herramientas de línea de comandos
+Universidad del Valle de Guatemala - CC3067 Redes
+
+Lee tramas en texto ('0'/'1', una por línea) de la entrada estándar o de un
+archivo con E/S en bloques, y escribe un resultado compacto por línea en
+CSV o JSON lines, para usar los programas dentro de tuberías del shell:
+
+    cat tramas.txt | python hammingReceptor.py --lote - --formato jsonl > resultados.jsonl
+
+Las líneas vacías o con caracteres distintos de 0 y 1 producen una fila con
+estado "error" (el número de línea permite relacionar cada resultado con su
+trama). El resumen final va a la salida de error para no mezclarse con los
+resultados.
+"""
+
+import csv
+import io
+import json
+import sys
+import time
+
+# Bytes de los buffers de lectura y escritura
+TAMANO_BUFFER = 1 << 20
+
+FORMATOS = ('csv', 'jsonl')
+
+def es_binaria(linea):
+    """True si la línea (bytes) no está vacía y solo contiene 0 y 1"""
+    # translate en C elimina los 0 y 1: no debe quedar nada
+    return bool(linea) and not linea.translate(None, b'01')
+
+def abrir_entrada(ruta):
+    """Archivo binario con buffer grande ('-' = entrada estándar)"""
+    if ruta == '-':
+        return sys.stdin.buffer
+    return open(ruta, 'rb', buffering=TAMANO_BUFFER)
+
+def abrir_salida(ruta):
+    """Archivo de texto con buffer grande (None o '-' = salida estándar)"""
+    if ruta is None or ruta == '-':
+        return io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', newline='',
+                                write_through=False, line_buffering=False)
+    return open(ruta, 'w', encoding='utf-8', newline='', buffering=TAMANO_BUFFER)
+
+class EscritorResultados:
+    """Escribe filas (diccionarios con los campos indicados) en CSV o JSON lines"""
+
+    def __init__(self, salida, formato, campos):
+        if formato not in FORMATOS:
+            raise ValueError(f"Formato no soportado: {formato}")
+        self.salida = salida
+        self.campos = campos
+        if formato == 'csv':
+            escritor = csv.writer(salida, lineterminator='\n')
+            escritor.writerow(campos)
+            self.escribir = lambda fila: escritor.writerow([fila.get(c, '') for c in campos])
+        else:
+            codificar = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+            self.escribir = lambda fila: salida.write(codificar(fila) + '\n')
+
+def procesar_lineas(procesar, campos, entrada='-', salida=None, formato='csv'):
+    """
+    Aplica procesar a cada trama válida de la entrada y escribe sus resultados
+    Args:
+        procesar: Función (trama str) -> dict con los campos del resultado
+            (sin 'linea'); puede lanzar ValueError para marcar la trama como error
+        campos: Campos de salida; el primero debe ser 'linea' y debe incluir
+            'estado' y 'error'
+    Returns:
+        dict: tramas, errores, duración (s) y tramas por segundo
+    """
+    archivo_entrada = abrir_entrada(entrada)
+    archivo_salida = abrir_salida(salida)
+    escritor = EscritorResultados(archivo_salida, formato, campos)
+    escribir = escritor.escribir
+    tramas = errores = 0
+    inicio = time.perf_counter()
+    try:
+        for numero, linea in enumerate(archivo_entrada, 1):
+            linea = linea.strip()
+            tramas += 1
+            if not es_binaria(linea):
+                errores += 1
+                motivo = "Mensaje vacío" if not linea else "Ingrese solo 0s y 1s"
+                escribir({"linea": numero, "estado": "error", "error": motivo})
+                continue
+            try:
+                fila = procesar(linea.decode('ascii'))
+            except ValueError as e:
+                errores += 1
+                escribir({"linea": numero, "estado": "error", "error": str(e)})
+                continue
+            escribir({"linea": numero, **fila})
+    finally:
+        archivo_salida.flush()
+        if archivo_entrada is not sys.stdin.buffer:
+            archivo_entrada.close()
+        if salida not in (None, '-'):
+            archivo_salida.close()
+        else:
+            archivo_salida.detach()
+    duracion = time.perf_counter() - inicio
+    return {"tramas": tramas, "errores": errores, "duracion": duracion,
+            "tramas_por_segundo": tramas / duracion if duracion else 0.0}
+
+def agregar_argumentos(parser):
+    """Agrega --lote, --formato y --salida a un argparse.ArgumentParser"""
+    parser.add_argument('--lote', metavar='ARCHIVO', nargs='?', const='-',
+                        help="Procesar una trama por línea de ARCHIVO (o de la entrada estándar "
+                             "si se omite) en lugar del modo interactivo")
+    parser.add_argument('--formato', choices=FORMATOS, default='csv', help="Formato de los resultados")
+    parser.add_argument('--salida', metavar='ARCHIVO', help="Archivo de resultados (por defecto, la salida estándar)")
+
+def informar(resumen):
+    """Resumen del lote en la salida de error"""
+    print(f"[LOTE] {resumen['tramas']} tramas, {resumen['errores']} con error, "
+          f"{resumen['duracion']:.2f} s ({resumen['tramas_por_segundo']:,.0f} tramas/s)", file=sys.stderr)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Lotes - Ejecución de operaciones por trama en bloques, en serie o en un pool
+Universidad del Valle de Guatemala - CC3067 Redes
+
+Las tramas se agrupan en bloques de tamano_lote; cada bloque es una sola
+tarea del pool, de modo que el costo de enviar la tarea (y de preparar el
+código, en el proceso que la ejecuta) se reparte entre todas sus tramas.
+La entrada se consume de forma perezosa: solo hay unos pocos bloques en
+vuelo por trabajador, así que sirve para iterables arbitrariamente largos.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from itertools import islice
+
+TAMANO_LOTE = 256
+
+# Bloques pendientes por trabajador antes de dejar de leer la entrada
+BLOQUES_POR_TRABAJADOR = 2
+
+EJECUTORES = ('serie', 'hilos', 'procesos')
+
+def bloques(elementos, tamano):
+    """Agrupa un iterable en listas de hasta tamano elementos"""
+    iterador = iter(elementos)
+    while True:
+        bloque = list(islice(iterador, tamano))
+        if not bloque:
+            return
+        yield bloque
+
+def ejecutar_en_lotes(funcion, argumentos, elementos, ejecutor='serie', trabajadores=None,
+                      tamano_lote=TAMANO_LOTE, ordenado=True):
+    """
+    Aplica funcion(*argumentos, bloque) a cada bloque de elementos
+    Args:
+        funcion: Función de nivel de módulo (para poder enviarla a otro proceso)
+            que recibe un bloque y retorna una lista con un resultado por elemento
+        ejecutor: 'serie', 'hilos', 'procesos' o un concurrent.futures.Executor
+            ya creado (no se cierra al terminar)
+        trabajadores: Hilos/procesos del pool creado aquí (por defecto, los núcleos)
+        ordenado: True para generar los resultados en el orden de la entrada;
+            False para generar pares (índice, resultado) según terminan los bloques
+    """
+    if ejecutor == 'serie':
+        indice = 0
+        for bloque in bloques(elementos, tamano_lote):
+            for resultado in funcion(*argumentos, bloque):
+                yield resultado if ordenado else (indice, resultado)
+                indice += 1
+        return
+
+    if isinstance(ejecutor, Executor):
+        yield from _ejecutar_en_pool(ejecutor, funcion, argumentos, elementos,
+                                     trabajadores or os.cpu_count() or 1, tamano_lote, ordenado)
+        return
+    if ejecutor not in EJECUTORES:
+        raise ValueError(f"Ejecutor no soportado: {ejecutor}")
+
+    trabajadores = trabajadores or os.cpu_count() or 1
+    clase = ThreadPoolExecutor if ejecutor == 'hilos' else ProcessPoolExecutor
+    with clase(max_workers=trabajadores) as pool:
+        yield from _ejecutar_en_pool(pool, funcion, argumentos, elementos,
+                                     trabajadores, tamano_lote, ordenado)
+
+def _ejecutar_en_pool(pool, funcion, argumentos, elementos, trabajadores, tamano_lote, ordenado):
+    maximo = trabajadores * BLOQUES_POR_TRABAJADOR
+    pendientes = bloques(elementos, tamano_lote)
+    inicio = 0
+
+    if ordenado:
+        en_vuelo = deque()
+        for bloque in pendientes:
+            en_vuelo.append(pool.submit(funcion, *argumentos, bloque))
+            if len(en_vuelo) >= maximo:
+                yield from en_vuelo.popleft().result()
+        while en_vuelo:
+            yield from en_vuelo.popleft().result()
+        return
+
+    en_vuelo = {}
+    agotado = False
+    while True:
+        while not agotado and len(en_vuelo) < maximo:
+            bloque = next(pendientes, None)
+            if bloque is None:
+                agotado = True
+                break
+            en_vuelo[pool.submit(funcion, *argumentos, bloque)] = inicio
+            inicio += len(bloque)
+        if not en_vuelo:
+            return
+        terminados, _ = wait(en_vuelo, return_when=FIRST_COMPLETED)
+        for futuro in terminados:
+            base = en_vuelo.pop(futuro)
+            for desplazamiento, resultado in enumerate(futuro.result()):
+                yield base + desplazamiento, resultado
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Métricas - Instrumentación por etapa del flujo emisor/receptor
+Universidad del Valle de Guatemala - CC3067 Redes
+
+Las etapas (presentación, enlace, canal) se marcan con @instrumentar; mientras
+las métricas están desactivadas (el caso por defecto) la envoltura solo
+consulta un atributo booleano antes de llamar a la función original.
+
+Con las métricas activas se registra por etapa:
+    - Histograma de latencias (cubetas exponenciales, como en Prometheus)
+    - Tramas procesadas y bytes de entrada/salida
+    - Opcionalmente, un perfil de cProfile (uno por hilo; si una etapa
+      perfilada llama a otra, solo perfila la más externa)
+Además las capas cuentan eventos (fallas de CRC-32, correcciones de Hamming,
+bits alterados por el canal). Todo se exporta como JSON o en el formato de
+texto de Prometheus.
+"""
+
+import cProfile
+import functools
+import inspect
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+from bisect import bisect_left
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from bitbuffer import BitBuffer
+
+# Límites superiores de las cubetas: 1 µs, 2 µs, 4 µs, ... ~8.4 s
+LIMITES_CUBETAS = tuple(1e-6 * 2 ** i for i in range(24))
+
+class Histograma:
+    """Histograma de latencias en segundos con cubetas fijas"""
+
+    __slots__ = ('cubetas', 'suma', 'cuenta')
+
+    def __init__(self):
+        # Una cubeta por límite más la de desbordamiento (+Inf)
+        self.cubetas = [0] * (len(LIMITES_CUBETAS) + 1)
+        self.suma = 0.0
+        self.cuenta = 0
+
+    def observar(self, valor):
+        self.cubetas[bisect_left(LIMITES_CUBETAS, valor)] += 1
+        self.suma += valor
+        self.cuenta += 1
+
+    def percentil(self, p):
+        """Estimación del percentil: límite superior de la cubeta que lo contiene"""
+        if not self.cuenta:
+            return None
+        objetivo = -(-p * self.cuenta // 100)
+        acumulado = 0
+        for i, cantidad in enumerate(self.cubetas):
+            acumulado += cantidad
+            if acumulado >= objetivo:
+                return LIMITES_CUBETAS[i] if i < len(LIMITES_CUBETAS) else float('inf')
+        return float('inf')
+
+class _Etapa:
+    __slots__ = ('histograma', 'tramas', 'bytes', 'perfilar', 'perfiles')
+
+    def __init__(self, perfilar=False):
+        self.histograma = Histograma()
+        self.tramas = 0
+        self.bytes = 0
+        self.perfilar = perfilar
+        # cProfile.Profile por hilo (threading.get_ident())
+        self.perfiles = {}
+
+def tamano_bytes(valor):
+    """Bytes que ocupa una trama (BitBuffer, cadena '0'/'1' o bytes-like)"""
+    if isinstance(valor, (BitBuffer, str)):
+        return (len(valor) + 7) // 8
+    if isinstance(valor, (bytes, bytearray, memoryview)):
+        return memoryview(valor).nbytes
+    return 0
+
+class Metricas:
+    """Registro de métricas por etapa y contadores de eventos"""
+
+    def __init__(self):
+        self.activo = False
+        self._etapas = {}
+        self._eventos = {}
+        self._perfilar = frozenset()
+        # El receptor procesa tramas en un pool de hilos
+        self._candado = threading.Lock()
+        # Marca por hilo de que ya hay un perfil activo
+        self._local = threading.local()
+
+    def activar(self, perfilar=()):
+        """
+        Activa el registro
+        Args:
+            perfilar: Nombres de etapas que además se perfilan con cProfile
+        """
+        self._perfilar = frozenset(perfilar)
+        self.activo = True
+
+    def desactivar(self):
+        self.activo = False
+
+    def reiniciar(self):
+        """Descarta todo lo registrado (conserva el estado activo)"""
+        with self._candado:
+            self._etapas.clear()
+            self._eventos.clear()
+
+    def _etapa(self, nombre):
+        etapa = self._etapas.get(nombre)
+        if etapa is None:
+            etapa = self._etapas.setdefault(nombre, _Etapa(nombre in self._perfilar))
+        return etapa
+
+    def _perfil_hilo(self, etapa):
+        """
+        Perfil de la etapa para el hilo actual, o None si no se perfila o si
+        una etapa externa ya está perfilando en este hilo (un segundo
+        cProfile activo en el mismo hilo reemplaza al primero)
+        """
+        if not etapa.perfilar or getattr(self._local, 'perfilando', False):
+            return None
+        hilo = threading.get_ident()
+        perfil = etapa.perfiles.get(hilo)
+        if perfil is None:
+            with self._candado:
+                perfil = etapa.perfiles.setdefault(hilo, cProfile.Profile())
+        return perfil
+
+    def medir(self, nombre, funcion, args, kwargs, tamano_de, parametro=None):
+        """
+        Ejecuta funcion(*args, **kwargs) registrando la etapa; cuenta el
+        tamaño de args[tamano_de], o de kwargs[parametro] si ese argumento
+        llegó por nombre, o del resultado
+        """
+        etapa = self._etapa(nombre)
+        perfil = self._perfil_hilo(etapa)
+        if perfil is not None:
+            self._local.perfilando = True
+            perfil.enable()
+        inicio = time.perf_counter()
+        try:
+            resultado = funcion(*args, **kwargs)
+        finally:
+            duracion = time.perf_counter() - inicio
+            if perfil is not None:
+                perfil.disable()
+                self._local.perfilando = False
+        if tamano_de is not None and tamano_de < len(args):
+            medido = args[tamano_de]
+        else:
+            medido = kwargs.get(parametro, resultado)
+        tamano = tamano_bytes(medido)
+        with self._candado:
+            etapa.histograma.observar(duracion)
+            etapa.tramas += 1
+            etapa.bytes += tamano
+        return resultado
+
+    def contar(self, evento, cantidad=1):
+        """Incrementa un contador de eventos (no hace nada si está desactivado)"""
+        if not self.activo:
+            return
+        with self._candado:
+            self._eventos[evento] = self._eventos.get(evento, 0) + cantidad
+
+    def perfil(self, nombre):
+        """pstats.Stats de una etapa perfilada (todos sus hilos), o None"""
+        etapa = self._etapas.get(nombre)
+        if etapa is None or not etapa.perfiles:
+            return None
+        with self._candado:
+            perfiles = list(etapa.perfiles.values())
+        return pstats.Stats(*perfiles, stream=io.StringIO())
+
+    def resumen(self):
+        """Diccionario con todas las métricas (latencias en milisegundos)"""
+        with self._candado:
+            etapas = {}
+            for nombre, etapa in sorted(self._etapas.items()):
+                h = etapa.histograma
+                etapas[nombre] = {
+                    "tramas": etapa.tramas,
+                    "bytes": etapa.bytes,
+                    "tiempo_total_ms": h.suma * 1000,
+                    "latencia_ms": {
+                        "media": h.suma / h.cuenta * 1000 if h.cuenta else None,
+                        **{f"p{p}": (v * 1000 if v is not None else None)
+                           for p in (50, 90, 99) for v in (h.percentil(p),)},
+                    },
+                    "cubetas": {_formato_limite(i): c for i, c in enumerate(h.cubetas) if c},
+                }
+            return {"etapas": etapas, "eventos": dict(sorted(self._eventos.items()))}
+
+    def exportar_json(self):
+        return json.dumps(self.resumen(), indent=2)
+
+    def exportar_prometheus(self, prefijo='lab2'):
+        """Métricas en el formato de texto de exposición de Prometheus"""
+        lineas = [
+            f"# HELP {prefijo}_etapa_segundos Latencia de cada etapa del flujo",
+            f"# TYPE {prefijo}_etapa_segundos histogram",
+        ]
+        with self._candado:
+            etapas = sorted(self._etapas.items())
+            for nombre, etapa in etapas:
+                h = etapa.histograma
+                acumulado = 0
+                for i, cantidad in enumerate(h.cubetas):
+                    acumulado += cantidad
+                    lineas.append(f'{prefijo}_etapa_segundos_bucket{{etapa="{nombre}",'
+                                  f'le="{_formato_limite(i)}"}} {acumulado}')
+                lineas.append(f'{prefijo}_etapa_segundos_sum{{etapa="{nombre}"}} {h.suma!r}')
+                lineas.append(f'{prefijo}_etapa_segundos_count{{etapa="{nombre}"}} {h.cuenta}')
+
+            for metrica, ayuda, atributo in (("tramas_total", "Tramas procesadas por etapa", 'tramas'),
+                                             ("bytes_total", "Bytes procesados por etapa", 'bytes')):
+                lineas.append(f"# HELP {prefijo}_{metrica} {ayuda}")
+                lineas.append(f"# TYPE {prefijo}_{metrica} counter")
+                for nombre, etapa in etapas:
+                    lineas.append(f'{prefijo}_{metrica}{{etapa="{nombre}"}} {getattr(etapa, atributo)}')
+
+            lineas.append(f"# HELP {prefijo}_eventos_total Eventos de las capas (fallas, correcciones)")
+            lineas.append(f"# TYPE {prefijo}_eventos_total counter")
+            for evento, cantidad in sorted(self._eventos.items()):
+                lineas.append(f'{prefijo}_eventos_total{{evento="{evento}"}} {cantidad}')
+        return "\n".join(lineas) + "\n"
+
+    def guardar(self, ruta):
+        """Escribe las métricas; el formato se elige por la extensión (.prom o JSON)"""
+        contenido = self.exportar_prometheus() if ruta.endswith(('.prom', '.txt')) else self.exportar_json()
+        with open(ruta, 'w') as archivo:
+            archivo.write(contenido)
+
+def _formato_limite(i):
+    return f"{LIMITES_CUBETAS[i]:g}" if i < len(LIMITES_CUBETAS) else "+Inf"
+
+# Instancia compartida por todas las capas del proceso
+METRICAS = Metricas()
+
+def instrumentar(etapa, tamano_de=1):
+    """
+    Decorador que registra una etapa en METRICAS
+    Args:
+        etapa: Nombre de la etapa (por ejemplo 'enlace.calcular_integridad')
+        tamano_de: Índice del argumento cuyo tamaño se cuenta (1 = primer
+            argumento de un método; vale también si se pasa por nombre), o
+            None para usar el resultado
+    """
+    def decorador(funcion):
+        # Nombre del argumento medido, por si se pasa como palabra clave
+        parametro = None if tamano_de is None else list(inspect.signature(funcion).parameters)[tamano_de]
+
+        @functools.wraps(funcion)
+        def envoltura(*args, **kwargs):
+            if not METRICAS.activo:
+                return funcion(*args, **kwargs)
+            return METRICAS.medir(etapa, funcion, args, kwargs, tamano_de, parametro)
+        return envoltura
+    return decorador
+
+def agregar_argumentos(parser):
+    """Agrega --metricas y --perfilar a un argparse.ArgumentParser"""
+    parser.add_argument('--metricas', metavar='ARCHIVO',
+                        help="Guardar métricas por etapa al salir (.prom = Prometheus, otro = JSON)")
+    parser.add_argument('--perfilar', metavar='ETAPA', action='append', default=[],
+                        help="Perfilar una etapa con cProfile (se puede repetir)")
+
+def configurar(args):
+    """Activa METRICAS según los argumentos de la línea de comandos"""
+    if args.metricas or args.perfilar:
+        METRICAS.activar(args.perfilar)
+
+def finalizar(args, lineas_perfil=15):
+    """Guarda las métricas y muestra los perfiles pedidos en la línea de comandos"""
+    if args.metricas:
+        METRICAS.guardar(args.metricas)
+        print(f"[MÉTRICAS] Guardadas en {args.metricas}")
+    for etapa in args.perfilar:
+        estadisticas = METRICAS.perfil(etapa)
+        if estadisticas is None:
+            print(f"[MÉTRICAS] La etapa {etapa} no se ejecutó")
+            continue
+        print(f"[MÉTRICAS] Perfil de {etapa}:")
+        estadisticas.stream = io.StringIO()
+        estadisticas.sort_stats('cumulative').print_stats(lineas_perfil)
+        print(estadisticas.stream.getvalue())
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Capa de Presentación compartida por el emisor y el receptor
+Universidad del Valle de Guatemala - CC3067 Redes
+Codifica el texto en UTF-8 y lo convierte en bloque a BitBuffer
+"""
+
+import codecs
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from bitbuffer import BitBuffer
+from metricas import instrumentar
+from registro import obtener_logger
+
+log = obtener_logger('presentacion')
+
+def codificar_utf8(mensaje):
+    """Codifica un texto a bits (BitBuffer) usando UTF-8"""
+    return BitBuffer(mensaje.encode('utf-8'))
+
+def decodificar_utf8(mensaje_binario):
+    """
+    Decodifica bits UTF-8 a texto
+    Args:
+        mensaje_binario (BitBuffer | str | bytes-like): Bits recibidos
+    Returns:
+        str: Texto; un byte final incompleto se ignora y las secuencias
+            inválidas (por ejemplo, por ruido) se reemplazan por U+FFFD
+    """
+    if isinstance(mensaje_binario, (bytes, bytearray, memoryview)):
+        return codecs.decode(mensaje_binario, 'utf-8', 'replace')
+    mensaje_binario = BitBuffer.convertir(mensaje_binario)
+    bits_completos = len(mensaje_binario) - len(mensaje_binario) % 8
+    if bits_completos != len(mensaje_binario):
+        mensaje_binario = mensaje_binario[:bits_completos]
+    return codecs.decode(mensaje_binario.vista(), 'utf-8', 'replace')
+
+class DecodificadorIncremental:
+    """
+    Decodificador UTF-8 por fragmentos
+
+    Acepta las tramas a medida que llegan; los bits que no completan un byte
+    y las secuencias multibyte partidas entre tramas se guardan hasta recibir
+    el resto.
+    """
+
+    def __init__(self):
+        self._decodificador = codecs.getincrementaldecoder('utf-8')('replace')
+        self._bits_pendientes = BitBuffer()
+
+    def alimentar(self, fragmento, final=False):
+        """
+        Agrega un fragmento y retorna el texto que ya se puede decodificar
+        Args:
+            fragmento (BitBuffer | str | bytes-like): Bits recibidos
+            final (bool): True si es el último fragmento
+        Returns:
+            str: Texto decodificado hasta ahora (sin repetir lo ya retornado)
+        """
+        if isinstance(fragmento, (bytes, bytearray, memoryview)) and not len(self._bits_pendientes):
+            return self._decodificador.decode(fragmento, final)
+
+        bits = self._bits_pendientes + BitBuffer.convertir(fragmento)
+        bits_completos = len(bits) - len(bits) % 8
+        self._bits_pendientes = bits[bits_completos:]
+        datos = bits[:bits_completos].vista() if bits_completos != len(bits) else bits.vista()
+        return self._decodificador.decode(datos, final)
+
+    def reiniciar(self):
+        """Descarta el estado pendiente"""
+        self._decodificador.reset()
+        self._bits_pendientes = BitBuffer()
+
+class CapaPresentacion:
+    """Capa de Presentación: Codificación y decodificación de mensajes"""
+
+    @instrumentar('presentacion.codificar', tamano_de=None)
+    def codificar_mensaje(self, mensaje):
+        """Codifica un mensaje de texto a binario (BitBuffer, UTF-8)"""
+        mensaje_binario = codificar_utf8(mensaje)
+        log.debug("[PRESENTACIÓN] Mensaje codificado: %s", mensaje_binario)
+        return mensaje_binario
+
+    @instrumentar('presentacion.decodificar')
+    def decodificar_mensaje(self, mensaje_binario):
+        """Decodifica un mensaje binario (BitBuffer o cadena) UTF-8 a texto"""
+        mensaje = decodificar_utf8(mensaje_binario)
+        log.info("[PRESENTACIÓN] Mensaje decodificado: '%s'", mensaje)
+        return mensaje
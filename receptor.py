@@ -5,13 +5,31 @@ Universidad del Valle de Guatemala - CC3067 Redes
 Implementa la arquitectura de capas para el receptor
 """
 
+import argparse
+import asyncio
 import sys
 import os
 import subprocess
+import time
+from functools import partial
 
 # Importar los algoritmos existentes
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-from hammingReceptor import hamming_receiver
+import checksums
+from hammingReceptor import hamming_decode
+from crc32Receptor import crc32_receiver
+from archivos import TIEMPO_ESPERA_ARCHIVO, EscritorArchivo, memoria_maxima_mb, rangos
+from bitbuffer import BitBuffer
+from lotes import TAMANO_LOTE, ejecutar_en_lotes
+from presentacion import CapaPresentacion
+from segmentacion import Reensamblador, desenmarcar
+from transporte import ServidorReceptor
+from registro import agregar_argumentos, configurar, obtener_logger
+from correccion import adaptativo, codigo_correccion, metodos_correccion
+import metricas
+from metricas import METRICAS, instrumentar
+
+log = obtener_logger('receptor')
 
 class CapaAplicacion:
     """Capa de Aplicación: Interacción con el usuario y manejo de mensajes"""
@@ -19,115 +37,492 @@ class CapaAplicacion:
     def solicitar_mensaje(self):
         """Solicita un mensaje codificado para recibir"""
         mensaje = input("Ingrese el mensaje codificado recibido: ")
-        print(f"[APLICACIÓN] Mensaje codificado recibido: '{mensaje}'")
+        log.info("[APLICACIÓN] Mensaje codificado recibido: '%s'", mensaje)
         return mensaje
         
     def mostrar_mensaje(self, mensaje):
         """Muestra el mensaje decodificado al usuario"""
-        print(f"[APLICACIÓN] Mensaje final: '{mensaje}'")
-        return mensaje
-
-class CapaPresentacion:
-    """Capa de Presentación: Codificación y decodificación de mensajes"""
-    
-    def codificar_mensaje(self, mensaje):
-        """Codifica un mensaje de texto a binario"""
-        # Convierte cada carácter a su representación binaria de 8 bits
-        mensaje_binario = ''.join(format(ord(c), '08b') for c in mensaje)
-        print(f"[PRESENTACIÓN] Mensaje codificado: {mensaje_binario}")
-        return mensaje_binario
-        
-    def decodificar_mensaje(self, mensaje_binario):
-        """Decodifica un mensaje binario a texto"""
-        # Agrupa los bits en bytes (8 bits) y convierte cada grupo a un carácter
-        mensaje = ""
-        for i in range(0, len(mensaje_binario), 8):
-            byte = mensaje_binario[i:i+8]
-            if len(byte) == 8:  # Asegurarse de que tenemos 8 bits
-                mensaje += chr(int(byte, 2))
-        print(f"[PRESENTACIÓN] Mensaje decodificado: '{mensaje}'")
+        log.info("[APLICACIÓN] Mensaje final: '%s'", mensaje)
         return mensaje
 
 class CapaEnlace:
     """Capa de Enlace: Manejo de integridad y corrección de errores"""
     
-    def __init__(self, metodo_deteccion='crc32', metodo_correccion='hamming'):
+    def __init__(self, metodo_deteccion='crc32', metodo_correccion='hamming', verificar_con_node=False,
+                 simbolos_paridad=None):
         """
         Inicializa la capa de enlace con métodos de detección y corrección
         
         Args:
-            metodo_deteccion: 'crc32' o 'fletcher'
-            metodo_correccion: 'hamming' o 'none'
+            metodo_deteccion: Nombre de un código de checksums.py ('crc32',
+                'crc32c', 'crc16-ccitt', 'fletcher16', 'fletcher32', 'adler32')
+                o 'hamming'
+            metodo_correccion: 'hamming', 'none', un código de entrelazado.py
+                ('hamming74', 'secded84', 'secded72'), 'reed-solomon' o
+                'adaptativo' (el código de cada trama viene en su cabecera);
+                estos tres últimos tipos se aplican sobre la trama ya protegida
+                con el código de detección
+            verificar_con_node: Si es True, además de la verificación en Python
+                se ejecuta crc32Receptor.js para comprobar compatibilidad
+            simbolos_paridad: Bytes de paridad por bloque de Reed-Solomon
+                (corrige la mitad; por defecto reedsolomon.SIMBOLOS_PARIDAD)
         """
         self.metodo_deteccion = metodo_deteccion
         self.metodo_correccion = metodo_correccion
-        print(f"[ENLACE] Inicializado con detección: {metodo_deteccion}, corrección: {metodo_correccion}")
+        self.verificar_con_node = verificar_con_node
+        # ValueError si el método no está registrado
+        self.codec = None if metodo_deteccion == 'hamming' else checksums.obtener(metodo_deteccion)
+        self.simbolos_paridad = simbolos_paridad
+        self.fec = codigo_correccion(metodo_deteccion, metodo_correccion, simbolos_paridad)
+        log.info("[ENLACE] Inicializado con detección: %s, corrección: %s", metodo_deteccion, metodo_correccion)
     
+    @instrumentar('enlace.verificar_integridad')
     def verificar_integridad(self, mensaje_recibido):
         """Verifica la integridad del mensaje recibido"""
-        print(f"[ENLACE] Verificando integridad con método {self.metodo_deteccion}")
+        log.info("[ENLACE] Verificando integridad con método %s", self.metodo_deteccion)
+        
+        if self.metodo_correccion == 'adaptativo':
+            return self._verificar_adaptativo(mensaje_recibido)[:2]
+        
+        if self.fec is not None:
+            # Primero se corrige con el código entrelazado o Reed-Solomon; el
+            # código de detección verifica después el resultado
+            corregible, mensaje_recibido = self.corregir_mensaje(mensaje_recibido)
+            if not corregible:
+                return False, None
         
         if self.metodo_deteccion == 'crc32':
             try:
-                # Llamar al receptor de CRC-32 usando Node.js
-                process = subprocess.run(['node', 'crc32Receptor.js', mensaje_recibido], 
-                                       capture_output=True, text=True)
-                resultado = process.stdout.strip()
+                # Verificación en proceso mediante el residuo del CRC-32
+                resultado = crc32_receiver(mensaje_recibido)
+                integridad_ok = resultado["status"] == "success"
                 
-                if "No se detectaron errores" in resultado:
-                    print("[ENLACE] ✅ CRC-32: Integridad verificada")
-                    # Extraer el mensaje original (sin el CRC)
-                    datos = mensaje_recibido[:-32]  # Quitar los 32 bits del CRC
-                    return True, datos
+                if self.verificar_con_node:
+                    self._comparar_con_node(mensaje_recibido, integridad_ok)
+                
+                if integridad_ok:
+                    log.info("[ENLACE] ✅ CRC-32: Integridad verificada")
+                    # Mensaje original (sin los 32 bits del CRC)
+                    return True, resultado["message"]
                 else:
-                    print("[ENLACE] ❌ CRC-32: Error de integridad detectado")
+                    log.warning("[ENLACE] ❌ CRC-32: Error de integridad detectado")
+                    METRICAS.contar('crc32_fallas')
                     return False, None
                 
             except Exception as e:
-                print(f"[ENLACE] Error al verificar con CRC-32: {e}")
+                log.warning("[ENLACE] Error al verificar con CRC-32: %s", e)
                 return False, None
         
+        if self.codec is not None:
+            integridad_ok, datos = self.codec.verificar(mensaje_recibido)
+            if integridad_ok:
+                log.info("[ENLACE] ✅ %s: Integridad verificada", self.codec.nombre)
+                return True, datos
+            log.warning("[ENLACE] ❌ %s: Error de integridad detectado", self.codec.nombre)
+            METRICAS.contar(f'{self.codec.nombre}_fallas')
+            return False, None
+        
         # Si no se especificó un método válido, asumir que no hay errores
-        print("[ENLACE] Método no implementado, asumiendo mensaje íntegro")
+        log.warning("[ENLACE] Método no implementado, asumiendo mensaje íntegro")
         return True, mensaje_recibido
     
+    def verificar_integridad_batch(self, mensajes, ejecutor='serie', trabajadores=None,
+                                   tamano_lote=TAMANO_LOTE, ordenado=True):
+        """
+        Verifica muchas tramas (mismo resultado que verificar_integridad, sin
+        trazas por trama ni comparación con Node.js)
+        
+        Args:
+            mensajes: Iterable de tramas recibidas
+            ejecutor: 'serie', 'hilos', 'procesos' o un Executor (ver lotes.py)
+            trabajadores: Tamaño del pool (por defecto, los núcleos)
+            tamano_lote: Tramas por tarea del pool
+            ordenado: True = pares (íntegra, datos) en orden; False = pares
+                (índice, (íntegra, datos)) a medida que terminan los bloques
+        
+        Returns:
+            Generador con los resultados
+        """
+        log.info("[ENLACE] Verificando integridad por lotes con método %s (%s, lotes de %d)",
+                 self.metodo_deteccion, ejecutor, tamano_lote)
+        resultados = ejecutar_en_lotes(_verificar_lote,
+                                       (self.metodo_deteccion, self.metodo_correccion, self.simbolos_paridad),
+                                       mensajes, ejecutor, trabajadores, tamano_lote, ordenado)
+        if not METRICAS.activo:
+            return resultados
+        return _contar_fallas(resultados, f'{self.metodo_deteccion}_fallas', ordenado)
+    
+    @instrumentar('enlace.verificar_vista')
+    def verificar_vista(self, vista, longitud_bits):
+        """
+        Verifica una trama empaquetada sin copiarla (por ejemplo, una vista
+        sobre el anillo de memoria compartida)
+        
+        Returns:
+            tuple: (íntegra, vista con los datos, longitud en bits de los
+            datos); (False, None, 0) si la trama no es íntegra
+        """
+        codec = self.codec
+        if codec is None or self.fec is not None or longitud_bits & 7 or codec.bits & 7:
+            # Hamming, código de corrección o tramas que no ocupan bytes completos: ruta con BitBuffer
+            integridad_ok, datos = self.verificar_integridad(BitBuffer(vista, longitud_bits))
+            if not integridad_ok:
+                return False, None, 0
+            datos = BitBuffer.convertir(datos)
+            return True, datos.vista(), len(datos)
+        n = len(vista) - codec.bits // 8
+        if n >= 0 and codec.verificar_bytes(vista[:n], int.from_bytes(vista[n:], 'big')):
+            return True, vista[:n], n * 8
+        METRICAS.contar(f'{codec.nombre}_fallas')
+        return False, None, 0
+    
+    def leer_de_anillo(self, anillo, tiempo_espera=None):
+        """
+        Verifica en el lugar las tramas de un anillo de memoria compartida
+        (anillo.ConsumidorAnillo) hasta que el emisor termina
+        
+        Returns:
+            Generador de (íntegra, vista con los datos, longitud en bits); la
+            vista solo es válida hasta pedir la siguiente trama
+        """
+        log.info("[ENLACE] Leyendo tramas del anillo %s con método %s", anillo.nombre, self.metodo_deteccion)
+        while True:
+            trama = anillo.leer(tiempo_espera)
+            if trama is None:
+                return
+            integridad_ok, datos, longitud_bits = self.verificar_vista(*trama)
+            try:
+                yield integridad_ok, datos, longitud_bits
+            finally:
+                # La memoria compartida no se puede cerrar con vistas vivas
+                if datos is not None:
+                    datos.release()
+    
+    @instrumentar('enlace.verificar_integridad')
+    def verificar_con_reporte(self, mensaje_recibido):
+        """
+        Verifica una trama del modo adaptativo
+        
+        Returns:
+            tuple: (íntegra, datos, adaptativo.Reporte para el emisor); el
+            reporte es None si la cabecera es ilegible. No guarda estado en
+            el enlace, así un mismo enlace atiende a varios clientes a la vez
+        """
+        return self._verificar_adaptativo(mensaje_recibido)
+    
+    def _verificar_adaptativo(self, mensaje_recibido):
+        """Corrige con el perfil de la cabecera y verifica"""
+        verificar = funcion_verificacion(self.metodo_deteccion)
+        integridad_ok, datos, reporte = adaptativo.decodificar(mensaje_recibido, verificar)
+        if reporte is None:
+            log.warning("[ENLACE] ❌ Cabecera adaptativa ilegible")
+            METRICAS.contar('adaptativo_cabeceras_invalidas')
+            return False, None, None
+        perfil = adaptativo.PERFILES[reporte.perfil].nombre
+        if reporte.corregidos:
+            log.info("[ENLACE] 🔧 %s: %d errores corregidos", perfil, reporte.corregidos)
+            METRICAS.contar('adaptativo_correcciones', reporte.corregidos)
+        if not integridad_ok:
+            log.warning("[ENLACE] ❌ Adaptativo (%s): Trama descartada", perfil)
+            METRICAS.contar('adaptativo_fallas')
+            return False, None, reporte
+        log.info("[ENLACE] ✅ Adaptativo (%s): Integridad verificada", perfil)
+        return True, datos, reporte
+    
+    def _comparar_con_node(self, mensaje_recibido, integridad_ok):
+        """Ejecuta crc32Receptor.js y compara su veredicto con el de Python"""
+        try:
+            script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'crc32Receptor.js')
+            # El receptor JS es interactivo: se le envía la trama y luego 'quit'
+            process = subprocess.run(['node', script], input=f"{mensaje_recibido}\nquit\n",
+                                     capture_output=True, text=True)
+            integridad_node = "No se detectaron errores" in process.stdout
+        except Exception as e:
+            log.warning("[ENLACE] No se pudo ejecutar la verificación con Node.js: %s", e)
+            return
+        
+        if integridad_node != integridad_ok:
+            log.warning("[ENLACE] ⚠️ Discrepancia CRC-32: Python=%s, Node.js=%s", integridad_ok, integridad_node)
+        else:
+            log.info("[ENLACE] Verificación con Node.js coincide")
+    
+    @instrumentar('enlace.corregir_mensaje')
     def corregir_mensaje(self, mensaje_con_errores):
         """Corrige errores en el mensaje si es posible"""
-        print(f"[ENLACE] Intentando corregir errores con método {self.metodo_correccion}")
+        log.info("[ENLACE] Intentando corregir errores con método %s", self.metodo_correccion)
+        
+        if self.fec is not None:
+            corregible, mensaje, corregidos = self.fec.decodificar(mensaje_con_errores)
+            if not corregible:
+                log.warning("[ENLACE] ❌ %s: %d bloques no corregibles", self.fec.nombre, corregidos)
+                METRICAS.contar(f'{self.fec.nombre}_no_corregibles')
+                return False, None
+            if corregidos:
+                # Palabras (entrelazado) o bytes (Reed-Solomon) corregidos
+                log.info("[ENLACE] 🔧 %s: %d errores corregidos", self.fec.nombre, corregidos)
+                METRICAS.contar(f'{self.fec.nombre}_correcciones', corregidos)
+            else:
+                log.info("[ENLACE] ✅ %s: No se detectaron errores", self.fec.nombre)
+            return True, mensaje
         
         if self.metodo_correccion == 'hamming':
             try:
                 # Usar la implementación del receptor Hamming
-                resultado = hamming_receiver(mensaje_con_errores)
+                resultado = hamming_decode(mensaje_con_errores)
                 
                 if resultado["status"] == "success":
-                    print("[ENLACE] ✅ Hamming: No se detectaron errores")
+                    log.info("[ENLACE] ✅ Hamming: No se detectaron errores")
                     return True, resultado["message"]
                     
                 elif resultado["status"] == "corrected":
-                    print(f"[ENLACE] 🔧 Hamming: Error corregido en posición {resultado['error_position']}")
+                    log.info("[ENLACE] 🔧 Hamming: Error corregido en posición %d", resultado['error_position'])
+                    METRICAS.contar('hamming_correcciones')
                     return True, resultado["message"]
                     
                 else:
-                    print("[ENLACE] ❌ Hamming: Error no corregible detectado")
+                    log.warning("[ENLACE] ❌ Hamming: Error no corregible detectado")
+                    METRICAS.contar('hamming_no_corregibles')
                     return False, None
                     
             except Exception as e:
-                print(f"[ENLACE] Error al corregir con Hamming: {e}")
+                log.warning("[ENLACE] Error al corregir con Hamming: %s", e)
                 return False, None
                 
         # Si no se especificó un método válido, no podemos corregir
-        print("[ENLACE] Método de corrección no implementado")
+        log.warning("[ENLACE] Método de corrección no implementado")
         return False, None
 
-def main():
+def funcion_verificacion(metodo_deteccion, metodo_correccion='none', simbolos_paridad=None):
+    """Función trama -> (íntegra, datos) equivalente a CapaEnlace.verificar_integridad"""
+    if metodo_deteccion == 'crc32':
+        verificar = _verificar_crc32
+    elif metodo_deteccion == 'hamming':
+        return lambda mensaje: (True, mensaje)
+    else:
+        verificar = checksums.obtener(metodo_deteccion).verificar
+    fec = codigo_correccion(metodo_deteccion, metodo_correccion, simbolos_paridad)
+    if metodo_correccion == 'adaptativo':
+        return lambda mensaje: adaptativo.decodificar(mensaje, verificar)[:2]
+    if fec is None:
+        return verificar
+    
+    def decodificar_y_verificar(mensaje):
+        corregible, mensaje, _ = fec.decodificar(mensaje)
+        return verificar(mensaje) if corregible else (False, None)
+    return decodificar_y_verificar
+
+def _verificar_crc32(mensaje):
+    try:
+        resultado = crc32_receiver(mensaje)
+    except Exception:
+        return False, None
+    if resultado["status"] == "success":
+        return True, resultado["message"]
+    return False, None
+
+def _verificar_lote(metodo_deteccion, metodo_correccion, simbolos_paridad, mensajes):
+    # El código se resuelve una vez por bloque (y por proceso)
+    verificar = funcion_verificacion(metodo_deteccion, metodo_correccion, simbolos_paridad)
+    return [verificar(m) for m in mensajes]
+
+def _contar_fallas(resultados, evento, ordenado):
+    """Cuenta en METRICAS las tramas rechazadas (también las verificadas en otros procesos)"""
+    for resultado in resultados:
+        integridad_ok = resultado[0] if ordenado else resultado[1][0]
+        if not integridad_ok:
+            METRICAS.contar(evento)
+        yield resultado
+
+def procesar_trama(enlace, trama):
+    """
+    Aplica la capa de enlace a una trama recibida
+    
+    Returns:
+        tuple: (aceptada, datos) donde datos es la trama sin la protección
+    """
+    # Verificar integridad del mensaje
+    integridad_ok, mensaje_verificado = enlace.verificar_integridad(trama)
+    
+    if not integridad_ok:
+        return False, None
+    
+    # Corregir solo si el emisor protegió la trama con Hamming
+    # (igual que emisor.CapaEnlace.calcular_integridad)
+    if enlace.metodo_deteccion == 'hamming' and enlace.metodo_correccion == 'hamming':
+        correccion_ok, mensaje_corregido = enlace.corregir_mensaje(mensaje_verificado)
+        if correccion_ok:
+            mensaje_verificado = mensaje_corregido
+    
+    return True, mensaje_verificado
+
+def procesar_trama_con_reporte(enlace, trama):
+    """
+    Como procesar_trama, más el adaptativo.Reporte de la trama para el
+    emisor (None si el enlace no está en modo adaptativo)
+    """
+    if enlace.metodo_correccion == 'adaptativo':
+        return enlace.verificar_con_reporte(trama)
+    return (*procesar_trama(enlace, trama), None)
+
+def reensamblador_de_mensajes(entregar):
+    """
+    Función datos -> None para las tramas ya verificadas de mensajes
+    segmentados (emisor.CapaEnlace.calcular_integridad_segmentado); llama a
+    entregar(bytes) con cada mensaje completo
+    
+    Cada mensaje empieza en la secuencia 0: si llega mientras otro está
+    incompleto, el anterior se descarta. Supone un solo emisor a la vez.
+    """
+    reensamblador = None
+    bloques = []
+    
+    def agregar(datos):
+        nonlocal reensamblador
+        try:
+            secuencia = desenmarcar(datos).secuencia
+        except ValueError:
+            return
+        if reensamblador is None or secuencia == 0:
+            if reensamblador is not None and not reensamblador.completo:
+                log.warning("[ENLACE] ❌ Mensaje segmentado incompleto, faltan los segmentos %s",
+                            reensamblador.faltantes())
+            # Las tramas ya pasaron por la capa de enlace
+            reensamblador = Reensamblador(lambda trama: (True, trama))
+            bloques.clear()
+        bloques.extend(reensamblador.agregar(datos))
+        if reensamblador.completo:
+            entregar(b''.join(bloques))
+            reensamblador = None
+            bloques.clear()
+    
+    return agregar
+
+async def servir(enlace, host, puerto, udp=False, salida=None, tiempo_espera=TIEMPO_ESPERA_ARCHIVO,
+                 segmentado=False, al_escuchar=None):
+    """
+    Recibe tramas de la red y muestra cada mensaje aceptado (reensamblado si
+    segmentado); si se indica salida, escribe el archivo que envía
+    emisor --archivo y termina al completarlo
+    
+    Args:
+        puerto: Puerto de escucha (0 = cualquiera libre)
+        al_escuchar: Función opcional puerto -> None, llamada con el puerto
+            elegido en cuanto el servidor escucha
+    
+    Raises:
+        TimeoutError: Si, ya empezado el archivo, pasan tiempo_espera
+            segundos sin tramas; el mensaje indica los segmentos que faltan
+    """
+    aplicacion = CapaAplicacion()
+    presentacion = CapaPresentacion()
+    escritor = EscritorArchivo(salida) if salida is not None else None
+    completo = asyncio.Event()
+    inicio = None
+    
+    def mostrar(datos):
+        aplicacion.mostrar_mensaje(presentacion.decodificar_mensaje(datos))
+    
+    # Con segmentado llegan segmentos: se muestra cada mensaje al completarse
+    entregar = reensamblador_de_mensajes(lambda datos: mostrar(BitBuffer(datos))) if segmentado else mostrar
+    
+    def al_recibir(datos):
+        if escritor is None:
+            entregar(datos)
+            return
+        nonlocal inicio
+        inicio = inicio or time.perf_counter()
+        escritor.agregar(datos)
+        if escritor.completo:
+            completo.set()
+    
+    servidor = ServidorReceptor(partial(procesar_trama_con_reporte, enlace), host, puerto, udp=udp,
+                                al_recibir=al_recibir)
+    await servidor.iniciar()
+    print(f"[RECEPTOR] Escuchando en {host}:{servidor.puerto} ({'UDP' if udp else 'TCP'})")
+    if al_escuchar is not None:
+        al_escuchar(servidor.puerto)
+    try:
+        if escritor is None:
+            await servidor.servir_para_siempre()
+        else:
+            await _esperar_archivo(completo, escritor, servidor.estadisticas, tiempo_espera)
+            duracion = time.perf_counter() - inicio
+            print(f"[RECEPTOR] Archivo {salida}: {escritor.tamano} bytes en {duracion:.2f} s "
+                  f"({escritor.tamano / 1e6 / duracion if duracion else 0:.1f} MB/s), "
+                  f"{escritor.duplicados} duplicados, memoria máxima {memoria_maxima_mb():.1f} MB")
+    finally:
+        await servidor.cerrar()
+        if escritor is not None:
+            escritor.cerrar()
+        print(f"[RECEPTOR] Estadísticas: {servidor.estadisticas.resumen()}")
+
+async def _esperar_archivo(completo, escritor, estadisticas, tiempo_espera):
+    """Espera el archivo completo mientras sigan llegando tramas"""
+    while not completo.is_set():
+        try:
+            await asyncio.wait_for(completo.wait(), tiempo_espera)
+        except asyncio.TimeoutError:
+            # Antes de la primera trama se espera al emisor indefinidamente
+            ultima = estadisticas.fin
+            if ultima is None or time.perf_counter() - ultima < tiempo_espera:
+                continue
+            if escritor.total_segmentos is None:
+                raise TimeoutError(f"No llegó el descriptor del archivo en {tiempo_espera:g} s")
+            faltantes = escritor.faltantes()
+            raise TimeoutError(f"Sin tramas durante {tiempo_espera:g} s; faltan {len(faltantes)} de "
+                               f"{escritor.total_segmentos} segmentos: {rangos(faltantes)}")
+
+def main(argv=None):
     """Función principal para probar el receptor con arquitectura de capas"""
+    parser = argparse.ArgumentParser(description="Receptor con arquitectura de capas")
+    parser.add_argument('--puerto', type=int,
+                        help="Escuchar tramas en este puerto en lugar de leerlas del teclado (0 = uno libre, "
+                             "que se muestra al empezar)")
+    parser.add_argument('--host', default='127.0.0.1', help="Dirección de escucha")
+    parser.add_argument('--udp', action='store_true', help="Usar UDP en lugar de TCP")
+    parser.add_argument('--deteccion', default='crc32', choices=checksums.disponibles() + ('hamming',),
+                        help="Método de detección de la capa de enlace (por defecto crc32)")
+    parser.add_argument('--correccion', default='hamming',
+                        choices=metodos_correccion(),
+                        help="Método de corrección (los códigos entrelazados y Reed-Solomon se aplican "
+                             "sobre --deteccion)")
+    parser.add_argument('--paridad', type=int, metavar='BYTES',
+                        help="Bytes de paridad por bloque de Reed-Solomon (por defecto 16)")
+    parser.add_argument('--salida', help="Recibir un archivo (emisor --archivo) y escribirlo aquí; requiere --puerto")
+    parser.add_argument('--segmentar', action='store_true',
+                        help="Reensamblar los mensajes que el emisor divide con --segmentar")
+    parser.add_argument('--espera', type=float, default=TIEMPO_ESPERA_ARCHIVO, metavar='S',
+                        help=f"Con --salida, abandonar tras S segundos sin tramas (por defecto {TIEMPO_ESPERA_ARCHIVO:g})")
+    agregar_argumentos(parser)
+    metricas.agregar_argumentos(parser)
+    args = parser.parse_args(argv)
+    configurar(args.nivel, args.silencioso)
+    metricas.configurar(args)
+    if args.salida is not None and (args.puerto is None or args.udp):
+        parser.error("--salida requiere --puerto y TCP")
+    if args.segmentar and args.puerto is None:
+        parser.error("--segmentar requiere --puerto")
+    
     print("=== RECEPTOR CON ARQUITECTURA DE CAPAS ===")
     
     # Inicializar las capas
     aplicacion = CapaAplicacion()
     presentacion = CapaPresentacion()
-    enlace = CapaEnlace(metodo_deteccion='crc32', metodo_correccion='hamming')
+    enlace = CapaEnlace(metodo_deteccion=args.deteccion, metodo_correccion=args.correccion,
+                        simbolos_paridad=args.paridad)
+    
+    if args.puerto is not None:
+        try:
+            asyncio.run(servir(enlace, args.host, args.puerto, args.udp, args.salida, args.espera,
+                               args.segmentar))
+        except KeyboardInterrupt:
+            print("\nSaliendo del receptor...")
+        except TimeoutError as e:
+            print(f"[RECEPTOR] ❌ Archivo {args.salida} incompleto: {e}", file=sys.stderr)
+            metricas.finalizar(args)
+            sys.exit(1)
+        metricas.finalizar(args)
+        return
     
     while True:
         try:
@@ -137,19 +532,15 @@ def main():
             if mensaje_codificado.lower() == 'quit':
                 break
             
-            # Verificar integridad del mensaje
-            integridad_ok, mensaje_verificado = enlace.verificar_integridad(mensaje_codificado)
+            # Convertir la entrada de texto a BitBuffer
+            mensaje_codificado = BitBuffer.desde_cadena(mensaje_codificado.strip())
+            
+            integridad_ok, mensaje_verificado = procesar_trama(enlace, mensaje_codificado)
             
             if not integridad_ok:
                 print("[RECEPTOR] ❌ Mensaje descartado por error de integridad")
                 print("="*50)
                 continue
-                
-            # Si hay errores pero son corregibles, intentar corregir
-            if self.metodo_correccion != 'none':
-                correccion_ok, mensaje_corregido = enlace.corregir_mensaje(mensaje_verificado)
-                if correccion_ok:
-                    mensaje_verificado = mensaje_corregido
             
             # Decodificar el mensaje (convertir de binario a texto)
             mensaje_decodificado = presentacion.decodificar_mensaje(mensaje_verificado)
@@ -168,6 +559,8 @@ def main():
             break
         except Exception as e:
             print(f"Error: {e}")
+    
+    metricas.finalizar(args)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Reed-Solomon - Corrección de varios errores por trama sobre GF(256)
+Universidad del Valle de Guatemala - CC3067 Redes
+
+Código RS(255, 255 - 2t) sistemático con símbolos de 8 bits: con
+simbolos_paridad = 2t bytes de paridad por bloque corrige hasta t bytes
+erróneos en cada bloque, sin importar cuántos bits fallen dentro de cada
+byte (una ráfaga de 8t bits dañada en un solo bloque se recupera).
+
+La trama se completa hasta un byte con un 1 seguido de ceros (así el
+receptor recupera la longitud en bits) y se divide en bloques de
+k = 255 - simbolos_paridad bytes; el último bloque es acortado:
+    [datos (k)] [paridad] [datos (k)] [paridad] ... [datos (<= k)] [paridad]
+
+Aritmética de GF(256) con el polinomio primitivo 0x11D y generador 2,
+mediante tablas de logaritmos/antilogaritmos y una tabla de multiplicación
+de 256 x 256. La paridad (producto por una matriz k x 2t) y los síndromes
+(producto por una matriz de potencias de alfa) se calculan para todos los
+bloques a la vez con NumPy, con tablas por fila de la matriz: cada byte
+del bloque selecciona una fila de 2t productos ya calculados, leída como
+enteros de 64 bits, y las filas se combinan con XOR. Berlekamp-Massey,
+Chien y Forney solo corren para los bloques con síndrome distinto de cero.
+"""
+
+from functools import lru_cache
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from bitbuffer import BitBuffer
+
+POLINOMIO = 0x11D
+LONGITUD_BLOQUE = 255
+SIMBOLOS_PARIDAD = 16
+
+# Bloques que se procesan por operación vectorizada (limita la memoria
+# temporal a unos 2 KB por bloque)
+BLOQUES_POR_PASO = 1024
+
+def _generar_tablas():
+    exp = [0] * 512
+    log = [0] * 256
+    x = 1
+    for i in range(255):
+        exp[i] = x
+        log[x] = i
+        x <<= 1
+        if x & 0x100:
+            x ^= POLINOMIO
+    # Duplicada para sumar logaritmos sin reducir módulo 255
+    for i in range(255, 512):
+        exp[i] = exp[i - 255]
+    return exp, log
+
+EXP, LOG = _generar_tablas()
+
+def _tabla_multiplicacion():
+    exp = np.array(EXP, dtype=np.uint8)
+    log = np.array(LOG, dtype=np.int64)
+    tabla = exp[log[:, None] + log[None, :]]
+    tabla[0, :] = 0
+    tabla[:, 0] = 0
+    tabla.setflags(write=False)
+    return tabla
+
+MULTIPLICACION = _tabla_multiplicacion()
+
+# Aritmética escalar (polinomios con el coeficiente de mayor grado primero)
+
+def _mul(x, y):
+    if x == 0 or y == 0:
+        return 0
+    return EXP[LOG[x] + LOG[y]]
+
+def _div(x, y):
+    if y == 0:
+        raise ZeroDivisionError("División por cero en GF(256)")
+    if x == 0:
+        return 0
+    return EXP[LOG[x] + 255 - LOG[y]]
+
+def _inverso(x):
+    return EXP[255 - LOG[x]]
+
+def _poly_escalar(p, x):
+    return [_mul(c, x) for c in p]
+
+def _poly_sumar(p, q):
+    r = [0] * max(len(p), len(q))
+    for i, c in enumerate(p):
+        r[i + len(r) - len(p)] = c
+    for i, c in enumerate(q):
+        r[i + len(r) - len(q)] ^= c
+    return r
+
+def _poly_mul(p, q):
+    r = [0] * (len(p) + len(q) - 1)
+    for j, b in enumerate(q):
+        if b:
+            for i, a in enumerate(p):
+                if a:
+                    r[i + j] ^= EXP[LOG[a] + LOG[b]]
+    return r
+
+def _poly_evaluar(p, x):
+    y = p[0]
+    for c in p[1:]:
+        y = _mul(y, x) ^ c
+    return y
+
+def _poly_resto(dividendo, divisor):
+    """Resto de la división sintética (divisor mónico)"""
+    resultado = list(dividendo)
+    for i in range(len(dividendo) - len(divisor) + 1):
+        coef = resultado[i]
+        if coef:
+            for j in range(1, len(divisor)):
+                if divisor[j]:
+                    resultado[i + j] ^= _mul(divisor[j], coef)
+    return resultado[-(len(divisor) - 1):]
+
+def _localizador_errores(sindromes, simbolos_paridad):
+    """Berlekamp-Massey: polinomio localizador de errores (o None si hay demasiados)"""
+    localizador = [1]
+    anterior = [1]
+    # sindromes lleva un 0 inicial (ver _corregir_bloque)
+    desplazamiento = len(sindromes) - simbolos_paridad
+    for i in range(simbolos_paridad):
+        K = i + desplazamiento
+        delta = sindromes[K]
+        for j in range(1, len(localizador)):
+            delta ^= _mul(localizador[-(j + 1)], sindromes[K - j])
+        anterior = anterior + [0]
+        if delta:
+            if len(anterior) > len(localizador):
+                nuevo = _poly_escalar(anterior, delta)
+                anterior = _poly_escalar(localizador, _inverso(delta))
+                localizador = nuevo
+            localizador = _poly_sumar(localizador, _poly_escalar(anterior, delta))
+    while localizador and localizador[0] == 0:
+        del localizador[0]
+    if (len(localizador) - 1) * 2 > simbolos_paridad:
+        return None
+    return localizador
+
+_EXP = np.array(EXP[:255], dtype=np.uint8)
+
+def _posiciones_error(localizador, longitud):
+    """Búsqueda de Chien: posiciones de los bytes erróneos (o None si no cuadran)"""
+    # El localizador invertido evaluado en alfa^i para todos los i a la vez
+    grados = np.arange(len(localizador))
+    potencias = _EXP[(np.arange(longitud)[:, None] * grados[None, :]) % 255]
+    valores = np.bitwise_xor.reduce(MULTIPLICACION[np.array(localizador, dtype=np.uint8), potencias], axis=1)
+    posiciones = (longitud - 1 - np.flatnonzero(valores == 0)).tolist()
+    if len(posiciones) != len(localizador) - 1:
+        return None
+    return posiciones
+
+def _corregir_bloque(bloque, sindromes, simbolos_paridad):
+    """
+    Corrige un bloque (lista de bytes) con síndromes distintos de cero
+    Returns:
+        int: Bytes corregidos, o None si el bloque no es corregible
+    """
+    sindromes = [0] + sindromes
+    localizador = _localizador_errores(sindromes, simbolos_paridad)
+    if localizador is None:
+        return None
+    posiciones = _posiciones_error(localizador, len(bloque))
+    if posiciones is None:
+        return None
+
+    # Forney: magnitud de cada error
+    coeficientes = [len(bloque) - 1 - p for p in posiciones]
+    localizador_errata = [1]
+    for i in coeficientes:
+        localizador_errata = _poly_mul(localizador_errata, [EXP[i], 1])
+    evaluador = _poly_resto(_poly_mul(sindromes[::-1], localizador_errata),
+                            [1] + [0] * len(localizador_errata))
+    X = [EXP[i] for i in coeficientes]
+    for i, Xi in enumerate(X):
+        Xi_inv = _inverso(Xi)
+        derivada = 1
+        for j, Xj in enumerate(X):
+            if j != i:
+                derivada = _mul(derivada, 1 ^ _mul(Xi_inv, Xj))
+        if derivada == 0:
+            return None
+        y = _mul(Xi, _poly_evaluar(evaluador, Xi_inv))
+        bloque[posiciones[i]] ^= _div(y, derivada)
+    return len(posiciones)
+
+class _ProductoGF:
+    """Producto (bloques x filas) por una matriz fija (filas x columnas) en GF(256)"""
+
+    def __init__(self, coeficientes):
+        filas, columnas = coeficientes.shape
+        self.columnas = columnas
+        # tabla[v, j] = v * coeficientes[j] (una fila de productos por byte posible)
+        ancho = -(-columnas // 8) * 8
+        tabla = np.zeros((256, filas, ancho), dtype=np.uint8)
+        tabla[:, :, :columnas] = MULTIPLICACION[np.arange(256)[:, None, None], coeficientes[None, :, :]]
+        # Cada fila se lee como enteros de 64 bits: 8 símbolos por XOR
+        self._tabla = tabla.view(np.uint64)
+        self._filas = np.arange(filas)
+
+    def __call__(self, matriz):
+        salida = np.empty((matriz.shape[0], self._tabla.shape[2]), dtype=np.uint64)
+        for inicio in range(0, matriz.shape[0], BLOQUES_POR_PASO):
+            parte = matriz[inicio:inicio + BLOQUES_POR_PASO]
+            salida[inicio:inicio + BLOQUES_POR_PASO] = np.bitwise_xor.reduce(self._tabla[parte, self._filas], axis=1)
+        return salida.view(np.uint8)[:, :self.columnas]
+
+class ReedSolomon:
+    """RS(255, 255 - simbolos_paridad) sobre GF(256), por bloques"""
+
+    nombre = 'reed-solomon'
+
+    def __init__(self, simbolos_paridad=SIMBOLOS_PARIDAD):
+        if not 2 <= simbolos_paridad < LONGITUD_BLOQUE - 1 or simbolos_paridad % 2:
+            raise ValueError("simbolos_paridad debe ser par, entre 2 y 252")
+        self.simbolos_paridad = simbolos_paridad
+        self.k = LONGITUD_BLOQUE - simbolos_paridad
+        self.n = LONGITUD_BLOQUE
+
+        # x^m mod g(x) para m = 2t .. 2t + k - 1: la fila j es la paridad
+        # del bloque con un 1 en el byte j
+        generador = [1]
+        for i in range(simbolos_paridad):
+            generador = _poly_mul(generador, [1, EXP[i]])
+        resto = generador[1:]
+        restos = [resto]
+        for _ in range(self.k - 1):
+            principal = resto[0]
+            resto = resto[1:] + [0]
+            if principal:
+                resto = [c ^ _mul(principal, g) for c, g in zip(resto, generador[1:])]
+            restos.append(resto)
+        self._paridad = _ProductoGF(np.array(restos[::-1], dtype=np.uint8))
+        # Potencias alfa^(i * (n - 1 - j)): el síndrome i es el bloque evaluado en alfa^i
+        exponentes = np.arange(simbolos_paridad)[None, :] * np.arange(self.n - 1, -1, -1)[:, None]
+        self._sindromes = _ProductoGF(_EXP[exponentes % 255])
+
+    def codificar_bytes(self, datos):
+        """Agrega la paridad a cada bloque de k bytes de datos (el último acortado)"""
+        datos = np.frombuffer(datos, dtype=np.uint8)
+        if not datos.size:
+            return b''
+        bloques = -(-datos.size // self.k)
+        ultimo = datos.size - (bloques - 1) * self.k
+        # El bloque acortado se completa con ceros al inicio, que no cambian la paridad
+        matriz = np.zeros((bloques, self.n), dtype=np.uint8)
+        matriz[:-1, :self.k] = datos[:(bloques - 1) * self.k].reshape(-1, self.k)
+        matriz[-1, self.k - ultimo:self.k] = datos[(bloques - 1) * self.k:]
+        matriz[:, self.k:] = self._paridad(matriz[:, :self.k])
+        plano = matriz.ravel()
+        return plano[:-self.n].tobytes() + plano[-self.n + self.k - ultimo:].tobytes()
+
+    def decodificar_bytes(self, recibido):
+        """
+        Corrige los bloques recibidos y retorna los datos
+        Returns:
+            tuple: (corregible, datos, bytes corregidos); (False, None,
+            bloques no corregibles) si algún bloque tiene más de t errores
+        """
+        recibido = np.frombuffer(recibido, dtype=np.uint8)
+        bloques = -(-recibido.size // self.n)
+        ultimo = recibido.size - (bloques - 1) * self.n
+        if not recibido.size or ultimo <= self.simbolos_paridad:
+            return False, None, 0
+        matriz = np.zeros((bloques, self.n), dtype=np.uint8)
+        matriz[:-1] = recibido[:(bloques - 1) * self.n].reshape(-1, self.n)
+        matriz[-1, self.n - ultimo:] = recibido[(bloques - 1) * self.n:]
+
+        sindromes = self._sindromes(matriz)
+        danados = np.flatnonzero(sindromes.any(axis=1))
+        corregidos = no_corregibles = 0
+        for b in danados:
+            # El bloque acortado se corrige sin sus ceros de relleno
+            inicio = self.n - ultimo if b == bloques - 1 else 0
+            bloque = matriz[b, inicio:].tolist()
+            errores = _corregir_bloque(bloque, sindromes[b].tolist(), self.simbolos_paridad)
+            if errores is None:
+                no_corregibles += 1
+                continue
+            matriz[b, inicio:] = bloque
+            corregidos += errores
+        if no_corregibles:
+            return False, None, no_corregibles
+        # Los bloques corregidos deben quedar con síndrome cero
+        if danados.size:
+            invalidos = int(self._sindromes(matriz[danados]).any(axis=1).sum())
+            if invalidos:
+                return False, None, invalidos
+
+        datos = matriz[:, :self.k].ravel()
+        return True, datos[:-self.k].tobytes() + datos[-(ultimo - self.simbolos_paridad):].tobytes(), corregidos
+
+    def codificar(self, trama):
+        """
+        Protege una trama (BitBuffer o cadena '0'/'1')
+        Returns:
+            BitBuffer: Bloques con su paridad
+        """
+        trama = BitBuffer.convertir(trama)
+        datos = bytearray(trama.vista())
+        # Marca de fin: un 1 después del último bit
+        if len(trama) & 7:
+            datos[-1] |= 0x80 >> (len(trama) & 7)
+        else:
+            datos.append(0x80)
+        return BitBuffer(self.codificar_bytes(datos))
+
+    def decodificar(self, trama):
+        """
+        Corrige una trama recibida
+        Returns:
+            tuple: (íntegra, datos, bytes corregidos); (False, None, bloques
+            no corregibles) si algún bloque tiene más errores de los que
+            el código corrige
+        """
+        trama = BitBuffer.convertir(trama)
+        if len(trama) & 7:
+            return False, None, 0
+        corregible, datos, corregidos = self.decodificar_bytes(trama.vista())
+        if not corregible:
+            return False, None, corregidos
+        marca = datos[-1]
+        if not marca:
+            return False, None, 0
+        longitud = len(datos) * 8 - (marca & -marca).bit_length()
+        return True, BitBuffer(datos, longitud), corregidos
+
+    def __repr__(self):
+        return f"<ReedSolomon ({self.n},{self.k})>"
+
+@lru_cache(maxsize=None)
+def obtener(simbolos_paridad=SIMBOLOS_PARIDAD):
+    """Código con esa cantidad de símbolos de paridad (las tablas se calculan una vez)"""
+    return ReedSolomon(simbolos_paridad)
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Registro (logging) con niveles y formato diferido
+Universidad del Valle de Guatemala - CC3067 Redes
+
+Las capas y algoritmos registran sus trazas con logging en lugar de print:
+    - DEBUG: trazas detalladas (posiciones, paridades, bits alterados)
+    - INFO: un mensaje por operación de cada capa
+    - WARNING: errores detectados y situaciones anómalas
+Los argumentos se formatean solo si el mensaje se va a emitir, y el código
+que arma trazas costosas lo protege con logger.isEnabledFor(...).
+
+Si nadie llama a configurar() (por ejemplo, al usar los módulos como
+biblioteca) solo se emiten advertencias; los main() interactivos configuran
+el nivel DEBUG para conservar las trazas de siempre.
+"""
+
+import logging
+import sys
+
+RAIZ = 'lab2'
+
+NIVELES = {
+    'debug': logging.DEBUG,
+    'info': logging.INFO,
+    'warning': logging.WARNING,
+    'error': logging.ERROR,
+}
+
+_manejador = None
+
+def obtener_logger(nombre):
+    """Logger del módulo, dentro de la jerarquía del laboratorio"""
+    return logging.getLogger(f"{RAIZ}.{nombre}")
+
+def configurar(nivel=logging.INFO, silencioso=False, flujo=None):
+    """
+    Configura la salida de las trazas
+    Args:
+        nivel: Nivel mínimo (int de logging o 'debug', 'info', 'warning', 'error')
+        silencioso: Desactiva las trazas del laboratorio (la jerarquía
+            'lab2'); isEnabledFor() retorna False y no se hace ningún trabajo
+            de diagnóstico. Los demás loggers del proceso no se tocan
+        flujo: Destino (por defecto la salida estándar, como los print originales)
+    """
+    global _manejador
+    if isinstance(nivel, str):
+        nivel = NIVELES[nivel.lower()]
+
+    raiz = logging.getLogger(RAIZ)
+    if _manejador is not None:
+        raiz.removeHandler(_manejador)
+    _manejador = logging.StreamHandler(flujo if flujo is not None else sys.stdout)
+    _manejador.setFormatter(logging.Formatter('%(message)s'))
+    raiz.addHandler(_manejador)
+    # Por encima de CRITICAL ningún mensaje de la jerarquía pasa el filtro
+    raiz.setLevel(logging.CRITICAL + 1 if silencioso else nivel)
+    # Los mensajes no se duplican en el logger raíz de la aplicación
+    raiz.propagate = False
+
+def agregar_argumentos(parser):
+    """Agrega --nivel y --silencioso a un argparse.ArgumentParser"""
+    parser.add_argument('--nivel', choices=tuple(NIVELES), default='debug',
+                        help="Nivel de las trazas (por defecto debug)")
+    parser.add_argument('--silencioso', action='store_true',
+                        help="No registrar trazas (sin trabajo de diagnóstico)")
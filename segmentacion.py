@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Segmentación - Etapa entre la capa de presentación y la de enlace
+Universidad del Valle de Guatemala - CC3067 Redes
+
+Divide el mensaje en segmentos de tamaño fijo con número de secuencia y
+protege cada uno por separado, de modo que un error de bit solo descarta
+su trama. Todo el flujo se arma con generadores para procesar entradas
+arbitrariamente grandes con memoria acotada.
+
+Formato de cada trama antes de la protección de la capa de enlace:
+    [secuencia (32 bits)] [banderas (8 bits)] [datos]
+"""
+
+import struct
+import sys
+import os
+from collections import namedtuple
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from bitbuffer import BitBuffer
+
+CABECERA_SEGMENTO = struct.Struct('!IB')
+BANDERA_ULTIMO = 0x01
+
+TAMANO_SEGMENTO = 1024
+
+Segmento = namedtuple('Segmento', ['secuencia', 'ultimo', 'datos'])
+
+def leer_bloques(fuente, tamano=TAMANO_SEGMENTO):
+    """
+    Recorre la fuente en bloques de tamano bytes
+    Args:
+        fuente: bytes-like, BitBuffer, archivo abierto en modo binario
+            (cualquier objeto con read) o iterable de bloques de bytes
+    """
+    if isinstance(fuente, BitBuffer):
+        fuente = fuente.vista()
+    if isinstance(fuente, (bytes, bytearray, memoryview)):
+        vista = memoryview(fuente).cast('B')
+        for inicio in range(0, len(vista), tamano):
+            yield vista[inicio:inicio + tamano]
+        return
+    if hasattr(fuente, 'read'):
+        while True:
+            bloque = fuente.read(tamano)
+            if not bloque:
+                return
+            yield bloque
+        return
+
+    # Iterable de bloques de tamaño arbitrario: se reagrupan en bloques fijos
+    pendiente = bytearray()
+    for bloque in fuente:
+        pendiente += bloque
+        while len(pendiente) >= tamano:
+            yield bytes(pendiente[:tamano])
+            del pendiente[:tamano]
+    if pendiente:
+        yield bytes(pendiente)
+
+def segmentar(fuente, tamano_segmento=TAMANO_SEGMENTO):
+    """
+    Genera los segmentos numerados de la fuente; el último lleva la bandera
+    correspondiente (una fuente vacía produce un único segmento vacío)
+    """
+    secuencia = 0
+    anterior = None
+    for bloque in leer_bloques(fuente, tamano_segmento):
+        if anterior is not None:
+            yield Segmento(secuencia, False, anterior)
+            secuencia += 1
+        anterior = bloque
+    yield Segmento(secuencia, True, anterior if anterior is not None else b'')
+
+def enmarcar(segmento):
+    """Construye los bits de la trama (cabecera + datos) de un segmento"""
+    banderas = BANDERA_ULTIMO if segmento.ultimo else 0
+    return BitBuffer(CABECERA_SEGMENTO.pack(segmento.secuencia, banderas) + segmento.datos)
+
+def desenmarcar(trama):
+    """Recupera el segmento de los bits de una trama ya verificada"""
+    datos = BitBuffer.convertir(trama).tobytes()
+    if len(datos) < CABECERA_SEGMENTO.size:
+        raise ValueError("Trama demasiado corta para contener la cabecera")
+    secuencia, banderas = CABECERA_SEGMENTO.unpack_from(datos)
+    return Segmento(secuencia, bool(banderas & BANDERA_ULTIMO), datos[CABECERA_SEGMENTO.size:])
+
+def generar_tramas(fuente, enlace, tamano_segmento=TAMANO_SEGMENTO):
+    """
+    Flujo completo del emisor: segmenta, enmarca y protege cada trama con
+    la capa de enlace (emisor.CapaEnlace)
+    """
+    for segmento in segmentar(fuente, tamano_segmento):
+        yield enlace.calcular_integridad(enmarcar(segmento))
+
+class Reensamblador:
+    """
+    Reconstruye el mensaje a partir de tramas que pueden llegar
+    desordenadas, duplicadas o dañadas
+    """
+
+    def __init__(self, procesar, max_pendientes=1024):
+        """
+        Args:
+            procesar: Función trama -> (bool, datos) de la capa de enlace,
+                por ejemplo functools.partial(receptor.procesar_trama, enlace)
+            max_pendientes: Máximo de segmentos fuera de orden en memoria
+        """
+        self.procesar = procesar
+        self.max_pendientes = max_pendientes
+        self.siguiente = 0
+        self.ultima_secuencia = None
+        self.descartadas = 0
+        self.duplicadas = 0
+        self._pendientes = {}
+
+    @property
+    def completo(self):
+        """True cuando ya se entregaron todos los segmentos hasta el último"""
+        return self.ultima_secuencia is not None and self.siguiente > self.ultima_secuencia
+
+    def faltantes(self):
+        """Secuencias todavía no recibidas dentro de la ventana conocida"""
+        limite = self.ultima_secuencia + 1 if self.ultima_secuencia is not None else \
+            max(self._pendientes, default=self.siguiente - 1) + 1
+        return [s for s in range(self.siguiente, limite) if s not in self._pendientes]
+
+    def agregar(self, trama):
+        """
+        Procesa una trama recibida
+        Returns:
+            list: Bloques de datos que ya se pueden entregar, en orden
+        """
+        ok, datos = self.procesar(trama)
+        if not ok:
+            self.descartadas += 1
+            return []
+        try:
+            segmento = desenmarcar(datos)
+        except ValueError:
+            self.descartadas += 1
+            return []
+
+        if segmento.secuencia < self.siguiente or segmento.secuencia in self._pendientes:
+            self.duplicadas += 1
+            return []
+        if len(self._pendientes) >= self.max_pendientes and segmento.secuencia != self.siguiente:
+            # Sin espacio para otro segmento fuera de orden: se descarta
+            self.descartadas += 1
+            return []
+
+        if segmento.ultimo:
+            self.ultima_secuencia = segmento.secuencia
+        self._pendientes[segmento.secuencia] = segmento.datos
+
+        entregables = []
+        while self.siguiente in self._pendientes:
+            entregables.append(self._pendientes.pop(self.siguiente))
+            self.siguiente += 1
+        return entregables
+
+def reensamblar(tramas, procesar, max_pendientes=1024):
+    """
+    Flujo completo del receptor: genera los bloques de datos en orden
+    a medida que se pueden entregar
+    """
+    reensamblador = Reensamblador(procesar, max_pendientes)
+    for trama in tramas:
+        yield from reensamblador.agregar(trama)
+        if reensamblador.completo:
+            return
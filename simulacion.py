@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Simulación Monte Carlo - Comparación de CRC-32 y Hamming en un canal con ruido
+Universidad del Valle de Guatemala - CC3067 Redes
+
+Barre tasas de error, tamaños de trama y métodos (codificar -> canal ->
+verificar/corregir) sin interacción, repartiendo el trabajo entre todos los
+núcleos con un pool de procesos. Cada bloque de tramas usa su propio
+generador derivado de (semilla, configuración, bloque), por lo que los
+conteos son idénticos para una misma semilla sin importar cuántos procesos
+se usen.
+
+Uso:
+    python simulacion.py --tasas 1e-4,1e-3 --tamanos 64,512 --tramas 1000000 \\
+        --semilla 1 --formato csv --salida resultados.csv
+"""
+
+import argparse
+import csv
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from bitbuffer import BitBuffer
+from canal import CanalIID, transmitir
+from crc32Emisor import calculate_crc32
+from crc32Receptor import crc32_verificar
+from hammingEmisor import hamming_sender
+from hammingReceptor import hamming_decode
+
+METODOS = ('crc32', 'hamming')
+
+TRAMAS_POR_BLOQUE = 20000
+
+CAMPOS = ('metodo', 'tasa_error', 'tamano_bits', 'tramas', 'tramas_con_error',
+          'entregadas_correctas', 'corregidas', 'detectadas', 'no_detectadas',
+          'tasa_error_residual', 'tasa_no_detectada', 'tasa_correccion',
+          'tramas_por_segundo')
+
+def _proteger_crc32(datos):
+    return datos + BitBuffer.desde_entero(calculate_crc32(datos), 32)
+
+def _recibir_crc32(trama):
+    """Retorna (datos entregados o None, hubo corrección)"""
+    if crc32_verificar(trama):
+        return trama[:-32], False
+    return None, False
+
+def _recibir_hamming(trama):
+    resultado = hamming_decode(trama)
+    if resultado["status"] == "error":
+        return None, False
+    return resultado["message"], resultado["status"] == "corrected"
+
+CODECS = {
+    'crc32': (_proteger_crc32, _recibir_crc32),
+    'hamming': (hamming_sender, _recibir_hamming),
+}
+
+def simular_bloque(metodo, tasa_error, tamano_bits, tramas, semilla, bloque):
+    """
+    Simula un bloque de tramas (se ejecuta en un proceso del pool)
+    Returns:
+        dict: Conteos del bloque y tiempo de CPU empleado
+    """
+    proteger, recibir = CODECS[metodo]
+    clave = f"{semilla}:{metodo}:{tasa_error!r}:{tamano_bits}:{bloque}"
+    rng = random.Random("datos:" + clave)
+    canal = CanalIID(tasa_error, semilla="canal:" + clave)
+
+    conteo = dict.fromkeys(('tramas', 'tramas_con_error', 'entregadas_correctas',
+                            'corregidas', 'detectadas', 'no_detectadas'), 0)
+    inicio = time.process_time()
+    for _ in range(tramas):
+        datos = BitBuffer.desde_entero(rng.getrandbits(tamano_bits), tamano_bits)
+        recibida, errores = transmitir(proteger(datos), canal)
+        entregados, corregida = recibir(recibida)
+
+        conteo['tramas'] += 1
+        if errores:
+            conteo['tramas_con_error'] += 1
+        if entregados is None:
+            conteo['detectadas'] += 1
+        elif entregados == datos:
+            conteo['entregadas_correctas'] += 1
+            if errores:
+                conteo['corregidas'] += 1
+        else:
+            conteo['no_detectadas'] += 1
+    conteo['tiempo_cpu'] = time.process_time() - inicio
+    return conteo
+
+def _tareas(metodos, tasas, tamanos, tramas, semilla, tramas_por_bloque):
+    for metodo, tasa, tamano in product(metodos, tasas, tamanos):
+        bloques = -(-tramas // tramas_por_bloque)
+        for bloque in range(bloques):
+            cantidad = min(tramas_por_bloque, tramas - bloque * tramas_por_bloque)
+            yield (metodo, tasa, tamano, cantidad, semilla, bloque)
+
+def _resumir(metodo, tasa, tamano, conteo, tiempo):
+    tramas = conteo['tramas']
+    con_error = conteo['tramas_con_error']
+    return {
+        'metodo': metodo,
+        'tasa_error': tasa,
+        'tamano_bits': tamano,
+        **{k: conteo[k] for k in ('tramas', 'tramas_con_error', 'entregadas_correctas',
+                                  'corregidas', 'detectadas', 'no_detectadas')},
+        # Tramas que no llegan correctas a la aplicación (descartadas o erróneas)
+        'tasa_error_residual': (tramas - conteo['entregadas_correctas']) / tramas if tramas else 0.0,
+        # Tramas entregadas con errores sin que el receptor lo notara
+        'tasa_no_detectada': conteo['no_detectadas'] / tramas if tramas else 0.0,
+        # Fracción de las tramas dañadas que se entregaron correctas
+        'tasa_correccion': conteo['corregidas'] / con_error if con_error else 0.0,
+        'tramas_por_segundo': tramas / tiempo if tiempo else 0.0,
+    }
+
+def ejecutar(metodos=METODOS, tasas=(1e-4, 1e-3), tamanos=(64, 512), tramas=100000,
+             semilla=0, procesos=None, tramas_por_bloque=TRAMAS_POR_BLOQUE):
+    """
+    Ejecuta el barrido completo
+    Args:
+        procesos: Número de procesos (por defecto todos los núcleos; 1 = sin pool)
+    Returns:
+        list: Un diccionario por combinación (método, tasa, tamaño)
+    """
+    for metodo in metodos:
+        if metodo not in CODECS:
+            raise ValueError(f"Método no soportado: {metodo}")
+    tareas = list(_tareas(metodos, tasas, tamanos, tramas, semilla, tramas_por_bloque))
+
+    inicio = time.perf_counter()
+    if procesos == 1:
+        resultados = [simular_bloque(*t) for t in tareas]
+    else:
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            resultados = list(pool.map(simular_bloque, *zip(*tareas)))
+    duracion = time.perf_counter() - inicio
+
+    # Acumular los bloques de cada configuración (en orden, para que sea determinista)
+    acumulado = {}
+    for (metodo, tasa, tamano, *_), conteo in zip(tareas, resultados):
+        total = acumulado.setdefault((metodo, tasa, tamano), dict.fromkeys(conteo, 0))
+        for k, v in conteo.items():
+            total[k] += v
+
+    # tramas/s por configuración con el tiempo de CPU de sus bloques,
+    # escalado al número de procesos que trabajaron en paralelo
+    cpu_total = sum(c['tiempo_cpu'] for c in acumulado.values()) or 1.0
+    filas = []
+    for (metodo, tasa, tamano), conteo in acumulado.items():
+        tiempo = duracion * conteo['tiempo_cpu'] / cpu_total
+        filas.append(_resumir(metodo, tasa, tamano, conteo, tiempo))
+    return filas
+
+def escribir(filas, formato='csv', salida=None):
+    """Escribe los resultados en CSV o JSON (a un archivo o a la salida estándar)"""
+    archivo = open(salida, 'w', newline='') if salida else sys.stdout
+    try:
+        if formato == 'json':
+            json.dump(filas, archivo, indent=2)
+            archivo.write('\n')
+        else:
+            escritor = csv.DictWriter(archivo, fieldnames=CAMPOS)
+            escritor.writeheader()
+            escritor.writerows(filas)
+    finally:
+        if salida:
+            archivo.close()
+
+def _lista(tipo):
+    return lambda texto: [tipo(x) for x in texto.split(',') if x]
+
+def main(argv=None):
+    """Función principal: barrido Monte Carlo desde la línea de comandos"""
+    parser = argparse.ArgumentParser(description="Simulación Monte Carlo de CRC-32 y Hamming")
+    parser.add_argument('--metodos', type=_lista(str), default=list(METODOS))
+    parser.add_argument('--tasas', type=_lista(float), default=[1e-4, 1e-3, 1e-2])
+    parser.add_argument('--tamanos', type=_lista(int), default=[64, 512, 4096], help="Bits de datos por trama")
+    parser.add_argument('--tramas', type=int, default=100000, help="Tramas por configuración")
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--procesos', type=int, default=None, help="Procesos del pool (por defecto, todos los núcleos)")
+    parser.add_argument('--bloque', type=int, default=TRAMAS_POR_BLOQUE, help="Tramas por tarea del pool")
+    parser.add_argument('--formato', choices=('csv', 'json'), default='csv')
+    parser.add_argument('--salida', help="Archivo de salida (por defecto, la salida estándar)")
+    args = parser.parse_args(argv)
+
+    filas = ejecutar(args.metodos, args.tasas, args.tamanos, args.tramas, args.semilla,
+                     args.procesos, args.bloque)
+    escribir(filas, args.formato, args.salida)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Pruebas de la transferencia de archivos (emisor --archivo / receptor --salida)
+Universidad del Valle de Guatemala - CC3067 Redes
+"""
+
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import emisor
+import receptor
+from archivos import LectorArchivo, rangos
+from canal import aplicar_errores
+from registro import configurar
+from transporte import EmisorTCP
+
+TAMANO_SEGMENTO = 1024
+
+class EnlaceRuidoso(emisor.CapaEnlace):
+    """Corrompe las tramas indicadas del primer envío (los reenvíos salen limpios)"""
+
+    def __init__(self, corromper):
+        super().__init__('crc32', 'none')
+        self.corromper = corromper
+
+    def calcular_integridad_batch(self, mensajes, *args, **kwargs):
+        for i, trama in enumerate(super().calcular_integridad_batch(mensajes, *args, **kwargs)):
+            if i in self.corromper:
+                trama = aplicar_errores(trama, [0])
+            yield trama
+
+class PruebaArchivos(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        configurar(silencioso=True)
+        directorio = tempfile.TemporaryDirectory()
+        self.addCleanup(directorio.cleanup)
+        self.entrada = os.path.join(directorio.name, 'entrada.bin')
+        self.salida = os.path.join(directorio.name, 'salida.bin')
+        self.contenido = random.Random(3).randbytes(10 * TAMANO_SEGMENTO + 100)
+        with open(self.entrada, 'wb') as archivo:
+            archivo.write(self.contenido)
+
+    async def _receptor(self, tiempo_espera=5.0):
+        # Puerto 0: el sistema elige uno libre y servir lo avisa al escuchar
+        puerto = asyncio.get_running_loop().create_future()
+        tarea = asyncio.create_task(receptor.servir(receptor.CapaEnlace('crc32', 'none'), '127.0.0.1', 0,
+                                                    salida=self.salida, tiempo_espera=tiempo_espera,
+                                                    al_escuchar=puerto.set_result))
+        return tarea, await asyncio.wait_for(puerto, 5.0)
+
+    async def test_reenvia_segmentos_descartados(self):
+        tarea, puerto = await self._receptor()
+        resultado = await emisor.enviar_archivo(EnlaceRuidoso({2, 3, 7}), self.entrada, '127.0.0.1',
+                                                puerto, TAMANO_SEGMENTO)
+        await asyncio.wait_for(tarea, 5.0)
+        self.assertEqual(resultado['reenviados'], 3)
+        with open(self.salida, 'rb') as archivo:
+            self.assertEqual(archivo.read(), self.contenido)
+
+    async def test_receptor_reporta_faltantes(self):
+        tarea, puerto = await self._receptor(tiempo_espera=0.3)
+        enlace = emisor.CapaEnlace('crc32', 'none')
+        transporte = EmisorTCP('127.0.0.1', puerto)
+        await transporte.conectar()
+        try:
+            with LectorArchivo(self.entrada, TAMANO_SEGMENTO) as lector:
+                await transporte.enviar_y_esperar(enlace.calcular_integridad(lector.descriptor()))
+                for secuencia in (0, 1, 5):
+                    await transporte.enviar_y_esperar(enlace.calcular_integridad(lector.trama(secuencia)))
+            with self.assertRaisesRegex(TimeoutError, r"faltan 8 de 11 segmentos: 2-4, 6-10"):
+                await asyncio.wait_for(tarea, 5.0)
+        finally:
+            await transporte.cerrar()
+
+    def test_cerrar_con_recorrido_a_medias(self):
+        # El consumidor falla con un segmento en la mano: cerrar no lanza BufferError
+        with self.assertRaisesRegex(RuntimeError, "consumidor"):
+            with LectorArchivo(self.entrada, TAMANO_SEGMENTO) as lector:
+                for segmento in lector.segmentos():
+                    if segmento.secuencia == 3:
+                        raise RuntimeError("consumidor")
+        # Un recorrido abandonado tampoco impide cerrar
+        lector = LectorArchivo(self.entrada, TAMANO_SEGMENTO)
+        recorrido = lector.segmentos()
+        next(recorrido)
+        lector.cerrar()
+
+    def test_rangos(self):
+        self.assertEqual(rangos([]), "")
+        self.assertEqual(rangos([0, 1, 2, 7, 9, 10]), "0-2, 7, 9-10")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Pruebas de BitBuffer contra las mismas operaciones sobre cadenas '0'/'1'
+Universidad del Valle de Guatemala - CC3067 Redes
+"""
+
+import os
+import random
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from bitbuffer import BitBuffer
+
+# Longitudes vacías, alineadas a byte y con relleno
+LONGITUDES = list(range(0, 25)) + [63, 64, 65, 200]
+
+class PruebaBitBuffer(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = random.Random(7)
+
+    def bits(self, longitud):
+        return ''.join(self.rng.choice('01') for _ in range(longitud))
+
+    def test_ida_y_vuelta(self):
+        for longitud in LONGITUDES:
+            bits = self.bits(longitud)
+            buffer = BitBuffer.desde_cadena(bits)
+            self.assertEqual(len(buffer), longitud)
+            self.assertEqual(str(buffer), bits)
+            self.assertEqual(list(buffer), [int(b) for b in bits])
+            self.assertEqual(buffer.a_entero(), int(bits or '0', 2))
+            self.assertEqual(BitBuffer.desde_entero(buffer.a_entero(), longitud), buffer)
+            self.assertEqual(BitBuffer(buffer.tobytes(), longitud), buffer)
+            self.assertEqual(bytes(buffer.vista()), buffer.tobytes())
+            # El relleno va con ceros al final; alineado a la derecha, al principio
+            valor, num_bytes = int(bits or '0', 2), (longitud + 7) // 8
+            self.assertEqual(buffer.tobytes(), (valor << (-longitud & 7)).to_bytes(num_bytes, 'big'))
+            self.assertEqual(bytes(buffer.bytes_alineados_derecha()), valor.to_bytes(num_bytes, 'big'))
+
+    def test_relleno_normalizado(self):
+        # Bits sobrantes del último byte en 1: se descartan al construir
+        buffer = BitBuffer(b'\xff\xff', 11)
+        self.assertEqual(buffer.tobytes(), b'\xff\xe0')
+        self.assertEqual(buffer, BitBuffer.desde_cadena('1' * 11))
+        self.assertEqual(BitBuffer.desde_entero(-1, 5), BitBuffer.desde_cadena('11111'))
+        self.assertEqual(BitBuffer.ceros(13), BitBuffer.desde_cadena('0' * 13))
+        with self.assertRaises(ValueError):
+            BitBuffer(b'\x00', 9)
+        with self.assertRaises(ValueError):
+            BitBuffer.desde_cadena('0120')
+
+    def test_convertir(self):
+        buffer = BitBuffer.desde_cadena('1010')
+        self.assertIs(BitBuffer.convertir(buffer), buffer)
+        self.assertEqual(BitBuffer.convertir('1010'), buffer)
+        self.assertEqual(BitBuffer.convertir(b'\xa5'), BitBuffer.desde_cadena('10100101'))
+
+    def test_indices_y_rebanadas(self):
+        for longitud in LONGITUDES:
+            bits = self.bits(longitud)
+            buffer = BitBuffer.desde_cadena(bits)
+            for i in range(-longitud, longitud):
+                self.assertEqual(buffer[i], int(bits[i]))
+            for _ in range(20):
+                inicio, fin = sorted(self.rng.randrange(-2, longitud + 3) for _ in range(2))
+                paso = self.rng.choice((1, 1, 2, 3))
+                self.assertEqual(str(buffer[inicio:fin:paso]), bits[inicio:fin:paso], (inicio, fin, paso))
+            with self.assertRaises(IndexError):
+                buffer[longitud]
+            with self.assertRaises(IndexError):
+                buffer[-longitud - 1]
+
+    def test_modificar_bits(self):
+        for longitud in LONGITUDES[1:]:
+            bits = list(self.bits(longitud))
+            buffer = BitBuffer.desde_cadena(''.join(bits))
+            copia = buffer.copy()
+            for _ in range(10):
+                i = self.rng.randrange(longitud)
+                buffer.invertir(i)
+                bits[i] = '1' if bits[i] == '0' else '0'
+                j = self.rng.randrange(longitud)
+                bit = self.rng.choice((0, 1))
+                buffer[j] = bit
+                bits[j] = str(bit)
+                self.assertEqual(str(buffer), ''.join(bits))
+                self.assertEqual(buffer.contar_unos(), bits.count('1'))
+            # La copia es independiente
+            self.assertEqual(copia, BitBuffer.desde_cadena(str(copia)))
+            self.assertEqual(len(copia), longitud)
+
+    def test_xor_y_concatenacion(self):
+        for longitud in LONGITUDES:
+            a, b = self.bits(longitud), self.bits(longitud)
+            xor = ''.join('1' if x != y else '0' for x, y in zip(a, b))
+            self.assertEqual(str(BitBuffer.desde_cadena(a) ^ BitBuffer.desde_cadena(b)), xor)
+            c = self.bits(self.rng.randrange(20))
+            self.assertEqual(str(BitBuffer.desde_cadena(a) + BitBuffer.desde_cadena(c)), a + c)
+            self.assertEqual(str(BitBuffer.desde_cadena(a) + c), a + c)
+            self.assertEqual(str(c + BitBuffer.desde_cadena(a)), c + a)
+        with self.assertRaises(ValueError):
+            BitBuffer.desde_cadena('101') ^ BitBuffer.desde_cadena('10')
+
+    def test_igualdad(self):
+        buffer = BitBuffer.desde_cadena('0110')
+        self.assertEqual(buffer, '0110')
+        self.assertNotEqual(buffer, '01100')
+        # Mismos bytes pero distinta longitud
+        self.assertNotEqual(buffer, BitBuffer.desde_cadena('01100'))
+        self.assertNotEqual(buffer, b'\x60')
+        with self.assertRaises(TypeError):
+            hash(buffer)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Pruebas de checksums.py: valores de verificación y cálculo por bloques
+Universidad del Valle de Guatemala - CC3067 Redes
+"""
+
+import os
+import random
+import sys
+import unittest
+from unittest import mock
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import checksums
+from bitbuffer import BitBuffer
+
+# Valores de verificación del catálogo de CRC sobre "123456789"
+VERIFICACION = {
+    'crc32': 0xFC891918,
+    'crc32c': 0xE3069283,
+    'crc16-ccitt': 0x29B1,
+    'adler32': 0x091E01DE,
+}
+
+# Vectores publicados de Fletcher (0xC8F0 es el de "abcde", no el de "123456789")
+VECTORES_FLETCHER = [
+    ('fletcher16', b"abcde", 0xC8F0),
+    ('fletcher16', b"abcdef", 0x2057),
+    ('fletcher16', b"abcdefgh", 0x0627),
+    ('fletcher16', b"123456789", 0x1EDE),
+    ('fletcher32', b"abcde", 0xF04FC729),
+    ('fletcher32', b"abcdef", 0x56502D2A),
+    ('fletcher32', b"abcdefgh", 0xEBE19591),
+]
+
+def crc32c_bit_a_bit(datos):
+    crc = 0xFFFFFFFF
+    for byte in datos:
+        crc ^= byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0x82F63B78 if crc & 1 else crc >> 1
+    return crc ^ 0xFFFFFFFF
+
+def fletcher_directo(valores, modulo):
+    suma1 = suma2 = 0
+    for valor in valores:
+        suma1 = (suma1 + valor) % modulo
+        suma2 = (suma2 + suma1) % modulo
+    return suma1, suma2
+
+def fletcher16_directo(datos):
+    suma1, suma2 = fletcher_directo(datos, 255)
+    return (suma2 << 8) | suma1
+
+def fletcher32_directo(datos):
+    datos = bytes(datos) + b'\x00' * (len(datos) & 1)
+    suma1, suma2 = fletcher_directo((int.from_bytes(datos[i:i + 2], 'little')
+                                     for i in range(0, len(datos), 2)), 65535)
+    return (suma2 << 16) | suma1
+
+class PruebaChecksums(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = random.Random(15)
+
+    def test_valores_de_verificacion(self):
+        for nombre, esperado in VERIFICACION.items():
+            self.assertEqual(checksums.obtener(nombre).calcular(b"123456789"), esperado, nombre)
+        for nombre, datos, esperado in VECTORES_FLETCHER:
+            self.assertEqual(checksums.obtener(nombre).calcular(datos), esperado, (nombre, datos))
+
+    def test_crc32c_sin_paquete_nativo(self):
+        # Slicing-by-8 en Python: longitudes alrededor de las palabras de 8 bytes
+        with mock.patch.object(checksums, '_crc32c_nativo', None):
+            codec = checksums.obtener('crc32c')
+            self.assertEqual(codec.calcular(b"123456789"), 0xE3069283)
+            for longitud in list(range(0, 40)) + [1000, 4099]:
+                datos = self.rng.randbytes(longitud)
+                self.assertEqual(codec.calcular(datos), crc32c_bit_a_bit(datos), longitud)
+                self.assertEqual(codec.calcular(memoryview(datos)), crc32c_bit_a_bit(datos), longitud)
+
+    def test_fletcher_igual_al_directo(self):
+        fletcher16, fletcher32 = checksums.obtener('fletcher16'), checksums.obtener('fletcher32')
+        casos = [self.rng.randbytes(n) for n in list(range(0, 20)) + [255, 256, 5000, 5001]]
+        # Valores máximos: las sumas dan vueltas al módulo en cada paso
+        casos += [b'\xff' * 5000, b'\xff' * 5001]
+        for datos in casos:
+            self.assertEqual(fletcher16.calcular(datos), fletcher16_directo(datos), len(datos))
+            self.assertEqual(fletcher32.calcular(datos), fletcher32_directo(datos), len(datos))
+        # Varios bloques, incluido uno final de longitud impar
+        with mock.patch.object(checksums, '_BLOQUE_FLETCHER', 64):
+            for datos in casos:
+                self.assertEqual(fletcher16.calcular(datos), fletcher16_directo(datos), len(datos))
+                self.assertEqual(fletcher32.calcular(datos), fletcher32_directo(datos), len(datos))
+
+    def test_proteger_y_verificar(self):
+        for nombre in checksums.disponibles():
+            codec = checksums.obtener(nombre)
+            for longitud in (1, 7, 8, 45):
+                bits = ''.join(self.rng.choice('01') for _ in range(longitud))
+                trama = codec.proteger(bits)
+                self.assertEqual(len(trama), longitud + codec.bits)
+                self.assertEqual(codec.verificar(trama), (True, BitBuffer.desde_cadena(bits)))
+                self.assertEqual(codec.verificar(str(trama)), (True, BitBuffer.desde_cadena(bits)))
+                # Un bit alterado en cualquier posición se detecta
+                for i in range(len(trama)):
+                    alterada = trama.copy()
+                    alterada.invertir(i)
+                    self.assertEqual(codec.verificar(alterada), (False, None), (nombre, i))
+            self.assertEqual(codec.verificar('1' * (codec.bits - 1)), (False, None))
+
+    def test_registro(self):
+        self.assertEqual(set(checksums.disponibles()), set(VERIFICACION) | {'fletcher16', 'fletcher32'})
+        self.assertIs(checksums.obtener('fletcher'), checksums.obtener('fletcher16'))
+        with self.assertRaises(ValueError):
+            checksums.obtener('md5')
+
+if __name__ == "__main__":
+    unittest.main()
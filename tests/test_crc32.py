@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Pruebas de crc32Emisor.py contra la implementación original bit a bit
+Universidad del Valle de Guatemala - CC3067 Redes
+"""
+
+import os
+import random
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from bitbuffer import BitBuffer
+from crc32Emisor import CRC32, calculate_crc32, crc32_combinar, crc32_paralelo, crc32_sender
+from registro import configurar
+
+def _tabla_original():
+    tabla = []
+    for i in range(256):
+        crc = i << 24
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x04C11DB7 if crc & 0x80000000 else crc << 1) & 0xFFFFFFFF
+        tabla.append(crc)
+    return tabla
+
+TABLA = _tabla_original()
+
+def crc32_original(data_bits):
+    """calculate_crc32 tal como estaba: padding a la izquierda y un byte por vuelta"""
+    while len(data_bits) % 8 != 0:
+        data_bits = '0' + data_bits
+    crc = 0xFFFFFFFF
+    for i in range(0, len(data_bits), 8):
+        crc = ((crc << 8) ^ TABLA[((crc >> 24) ^ int(data_bits[i:i + 8], 2)) & 0xFF]) & 0xFFFFFFFF
+    return crc ^ 0xFFFFFFFF
+
+def bits_aleatorios(rng, longitud):
+    return ''.join(rng.choice('01') for _ in range(longitud))
+
+class PruebaCRC32(unittest.TestCase):
+
+    def setUp(self):
+        configurar(silencioso=True)
+        self.rng = random.Random(1)
+
+    def test_igual_a_la_original(self):
+        # Incluye longitudes que no completan bytes (padding a la izquierda)
+        for longitud in list(range(0, 70)) + [255, 1000, 4097]:
+            bits = bits_aleatorios(self.rng, longitud)
+            self.assertEqual(calculate_crc32(bits), crc32_original(bits), longitud)
+
+    def test_valor_de_verificacion(self):
+        # CRC-32/BZIP2: mismo polinomio, sin reflejar, de "123456789"
+        self.assertEqual(calculate_crc32(b"123456789"), 0xFC891918)
+
+    def test_entradas_equivalentes(self):
+        datos = self.rng.randbytes(300)
+        bits = ''.join(format(b, '08b') for b in datos)
+        esperado = crc32_original(bits)
+        self.assertEqual(calculate_crc32(datos), esperado)
+        self.assertEqual(calculate_crc32(memoryview(datos)), esperado)
+        self.assertEqual(calculate_crc32(BitBuffer(datos)), esperado)
+        # Un BitBuffer que no completa bytes se alinea como la cadena
+        self.assertEqual(calculate_crc32(BitBuffer.desde_cadena(bits[:-3])), crc32_original(bits[:-3]))
+
+    def test_incremental_y_combinar(self):
+        datos = self.rng.randbytes(5000)
+        crc = CRC32()
+        for inicio in range(0, len(datos), 777):
+            crc.update(datos[inicio:inicio + 777])
+        self.assertEqual(crc.intdigest(), calculate_crc32(datos))
+        a, b = datos[:1234], datos[1234:]
+        self.assertEqual(crc32_combinar(calculate_crc32(a), calculate_crc32(b), len(b)), calculate_crc32(datos))
+        self.assertEqual(crc32_paralelo(datos, trabajadores=2, tamano_bloque=1000, ejecutor='hilos'),
+                         calculate_crc32(datos))
+
+    def test_sender_igual_al_original(self):
+        for longitud in (5, 32, 57):
+            bits = bits_aleatorios(self.rng, longitud)
+            relleno = bits.rjust(32, '0')
+            esperado = relleno + format(crc32_original(relleno), '032b')
+            self.assertEqual(crc32_sender(bits), esperado)
+            self.assertEqual(str(crc32_sender(BitBuffer.desde_cadena(bits))), esperado)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Pruebas de entrelazado.py: ráfagas justo en la capacidad y un bit más allá
+Universidad del Valle de Guatemala - CC3067 Redes
+"""
+
+import os
+import random
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import entrelazado
+from bitbuffer import BitBuffer
+
+def con_rafaga(trama, inicio, longitud):
+    """Copia de la trama con longitud bits invertidos desde inicio"""
+    alterada = trama.copy()
+    for i in range(inicio, inicio + longitud):
+        alterada.invertir(i)
+    return alterada
+
+class PruebaEntrelazado(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = random.Random(21)
+
+    def trama(self, longitud):
+        return BitBuffer.desde_cadena(''.join(self.rng.choice('01') for _ in range(longitud)))
+
+    def test_ida_y_vuelta(self):
+        for nombre in entrelazado.disponibles():
+            codigo = entrelazado.obtener(nombre)
+            for longitud in (0, 1, codigo.k - 1, codigo.k, codigo.k + 1, 300):
+                datos = self.trama(longitud)
+                protegida = codigo.codificar(datos)
+                self.assertEqual(len(protegida) % codigo.n, 0)
+                self.assertEqual(codigo.decodificar(protegida), (True, datos, 0), (nombre, longitud))
+
+    def test_rafaga_en_la_capacidad(self):
+        # Una ráfaga de B bits (B = palabras) toca cada palabra una sola vez
+        for nombre in entrelazado.disponibles():
+            codigo = entrelazado.obtener(nombre)
+            datos = self.trama(200)
+            protegida = codigo.codificar(datos)
+            palabras = len(protegida) // codigo.n
+            for inicio in range(len(protegida) - palabras + 1):
+                recibida = con_rafaga(protegida, inicio, palabras)
+                self.assertEqual(codigo.decodificar(recibida), (True, datos, palabras), (nombre, inicio))
+
+    def test_rafaga_un_bit_mas_larga(self):
+        # B + 1 bits: la primera y la última posición caen en la misma palabra
+        for nombre in entrelazado.disponibles():
+            codigo = entrelazado.obtener(nombre)
+            datos = self.trama(200)
+            protegida = codigo.codificar(datos)
+            palabras = len(protegida) // codigo.n
+            for inicio in range(len(protegida) - palabras):
+                integra, recibidos, _ = codigo.decodificar(con_rafaga(protegida, inicio, palabras + 1))
+                if codigo.extendido:
+                    # SECDED detecta los dos errores de la palabra y descarta la trama
+                    self.assertEqual((integra, recibidos), (False, None), (nombre, inicio))
+                else:
+                    # Hamming (7,4) corrige mal esa palabra: nunca devuelve los datos originales
+                    self.assertFalse(integra and recibidos == datos, (nombre, inicio))
+
+    def test_errores_dispersos(self):
+        # Un error por palabra en posiciones aleatorias también está en la capacidad
+        for nombre in entrelazado.disponibles():
+            codigo = entrelazado.obtener(nombre)
+            datos = self.trama(500)
+            protegida = codigo.codificar(datos)
+            palabras = len(protegida) // codigo.n
+            for _ in range(20):
+                recibida = protegida.copy()
+                for palabra in range(palabras):
+                    recibida.invertir(self.rng.randrange(codigo.n) * palabras + palabra)
+                self.assertEqual(codigo.decodificar(recibida), (True, datos, palabras), nombre)
+
+    def test_trama_invalida(self):
+        codigo = entrelazado.obtener('hamming74')
+        self.assertEqual(codigo.decodificar(BitBuffer()), (False, None, 0))
+        self.assertEqual(codigo.decodificar(BitBuffer.ceros(8)), (False, None, 0))
+        with self.assertRaises(ValueError):
+            entrelazado.obtener('golay')
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Pruebas del código de Hamming: hammingEmisor.py contra hammingEmisor.js y
+estados de hammingReceptor.py
+Universidad del Valle de Guatemala - CC3067 Redes
+"""
+
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import unittest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(RAIZ)
+from bitbuffer import BitBuffer
+from hammingEmisor import hamming_sender
+from hammingReceptor import hamming_receiver
+from registro import configurar
+
+# Salidas de hammingEmisor.js, para comparar aunque no haya Node.js
+VECTORES_JS = [
+    ("1", "111"),
+    ("0", "000"),
+    ("1011", "0110011"),
+    ("1101", "1010101"),
+    ("10011010", "011100101010"),
+    ("11111111111", "111111111111111"),
+    ("0000000000000000", "000000000000000000000"),
+    ("1011001110001111000011111", "011101100011100101111000011111"),
+]
+
+def hamming_sender_js(entradas):
+    """Codifica las entradas con hammingEmisor.js en una sola ejecución de Node.js"""
+    programa = (
+        "console.log = () => {};"
+        "const { hammingSender } = require(process.argv[1]);"
+        "const entradas = JSON.parse(require('fs').readFileSync(0, 'utf8'));"
+        "process.stdout.write(JSON.stringify(entradas.map(hammingSender)));"
+    )
+    resultado = subprocess.run(['node', '-e', programa, os.path.join(RAIZ, 'hammingEmisor.js')],
+                               input=json.dumps(entradas), capture_output=True, text=True,
+                               timeout=60, check=True)
+    return json.loads(resultado.stdout)
+
+class PruebaHammingEmisor(unittest.TestCase):
+
+    def test_vectores_del_emisor_js(self):
+        for datos, esperado in VECTORES_JS:
+            self.assertEqual(hamming_sender(datos), esperado, datos)
+            self.assertEqual(hamming_sender(BitBuffer.desde_cadena(datos)), BitBuffer.desde_cadena(esperado))
+
+    @unittest.skipIf(shutil.which('node') is None, "requiere Node.js")
+    def test_igual_al_emisor_js(self):
+        rng = random.Random(2)
+        entradas = [''.join(rng.choice('01') for _ in range(longitud))
+                    for longitud in list(range(1, 80)) + [120, 247, 248, 500, 1013]]
+        for datos, esperado in zip(entradas, hamming_sender_js(entradas)):
+            self.assertEqual(hamming_sender(datos), esperado, datos)
+            self.assertEqual(str(hamming_sender(BitBuffer.desde_cadena(datos))), esperado, datos)
+
+def invertir(codigo, *posiciones):
+    """Invierte los bits de las posiciones dadas (1-based)"""
+    bits = list(codigo)
+    for posicion in posiciones:
+        bits[posicion - 1] = '1' if bits[posicion - 1] == '0' else '0'
+    return ''.join(bits)
+
+class PruebaHammingReceptor(unittest.TestCase):
+
+    def setUp(self):
+        configurar(silencioso=True)
+
+    def recibir(self, codigo):
+        """Resultado de hamming_receiver, comprobando que str y BitBuffer coinciden"""
+        resultado = hamming_receiver(codigo)
+        binario = hamming_receiver(BitBuffer.desde_cadena(codigo))
+        self.assertEqual({**binario, "message": None if binario["message"] is None else str(binario["message"])},
+                         resultado, codigo)
+        return resultado
+
+    def test_sin_errores(self):
+        for datos, codigo in VECTORES_JS:
+            resultado = self.recibir(codigo)
+            self.assertEqual(resultado["status"], "success")
+            self.assertEqual(resultado["message"], datos)
+            self.assertFalse(resultado["error"])
+
+    def test_un_bit_invertido(self):
+        for datos, codigo in VECTORES_JS:
+            for posicion in range(1, len(codigo) + 1):
+                resultado = self.recibir(invertir(codigo, posicion))
+                self.assertEqual(resultado["status"], "corrected")
+                self.assertEqual(resultado["error_position"], posicion)
+                self.assertEqual(resultado["message"], datos)
+                self.assertEqual(resultado["corrected_bit"], int(codigo[posicion - 1]))
+
+    def test_dos_bits_invertidos(self):
+        # El síndrome de dos errores nunca es 0: o se corrige un bit
+        # equivocado o apunta fuera del código
+        for datos, codigo in VECTORES_JS:
+            n = len(codigo)
+            for i in range(1, n + 1):
+                for j in range(i + 1, n + 1):
+                    resultado = self.recibir(invertir(codigo, i, j))
+                    self.assertTrue(resultado["error"])
+                    if i ^ j > n:
+                        self.assertEqual(resultado["status"], "error")
+                    else:
+                        self.assertEqual(resultado["status"], "corrected")
+                        self.assertEqual(resultado["error_position"], i ^ j)
+                        self.assertNotEqual(resultado["message"], datos)
+
+    def test_sindrome_fuera_del_codigo(self):
+        codigo = hamming_sender("101")
+        self.assertEqual(len(codigo), 6)
+        # 2 XOR 5 = 7 > 6
+        resultado = self.recibir(invertir(codigo, 2, 5))
+        self.assertEqual(resultado["status"], "error")
+        self.assertEqual(resultado["error_position"], 7)
+        self.assertIsNone(resultado["message"])
+        self.assertFalse(resultado["corrected"])
+
+if __name__ == "__main__":
+    unittest.main()
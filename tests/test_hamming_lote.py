@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Pruebas de hammingLote.py contra el receptor de Hamming código a código
+Universidad del Valle de Guatemala - CC3067 Redes
+"""
+
+import os
+import random
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from hammingEmisor import hamming_sender
+from hammingLote import (ESTADO_CORRECTED, ESTADO_ERROR, ESTADO_SUCCESS, NOMBRES_ESTADO,
+                         cadenas_a_filas, filas_a_cadenas, hamming_decode_batch)
+from hammingReceptor import hamming_decode
+
+def invertir(codigo, *posiciones):
+    """Invierte los bits de las posiciones dadas (1-based)"""
+    bits = list(codigo)
+    for posicion in posiciones:
+        bits[posicion - 1] = '1' if bits[posicion - 1] == '0' else '0'
+    return ''.join(bits)
+
+def empaquetar(codigos):
+    """Filas alineadas a byte, MSB primero (el formato que acepta hamming_decode_batch)"""
+    return np.packbits(cadenas_a_filas(codigos), axis=1).tobytes()
+
+class PruebaHammingLote(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = random.Random(5)
+
+    def comparar(self, codigos):
+        """Decodifica el lote (matriz y empaquetado) y lo compara con hamming_decode"""
+        n = len(codigos[0])
+        for resultado in (hamming_decode_batch(cadenas_a_filas(codigos)),
+                          hamming_decode_batch(empaquetar(codigos), n=n)):
+            datos = filas_a_cadenas(resultado.datos)
+            for i, codigo in enumerate(codigos):
+                esperado = hamming_decode(codigo)
+                self.assertEqual(NOMBRES_ESTADO[resultado.estado[i]], esperado["status"], codigo)
+                self.assertEqual(resultado.posicion_error[i], esperado.get("error_position", 0), codigo)
+                if esperado["message"] is not None:
+                    self.assertEqual(datos[i], esperado["message"], codigo)
+        return resultado
+
+    def test_sin_errores(self):
+        for m in (1, 4, 11, 26):
+            datos = [''.join(self.rng.choice('01') for _ in range(m)) for _ in range(20)]
+            resultado = self.comparar([hamming_sender(d) for d in datos])
+            self.assertTrue((resultado.estado == ESTADO_SUCCESS).all())
+            self.assertEqual(filas_a_cadenas(resultado.datos), datos)
+
+    def test_un_bit_invertido(self):
+        for m in (1, 4, 11, 26):
+            datos = ''.join(self.rng.choice('01') for _ in range(m))
+            codigo = hamming_sender(datos)
+            codigos = [invertir(codigo, posicion) for posicion in range(1, len(codigo) + 1)]
+            resultado = self.comparar(codigos)
+            self.assertTrue((resultado.estado == ESTADO_CORRECTED).all())
+            self.assertEqual(list(resultado.posicion_error), list(range(1, len(codigo) + 1)))
+            self.assertEqual(filas_a_cadenas(resultado.datos), [datos] * len(codigos))
+
+    def test_dos_bits_invertidos(self):
+        # Longitudes con y sin síndromes fuera del código (n = 2^r - 1)
+        for m in (3, 4, 8, 11):
+            codigo = hamming_sender(''.join(self.rng.choice('01') for _ in range(m)))
+            n = len(codigo)
+            pares = [(i, j) for i in range(1, n + 1) for j in range(i + 1, n + 1)]
+            resultado = self.comparar([invertir(codigo, i, j) for i, j in pares])
+            esperado = [ESTADO_ERROR if i ^ j > n else ESTADO_CORRECTED for i, j in pares]
+            self.assertEqual(list(resultado.estado), esperado)
+
+    def test_mezcla_de_estados(self):
+        codigo = hamming_sender("101")
+        resultado = self.comparar([codigo, invertir(codigo, 3), invertir(codigo, 2, 5)])
+        self.assertEqual(list(resultado.estado), [ESTADO_SUCCESS, ESTADO_CORRECTED, ESTADO_ERROR])
+        self.assertEqual(list(resultado.posicion_error), [0, 3, 7])
+
+    def test_empaquetado_invalido(self):
+        with self.assertRaises(ValueError):
+            hamming_decode_batch(b'\x00\x00\x00', n=12)
+        with self.assertRaises(ValueError):
+            hamming_decode_batch(b'\x00\x00')
+
+if __name__ == "__main__":
+    unittest.main()
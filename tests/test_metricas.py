@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Pruebas de metricas.py
+Universidad del Valle de Guatemala - CC3067 Redes
+"""
+
+import os
+import sys
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import emisor
+from metricas import METRICAS, instrumentar
+from registro import configurar
+
+@instrumentar('prueba.interna', tamano_de=0)
+def interna(datos):
+    return sum(datos)
+
+@instrumentar('prueba.externa', tamano_de=0)
+def externa(datos):
+    return interna(datos) + interna(datos)
+
+def funciones(estadisticas):
+    return {funcion for _, _, funcion in estadisticas.stats}
+
+class PruebaPerfiles(unittest.TestCase):
+
+    def setUp(self):
+        METRICAS.reiniciar()
+        METRICAS.activar(perfilar=('prueba.externa', 'prueba.interna'))
+        self.addCleanup(METRICAS.desactivar)
+        self.addCleanup(METRICAS.reiniciar)
+
+    def test_solo_perfila_la_etapa_externa(self):
+        externa(b'abc')
+        etapas = METRICAS.resumen()["etapas"]
+        self.assertEqual(etapas["prueba.interna"]["tramas"], 2)
+        # La etapa interna queda dentro del perfil de la externa
+        self.assertIn('interna', funciones(METRICAS.perfil('prueba.externa')))
+        self.assertIsNone(METRICAS.perfil('prueba.interna'))
+        # Llamada directa: ahora sí es la más externa
+        interna(b'abc')
+        self.assertIn('interna', funciones(METRICAS.perfil('prueba.interna')))
+
+    def test_un_perfil_por_hilo(self):
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(externa, [bytes(100)] * 64))
+        self.assertEqual(METRICAS.resumen()["etapas"]["prueba.externa"]["tramas"], 64)
+        estadisticas = METRICAS.perfil('prueba.externa')
+        llamadas = sum(cc for (_, _, funcion), (cc, *_) in estadisticas.stats.items() if funcion == 'externa')
+        self.assertEqual(llamadas, 64)
+
+class PruebaArgumentosPorNombre(unittest.TestCase):
+
+    def setUp(self):
+        configurar(silencioso=True)
+        METRICAS.reiniciar()
+        METRICAS.activar()
+        self.addCleanup(METRICAS.desactivar)
+        self.addCleanup(METRICAS.reiniciar)
+
+    def test_simular_ruido_con_palabras_clave(self):
+        emisor.simular_ruido(mensaje_binario="0101", tasa_error=0.1)
+        emisor.simular_ruido("0101", tasa_error=0.1)
+        self.assertEqual(METRICAS.resumen()["etapas"]["canal"]["tramas"], 2)
+
+    def test_cuenta_el_argumento_por_nombre(self):
+        interna(datos=bytes(10))
+        interna(bytes(6))
+        self.assertEqual(METRICAS.resumen()["etapas"]["prueba.interna"]["bytes"], 16)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Pruebas de reedsolomon.py: errores justo en la capacidad y uno más allá
+Universidad del Valle de Guatemala - CC3067 Redes
+"""
+
+import os
+import random
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import reedsolomon
+from bitbuffer import BitBuffer
+
+class PruebaReedSolomon(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = random.Random(22)
+
+    def trama(self, longitud):
+        return BitBuffer.desde_cadena(''.join(self.rng.choice('01') for _ in range(longitud)))
+
+    def alterar(self, protegida, inicio, fin, cantidad):
+        """Copia con cantidad bytes distintos alterados entre los bytes inicio y fin"""
+        recibidos = bytearray(protegida.tobytes())
+        for posicion in self.rng.sample(range(inicio, fin), cantidad):
+            recibidos[posicion] ^= self.rng.randrange(1, 256)
+        return BitBuffer(recibidos)
+
+    def bloques(self, codigo, protegida):
+        """Rangos (inicio, fin) en bytes de cada bloque, incluido el último acortado"""
+        total = len(protegida) // 8
+        return [(inicio, min(inicio + codigo.n, total)) for inicio in range(0, total, codigo.n)]
+
+    def test_ida_y_vuelta(self):
+        codigo = reedsolomon.obtener()
+        for longitud in (0, 1, 7, 8, 9, codigo.k * 8 - 1, codigo.k * 8, 5000):
+            datos = self.trama(longitud)
+            self.assertEqual(codigo.decodificar(codigo.codificar(datos)), (True, datos, 0), longitud)
+
+    def test_errores_en_la_capacidad(self):
+        # t = simbolos_paridad / 2 bytes por bloque, sin importar cuántos bits fallen en cada uno
+        for simbolos_paridad in (2, 4, 16, 32):
+            codigo = reedsolomon.obtener(simbolos_paridad)
+            t = simbolos_paridad // 2
+            datos = self.trama(codigo.k * 8 * 2 + 100)
+            protegida = codigo.codificar(datos)
+            for _ in range(10):
+                recibida = protegida
+                for inicio, fin in self.bloques(codigo, protegida):
+                    recibida = self.alterar(recibida, inicio, fin, t)
+                bloques = len(self.bloques(codigo, protegida))
+                self.assertEqual(codigo.decodificar(recibida), (True, datos, t * bloques), simbolos_paridad)
+
+    def test_rafaga_en_la_capacidad(self):
+        # Una ráfaga de 8t bits alineada a byte ocupa exactamente t bytes
+        codigo = reedsolomon.obtener(16)
+        datos = self.trama(3000)
+        protegida = codigo.codificar(datos)
+        for inicio in range(0, len(protegida) // 8 - 8 + 1, 13):
+            recibidos = bytearray(protegida.tobytes())
+            recibidos[inicio:inicio + 8] = bytes(b ^ 0xFF for b in recibidos[inicio:inicio + 8])
+            integra, recibidos_datos, _ = codigo.decodificar(BitBuffer(recibidos))
+            # Puede repartirse en dos bloques, cada uno con t bytes o menos
+            self.assertTrue(integra, inicio)
+            self.assertEqual(recibidos_datos, datos, inicio)
+
+    def test_un_error_mas_alla_de_la_capacidad(self):
+        # t + 1 bytes en un bloque: se descarta la trama. Con t chico el
+        # decodificador puede llegar a otra palabra válida (probabilidad
+        # cercana a 1/t!), así que aquí se usan t = 8 y t = 16
+        for simbolos_paridad in (16, 32):
+            codigo = reedsolomon.obtener(simbolos_paridad)
+            t = simbolos_paridad // 2
+            datos = self.trama(codigo.k * 8 * 2 + 100)
+            protegida = codigo.codificar(datos)
+            for inicio, fin in self.bloques(codigo, protegida):
+                for _ in range(10):
+                    recibida = self.alterar(protegida, inicio, fin, t + 1)
+                    self.assertEqual(codigo.decodificar(recibida), (False, None, 1), simbolos_paridad)
+
+    def test_paridad_pequena_mas_alla_de_la_capacidad(self):
+        # Con t chico, t + 1 errores pueden llevar a otra palabra válida, nunca a la original
+        for simbolos_paridad in (2, 8):
+            codigo = reedsolomon.obtener(simbolos_paridad)
+            t = simbolos_paridad // 2
+            datos = self.trama(800)
+            protegida = codigo.codificar(datos)
+            for _ in range(200):
+                integra, recibidos, _ = codigo.decodificar(self.alterar(protegida, 0, len(protegida) // 8, t + 1))
+                self.assertFalse(integra and recibidos == datos, simbolos_paridad)
+
+    def test_trama_invalida(self):
+        codigo = reedsolomon.obtener()
+        self.assertEqual(codigo.decodificar(BitBuffer()), (False, None, 0))
+        self.assertEqual(codigo.decodificar(BitBuffer.ceros(9)), (False, None, 0))
+        # Último bloque sin datos (solo paridad)
+        self.assertEqual(codigo.decodificar(BitBuffer.ceros(8 * codigo.simbolos_paridad)), (False, None, 0))
+        with self.assertRaises(ValueError):
+            reedsolomon.ReedSolomon(3)
+
+if __name__ == "__main__":
+    unittest.main()
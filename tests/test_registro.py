@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Pruebas de registro.py
+Universidad del Valle de Guatemala - CC3067 Redes
+"""
+
+import io
+import logging
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from registro import RAIZ, configurar, obtener_logger
+
+class PruebaSilencioso(unittest.TestCase):
+
+    def setUp(self):
+        self.addCleanup(configurar, silencioso=True)
+        self.log = obtener_logger('prueba')
+
+    def test_solo_silencia_el_laboratorio(self):
+        configurar('debug', silencioso=True)
+        self.assertFalse(self.log.isEnabledFor(logging.CRITICAL))
+        # El estado global de logging y los demás loggers no cambian
+        self.assertEqual(logging.root.manager.disable, logging.NOTSET)
+        self.assertTrue(logging.getLogger('otra.biblioteca').isEnabledFor(logging.WARNING))
+
+    def test_configurar_de_nuevo_aplica_el_nivel(self):
+        configurar(silencioso=True)
+        flujo = io.StringIO()
+        configurar('info', flujo=flujo)
+        self.log.debug("oculto")
+        self.log.info("visible")
+        self.assertEqual(flujo.getvalue(), "visible\n")
+        self.assertEqual(logging.getLogger(RAIZ).level, logging.INFO)
+
+if __name__ == "__main__":
+    unittest.main()
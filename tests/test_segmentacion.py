@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Pruebas de los mensajes segmentados en la capa de enlace
+Universidad del Valle de Guatemala - CC3067 Redes
+"""
+
+import os
+import random
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import emisor
+import receptor
+from bitbuffer import BitBuffer
+
+class PruebaMensajesSegmentados(unittest.TestCase):
+
+    def setUp(self):
+        self.tx = emisor.CapaEnlace('crc32', 'none')
+        self.rx = receptor.CapaEnlace('crc32', 'none')
+        self.entregados = []
+        self.agregar = receptor.reensamblador_de_mensajes(self.entregados.append)
+
+    def recibir(self, tramas):
+        for trama in tramas:
+            aceptada, datos = receptor.procesar_trama(self.rx, trama)
+            if aceptada:
+                self.agregar(datos)
+
+    def test_mensaje_grande_desordenado(self):
+        mensaje = random.Random(1).randbytes(5000)
+        tramas = self.tx.calcular_integridad_segmentado(BitBuffer(mensaje), 1024)
+        self.assertEqual(len(tramas), 5)
+        self.recibir([tramas[i] for i in (0, 3, 1, 4, 2)])
+        self.assertEqual(self.entregados, [mensaje])
+
+    def test_mensaje_incompleto_se_descarta(self):
+        primero = self.tx.calcular_integridad_segmentado(BitBuffer(bytes(3000)), 1024)
+        segundo = self.tx.calcular_integridad_segmentado(BitBuffer(b'hola'), 1024)
+        self.recibir(primero[:2] + segundo)
+        self.assertEqual(self.entregados, [b'hola'])
+
+if __name__ == "__main__":
+    unittest.main()
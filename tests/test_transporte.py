@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Pruebas de transporte.py con el emisor y el receptor reales
+Universidad del Valle de Guatemala - CC3067 Redes
+
+Uso: python -m pytest tests   (o python -m unittest discover tests)
+"""
+
+import asyncio
+import os
+import random
+import sys
+import unittest
+from functools import partial
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import emisor
+import receptor
+from bitbuffer import BitBuffer
+from canal import CanalIID, transmitir
+from correccion import adaptativo
+from registro import configurar
+from transporte import (CABECERA, ESTADO_ACEPTADA, ESTADO_DESCARTADA, RESPUESTA, EmisorTCP, EmisorUDP,
+                        ServidorReceptor, desempaquetar_respuesta)
+
+TRAMAS = 120
+BYTES_POR_TRAMA = 256
+
+@unittest.skipIf(adaptativo is None, "el modo adaptativo requiere NumPy")
+class PruebaReportesAdaptativos(unittest.IsolatedAsyncioTestCase):
+    """Los reportes del receptor llegan a cada emisor en las respuestas"""
+
+    udp = False
+
+    async def asyncSetUp(self):
+        configurar(silencioso=True)
+        # Un solo enlace receptor para todos los clientes, como receptor.servir
+        enlace = receptor.CapaEnlace('crc32', 'adaptativo')
+        self.servidor = ServidorReceptor(partial(receptor.procesar_trama_con_reporte, enlace),
+                                         '127.0.0.1', 0, udp=self.udp)
+        await self.servidor.iniciar()
+
+    async def asyncTearDown(self):
+        await self.servidor.cerrar()
+
+    async def _cliente(self, tasa_error, semilla):
+        """Envía TRAMAS por un canal con tasa_error; devuelve el enlace y los estados"""
+        enlace = emisor.CapaEnlace('crc32', 'adaptativo')
+        reportes = []
+
+        def al_reporte(reporte):
+            reportes.append(reporte)
+            enlace.registrar_reporte(reporte)
+
+        clase = EmisorUDP if self.udp else EmisorTCP
+        transporte = clase('127.0.0.1', self.servidor.puerto, al_reporte=al_reporte)
+        await transporte.conectar()
+        rng = random.Random(semilla)
+        canal = CanalIID(tasa_error, semilla=semilla)
+        estados = []
+        try:
+            for _ in range(TRAMAS):
+                trama = enlace.calcular_integridad(BitBuffer(rng.randbytes(BYTES_POR_TRAMA)))
+                recibida, _ = transmitir(trama, canal)
+                estados.append(await transporte.enviar_y_esperar(recibida))
+        finally:
+            await transporte.cerrar()
+        self.assertEqual(len(reportes), TRAMAS)
+        return enlace, estados
+
+    async def test_cada_cliente_adapta_su_perfil(self):
+        # A la vez, para que el servidor intercale las tramas de ambos clientes
+        (limpio, estados_limpio), (ruidoso, _) = await asyncio.gather(
+            self._cliente(0.0, 1), self._cliente(3e-3, 2))
+        self.assertTrue(all(e == ESTADO_ACEPTADA for e in estados_limpio))
+        self.assertEqual(limpio.selector.actual, 0)
+        self.assertNotEqual(ruidoso.selector.actual, 0)
+        self.assertGreater(ruidoso.selector.tasa_error(), 0)
+
+class PruebaReportesAdaptativosUDP(PruebaReportesAdaptativos):
+    udp = True
+
+class PruebaSinReporte(unittest.IsolatedAsyncioTestCase):
+    """Fuera del modo adaptativo las respuestas no traen reporte"""
+
+    async def test_sin_reporte(self):
+        configurar(silencioso=True)
+        enlace = receptor.CapaEnlace('crc32', 'none')
+        servidor = ServidorReceptor(partial(receptor.procesar_trama_con_reporte, enlace), '127.0.0.1', 0)
+        await servidor.iniciar()
+        reportes = []
+        transporte = EmisorTCP('127.0.0.1', servidor.puerto, al_reporte=reportes.append)
+        try:
+            await transporte.conectar()
+            trama = emisor.CapaEnlace('crc32', 'none').calcular_integridad(BitBuffer(bytes(64)))
+            self.assertEqual(await transporte.enviar_y_esperar(trama), ESTADO_ACEPTADA)
+        finally:
+            await transporte.cerrar()
+            await servidor.cerrar()
+        self.assertEqual(reportes, [])
+
+class PruebaTramasMalformadas(unittest.IsolatedAsyncioTestCase):
+    """Una longitud en bits que no cabe en los datos se descarta sin cortar la conexión"""
+
+    async def asyncSetUp(self):
+        configurar(silencioso=True)
+        self.enlace = receptor.CapaEnlace('crc32', 'none')
+        self.trama = emisor.CapaEnlace('crc32', 'none').calcular_integridad(BitBuffer(bytes(64)))
+
+    async def _servidor(self, udp):
+        servidor = ServidorReceptor(partial(receptor.procesar_trama, self.enlace), '127.0.0.1', 0, udp=udp)
+        await servidor.iniciar()
+        self.addAsyncCleanup(servidor.cerrar)
+        return servidor
+
+    async def test_tcp(self):
+        servidor = await self._servidor(udp=False)
+        reader, writer = await asyncio.open_connection('127.0.0.1', servidor.puerto)
+        writer.write(CABECERA.pack(4, 7, 33) + bytes(4))
+        secuencia, estado, _ = desempaquetar_respuesta(await reader.readexactly(RESPUESTA.size))
+        writer.close()
+        self.assertEqual((secuencia, estado), (7, ESTADO_DESCARTADA))
+        # La conexión sigue sirviendo tramas válidas
+        transporte = EmisorTCP('127.0.0.1', servidor.puerto)
+        await transporte.conectar()
+        try:
+            self.assertEqual(await transporte.enviar_y_esperar(self.trama), ESTADO_ACEPTADA)
+        finally:
+            await transporte.cerrar()
+        self.assertEqual(servidor.estadisticas.descartadas, 1)
+
+    async def test_udp(self):
+        servidor = await self._servidor(udp=True)
+        respuestas = asyncio.Queue()
+
+        class Protocolo(asyncio.DatagramProtocol):
+            def datagram_received(self, datos, direccion):
+                respuestas.put_nowait(datos)
+
+        transporte, _ = await asyncio.get_running_loop().create_datagram_endpoint(
+            Protocolo, remote_addr=('127.0.0.1', servidor.puerto))
+        try:
+            transporte.sendto(CABECERA.pack(0, 9, 1000) + bytes(4))
+            datos = await asyncio.wait_for(respuestas.get(), 1.0)
+        finally:
+            transporte.close()
+        self.assertEqual(desempaquetar_respuesta(datos)[:2], (9, ESTADO_DESCARTADA))
+
+class PruebaErrorAlProcesar(unittest.IsolatedAsyncioTestCase):
+    """Si procesar falla el cliente recibe un descarte en lugar de esperar para siempre"""
+
+    async def asyncSetUp(self):
+        configurar(silencioso=True)
+
+    async def _enviar(self, procesar, udp):
+        servidor = ServidorReceptor(procesar, '127.0.0.1', 0, udp=udp)
+        await servidor.iniciar()
+        self.addAsyncCleanup(servidor.cerrar)
+        transporte = (EmisorUDP if udp else EmisorTCP)('127.0.0.1', servidor.puerto)
+        await transporte.conectar()
+        try:
+            estado = await asyncio.wait_for(transporte.enviar_y_esperar(BitBuffer(bytes(8))), 2.0)
+        finally:
+            await transporte.cerrar()
+        self.assertEqual(estado, ESTADO_DESCARTADA)
+        self.assertEqual(servidor.estadisticas.descartadas, 1)
+
+    @staticmethod
+    def _falla(trama):
+        raise RuntimeError("falla en la capa de enlace")
+
+    async def test_excepcion_tcp(self):
+        await self._enviar(self._falla, udp=False)
+
+    async def test_excepcion_udp(self):
+        await self._enviar(self._falla, udp=True)
+
+    async def test_resultado_invalido(self):
+        await self._enviar(lambda trama: None, udp=False)
+
+class PruebaTiempoEsperaUDP(unittest.IsolatedAsyncioTestCase):
+    async def test_tiempo_espera_libera_pendiente(self):
+        # Nadie escucha en el puerto: la respuesta nunca llega
+        emisor_udp = EmisorUDP('127.0.0.1', 9)
+        await emisor_udp.conectar()
+        try:
+            with self.assertRaises(asyncio.TimeoutError):
+                await emisor_udp.enviar_y_esperar(BitBuffer(bytes(8)), tiempo_espera=0.05)
+        finally:
+            await emisor_udp.cerrar()
+        self.assertEqual(emisor_udp._pendientes, {})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+"""
+Capa de Transporte - Envío de tramas entre emisor y receptor con asyncio
+Universidad del Valle de Guatemala - CC3067 Redes
+
+Formato de cada trama en el flujo TCP:
+    [longitud en bytes (4)] [secuencia (4)] [longitud en bits (4)] [datos]
+El receptor responde a cada trama con:
+    [secuencia (4)] [estado (1)] [perfil (1)] [bits (4)] [corregidos (4)] [no corregibles (4)]
+estado: 1 = aceptada, 0 = descartada. El resto es el adaptativo.Reporte de
+la trama para el emisor en modo adaptativo (perfil 0xFF = sin reporte).
+En UDP cada datagrama lleva la misma cabecera (la longitud en bytes se ignora)
+"""
+
+import asyncio
+import struct
+import sys
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from bitbuffer import BitBuffer
+from registro import obtener_logger
+
+CABECERA = struct.Struct('!III')
+RESPUESTA = struct.Struct('!IBBIII')
+SIN_REPORTE = 0xFF
+
+log = obtener_logger('transporte')
+
+ESTADO_DESCARTADA = 0
+ESTADO_ACEPTADA = 1
+
+# Tramas en vuelo por cliente antes de dejar de leer del socket
+VENTANA_POR_CLIENTE = 256
+
+def empaquetar_trama(secuencia, trama):
+    """Serializa una trama (BitBuffer o cadena '0'/'1') con su cabecera"""
+    trama = BitBuffer.convertir(trama)
+    datos = trama.vista()
+    return CABECERA.pack(len(datos), secuencia, len(trama)) + datos
+
+def desempaquetar_datos(longitud_bits, datos):
+    """
+    Reconstruye la trama a partir de los datos recibidos
+    Raises:
+        ValueError: Si longitud_bits no cabe en los datos (trama malformada)
+    """
+    return BitBuffer(datos, longitud_bits)
+
+def empaquetar_respuesta(secuencia, estado, reporte=None):
+    """Serializa la respuesta a una trama, con su adaptativo.Reporte si lo hay"""
+    if reporte is None:
+        return RESPUESTA.pack(secuencia, estado, SIN_REPORTE, 0, 0, 0)
+    return RESPUESTA.pack(secuencia, estado, reporte.perfil, reporte.bits, reporte.corregidos,
+                          reporte.no_corregibles)
+
+def desempaquetar_respuesta(datos):
+    """
+    Returns:
+        tuple: (secuencia, estado, reporte); reporte es la tupla (perfil,
+        bits, aceptada, corregidos, no_corregibles) de adaptativo.Reporte,
+        o None
+    """
+    secuencia, estado, perfil, bits, corregidos, no_corregibles = RESPUESTA.unpack(datos)
+    if perfil == SIN_REPORTE:
+        return secuencia, estado, None
+    return secuencia, estado, (perfil, bits, estado == ESTADO_ACEPTADA, corregidos, no_corregibles)
+
+def percentiles(valores, puntos=(50, 90, 99)):
+    """Percentiles por rango más cercano de una lista de valores"""
+    if not valores:
+        return {p: None for p in puntos}
+    ordenados = sorted(valores)
+    n = len(ordenados)
+    return {p: ordenados[min(n - 1, max(0, -(-p * n // 100) - 1))] for p in puntos}
+
+class Estadisticas:
+    """Tramas/s, bytes y latencias observadas en un extremo de la conexión"""
+
+    def __init__(self):
+        self.tramas = 0
+        self.bytes = 0
+        self.descartadas = 0
+        self.latencias = []
+        self.inicio = None
+        self.fin = None
+
+    def registrar(self, num_bytes, latencia=None, descartada=False):
+        ahora = time.perf_counter()
+        if self.inicio is None:
+            self.inicio = ahora
+        self.fin = ahora
+        self.tramas += 1
+        self.bytes += num_bytes
+        if descartada:
+            self.descartadas += 1
+        if latencia is not None:
+            self.latencias.append(latencia)
+
+    def tramas_por_segundo(self):
+        if self.inicio is None or self.fin == self.inicio:
+            return 0.0
+        return self.tramas / (self.fin - self.inicio)
+
+    def resumen(self):
+        """Diccionario con las métricas (latencias en milisegundos)"""
+        p = percentiles(self.latencias)
+        return {
+            "tramas": self.tramas,
+            "bytes": self.bytes,
+            "descartadas": self.descartadas,
+            "tramas_por_segundo": self.tramas_por_segundo(),
+            "latencia_ms": {f"p{k}": (v * 1000 if v is not None else None) for k, v in p.items()},
+        }
+
+class EmisorTCP:
+    """
+    Emisor con conexión persistente y envíos en tubería (pipelining):
+    enviar() no espera la respuesta de la trama anterior
+    """
+
+    def __init__(self, host='127.0.0.1', puerto=5000, al_reporte=None):
+        """
+        Args:
+            host, puerto: Dirección del receptor
+            al_reporte: Función opcional reporte -> None que recibe el
+                reporte del modo adaptativo de cada respuesta, por ejemplo
+                emisor.CapaEnlace.registrar_reporte (una capa de enlace por
+                conexión: el selector de perfil es del enlace)
+        """
+        self.host = host
+        self.puerto = puerto
+        self.al_reporte = al_reporte
+        self.estadisticas = Estadisticas()
+        self._reader = None
+        self._writer = None
+        self._secuencia = 0
+        self._pendientes = {}
+        self._lector = None
+
+    async def conectar(self):
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.puerto)
+        self._lector = asyncio.create_task(self._leer_respuestas())
+
+    async def enviar(self, trama):
+        """
+        Envía una trama sin esperar su respuesta
+        Returns:
+            asyncio.Future: Se resuelve con el estado que reporta el receptor
+        """
+        secuencia = self._secuencia
+        self._secuencia = (self._secuencia + 1) & 0xFFFFFFFF
+        paquete = empaquetar_trama(secuencia, trama)
+        futuro = asyncio.get_running_loop().create_future()
+        self._pendientes[secuencia] = (futuro, time.perf_counter(), len(paquete))
+        self._writer.write(paquete)
+        # drain() solo bloquea si el buffer de envío supera su límite
+        await self._writer.drain()
+        return futuro
+
+    async def enviar_y_esperar(self, trama):
+        """Envía una trama y espera el estado reportado por el receptor"""
+        return await (await self.enviar(trama))
+
+    async def esperar_pendientes(self):
+        """Espera las respuestas de todas las tramas enviadas"""
+        if self._pendientes:
+            await asyncio.gather(*(f for f, _, _ in list(self._pendientes.values())))
+
+    async def _leer_respuestas(self):
+        try:
+            while True:
+                respuesta = await self._reader.readexactly(RESPUESTA.size)
+                secuencia, estado, reporte = desempaquetar_respuesta(respuesta)
+                pendiente = self._pendientes.pop(secuencia, None)
+                if pendiente is None:
+                    continue
+                futuro, enviado, num_bytes = pendiente
+                self.estadisticas.registrar(num_bytes, time.perf_counter() - enviado,
+                                            descartada=estado == ESTADO_DESCARTADA)
+                if reporte is not None and self.al_reporte is not None:
+                    self.al_reporte(reporte)
+                if not futuro.done():
+                    futuro.set_result(estado)
+        except (asyncio.IncompleteReadError, ConnectionError) as e:
+            for futuro, _, _ in self._pendientes.values():
+                if not futuro.done():
+                    futuro.set_exception(ConnectionError(f"Conexión cerrada: {e}"))
+            self._pendientes.clear()
+
+    async def cerrar(self):
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except ConnectionError:
+                pass
+        if self._lector is not None:
+            self._lector.cancel()
+
+class _ProtocoloEmisorUDP(asyncio.DatagramProtocol):
+    def __init__(self, emisor):
+        self.emisor = emisor
+
+    def datagram_received(self, datos, direccion):
+        self.emisor._respuesta(datos)
+
+class EmisorUDP:
+    """Emisor por datagramas: una trama por datagrama, mismo API que EmisorTCP"""
+
+    def __init__(self, host='127.0.0.1', puerto=5000, al_reporte=None):
+        self.host = host
+        self.puerto = puerto
+        self.al_reporte = al_reporte
+        self.estadisticas = Estadisticas()
+        self._transporte = None
+        self._secuencia = 0
+        self._pendientes = {}
+
+    async def conectar(self):
+        loop = asyncio.get_running_loop()
+        self._transporte, _ = await loop.create_datagram_endpoint(
+            lambda: _ProtocoloEmisorUDP(self), remote_addr=(self.host, self.puerto))
+
+    async def enviar(self, trama):
+        secuencia = self._secuencia
+        self._secuencia = (self._secuencia + 1) & 0xFFFFFFFF
+        paquete = empaquetar_trama(secuencia, trama)
+        futuro = asyncio.get_running_loop().create_future()
+        self._pendientes[secuencia] = (futuro, time.perf_counter(), len(paquete))
+        self._transporte.sendto(paquete)
+        return futuro
+
+    async def enviar_y_esperar(self, trama, tiempo_espera=1.0):
+        """Envía una trama y espera su estado (UDP no garantiza la respuesta)"""
+        secuencia = self._secuencia
+        try:
+            return await asyncio.wait_for(await self.enviar(trama), tiempo_espera)
+        finally:
+            # Si venció el tiempo la respuesta ya no se espera
+            self._pendientes.pop(secuencia, None)
+
+    async def esperar_pendientes(self, tiempo_espera=1.0):
+        if self._pendientes:
+            await asyncio.wait([f for f, _, _ in self._pendientes.values()], timeout=tiempo_espera)
+            # Las que no respondieron a tiempo se dan por perdidas
+            for futuro, _, _ in self._pendientes.values():
+                futuro.cancel()
+            self._pendientes.clear()
+
+    def _respuesta(self, datos):
+        if len(datos) != RESPUESTA.size:
+            return
+        secuencia, estado, reporte = desempaquetar_respuesta(datos)
+        pendiente = self._pendientes.pop(secuencia, None)
+        if pendiente is None:
+            return
+        futuro, enviado, num_bytes = pendiente
+        self.estadisticas.registrar(num_bytes, time.perf_counter() - enviado,
+                                    descartada=estado == ESTADO_DESCARTADA)
+        if reporte is not None and self.al_reporte is not None:
+            self.al_reporte(reporte)
+        if not futuro.done():
+            futuro.set_result(estado)
+
+    async def cerrar(self):
+        if self._transporte is not None:
+            self._transporte.close()
+
+class _ProtocoloReceptorUDP(asyncio.DatagramProtocol):
+    def __init__(self, servidor):
+        self.servidor = servidor
+        self.transporte = None
+        self._tareas = set()
+
+    def connection_made(self, transporte):
+        self.transporte = transporte
+
+    def datagram_received(self, datos, direccion):
+        if len(datos) < CABECERA.size:
+            return
+        _, secuencia, longitud_bits = CABECERA.unpack_from(datos)
+        try:
+            trama = desempaquetar_datos(longitud_bits, datos[CABECERA.size:])
+        except ValueError:
+            self.transporte.sendto(self.servidor._descartar(secuencia, len(datos)), direccion)
+            return
+        tarea = asyncio.get_running_loop().create_task(
+            self._responder(secuencia, trama, len(datos), direccion))
+        self._tareas.add(tarea)
+        tarea.add_done_callback(self._tareas.discard)
+
+    async def _responder(self, secuencia, trama, num_bytes, direccion):
+        self.transporte.sendto(await self.servidor._responder(secuencia, trama, num_bytes), direccion)
+
+class ServidorReceptor:
+    """
+    Servidor que recibe tramas de muchos clientes a la vez
+
+    La capa de enlace se ejecuta en un pool de hilos para no bloquear el
+    ciclo de eventos mientras se verifica o corrige cada trama.
+    """
+
+    def __init__(self, procesar, host='127.0.0.1', puerto=5000, udp=False,
+                 al_recibir=None, ejecutor=None):
+        """
+        Args:
+            procesar: Función trama -> (bool, datos), por ejemplo
+                functools.partial(receptor.procesar_trama, enlace), o trama
+                -> (bool, datos, reporte) para responder también con el
+                reporte del modo adaptativo (receptor.procesar_trama_con_reporte);
+                se llama desde varios hilos a la vez
+            host, puerto: Dirección de escucha (puerto 0 = cualquiera libre)
+            udp: Usar datagramas en lugar de TCP
+            al_recibir: Función opcional datos -> None para las tramas aceptadas
+            ejecutor: concurrent.futures.Executor (por defecto un pool de hilos)
+        """
+        self.procesar = procesar
+        self.host = host
+        self.puerto = puerto
+        self.udp = udp
+        self.al_recibir = al_recibir
+        self.estadisticas = Estadisticas()
+        self._ejecutor = ejecutor or ThreadPoolExecutor()
+        self._servidor = None
+        # Tarea de cada conexión abierta -> su StreamWriter
+        self._clientes = {}
+
+    async def iniciar(self):
+        loop = asyncio.get_running_loop()
+        if self.udp:
+            self._servidor, _ = await loop.create_datagram_endpoint(
+                lambda: _ProtocoloReceptorUDP(self), local_addr=(self.host, self.puerto))
+            self.puerto = self._servidor.get_extra_info('sockname')[1]
+        else:
+            self._servidor = await asyncio.start_server(self._atender_cliente, self.host, self.puerto)
+            self.puerto = self._servidor.sockets[0].getsockname()[1]
+        return self
+
+    async def servir_para_siempre(self):
+        if self._servidor is None:
+            await self.iniciar()
+        if self.udp:
+            await asyncio.Event().wait()
+        else:
+            await self._servidor.serve_forever()
+
+    async def cerrar(self):
+        if self._servidor is not None:
+            self._servidor.close()
+            # Al cerrar cada conexión su ciclo de lectura llega al final del
+            # flujo y termina por su cuenta, tras responder lo pendiente
+            for writer in list(self._clientes.values()):
+                writer.close()
+            if self._clientes:
+                await asyncio.gather(*self._clientes, return_exceptions=True)
+            if not self.udp:
+                await self._servidor.wait_closed()
+        self._ejecutor.shutdown(wait=False)
+
+    async def _procesar(self, trama, num_bytes):
+        inicio = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        resultado = await loop.run_in_executor(self._ejecutor, self.procesar, trama)
+        ok, datos = resultado[:2]
+        reporte = resultado[2] if len(resultado) > 2 else None
+        if ok and self.al_recibir is not None:
+            self.al_recibir(datos)
+        # Después de al_recibir: si falla, la trama se cuenta como descartada
+        self.estadisticas.registrar(num_bytes, time.perf_counter() - inicio, descartada=not ok)
+        return (ESTADO_ACEPTADA if ok else ESTADO_DESCARTADA), reporte
+
+    async def _responder(self, secuencia, trama, num_bytes):
+        """Procesa la trama y devuelve la respuesta empaquetada para el cliente"""
+        try:
+            estado, reporte = await self._procesar(trama, num_bytes)
+        except Exception as e:
+            # El cliente espera una respuesta por trama: un error al procesarla la descarta
+            log.warning("[TRANSPORTE] ❌ Trama %d descartada, error al procesarla: %r", secuencia, e)
+            return self._descartar(secuencia, num_bytes)
+        return empaquetar_respuesta(secuencia, estado, reporte)
+
+    def _descartar(self, secuencia, num_bytes):
+        """Respuesta para una trama malformada, que no llega a la capa de enlace"""
+        self.estadisticas.registrar(num_bytes, 0.0, descartada=True)
+        return empaquetar_respuesta(secuencia, ESTADO_DESCARTADA)
+
+    async def _atender_cliente(self, reader, writer):
+        tarea_cliente = asyncio.current_task()
+        self._clientes[tarea_cliente] = writer
+        ventana = asyncio.Semaphore(VENTANA_POR_CLIENTE)
+        tareas = set()
+
+        async def responder(secuencia, trama, num_bytes):
+            try:
+                writer.write(await self._responder(secuencia, trama, num_bytes))
+            finally:
+                ventana.release()
+
+        try:
+            while True:
+                cabecera = await reader.readexactly(CABECERA.size)
+                longitud_bytes, secuencia, longitud_bits = CABECERA.unpack(cabecera)
+                datos = await reader.readexactly(longitud_bytes)
+                try:
+                    trama = desempaquetar_datos(longitud_bits, datos)
+                except ValueError:
+                    # El flujo sigue alineado: ya se leyeron longitud_bytes
+                    writer.write(self._descartar(secuencia, CABECERA.size + longitud_bytes))
+                    continue
+                await ventana.acquire()
+                tarea = asyncio.create_task(responder(secuencia, trama, CABECERA.size + longitud_bytes))
+                tareas.add(tarea)
+                tarea.add_done_callback(tareas.discard)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._clientes.pop(tarea_cliente, None)
+            if tareas:
+                await asyncio.gather(*tareas, return_exceptions=True)
+            writer.close()